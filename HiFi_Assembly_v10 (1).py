@@ -1,4 +1,9 @@
+import copy
+import hashlib
 import json
+import math
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+
 from opentrons import protocol_api, types
 
 metadata = {
@@ -11,13 +16,566 @@ metadata = {
     "source": "Protocol Designer",
 }
 
-requirements = {"robotType": "Flex", "apiLevel": "2.24"}
+# 2.27 added the non-blocking module calls (start_set_block_temperature,
+# start_set_lid_temperature, start_execute_profile, task-returning
+# start_set_temperature) and wait_for_tasks that the helpers below rely on.
+requirements = {"robotType": "Flex", "apiLevel": "2.27"}
+
+
+class LiquidClassRegistry:
+    """Hands out one shared liquid class per distinct property definition.
+
+    Each property tree is canonicalized and hashed; steps asking for a
+    definition that was already built get the existing liquid class back
+    instead of defining and validating a new one. The API converts the
+    properties it is given into parameter objects in place, so it only ever
+    sees a copy; the caller's dict stays plain JSON for the next fingerprint.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext) -> None:
+        self._protocol = protocol
+        self._classes: Dict[str, Any] = {}
+
+    @classmethod
+    def canonicalize(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(k): cls.canonicalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls.canonicalize(v) for v in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @classmethod
+    def fingerprint(cls, base_liquid_class: Any, properties: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            [base_liquid_class.name, cls.canonicalize(properties)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def define(self, name: str, base_liquid_class: Any, properties: Dict[str, Any]) -> Any:
+        key = self.fingerprint(base_liquid_class, properties)
+        if key not in self._classes:
+            self._classes[key] = self._protocol.define_liquid_class(
+                name=name,
+                base_liquid_class=base_liquid_class,
+                properties=copy.deepcopy(properties),
+            )
+        return self._classes[key]
+
+
+class TipParking:
+    """Parks used tips in an empty rack beside the work area.
+
+    Dropping in the rack is a short hop from the plates where the waste chute
+    is a trip across the deck. The rack is never given to a pipette as a tip
+    rack, so parked tips are never picked up again. Single tips fill it
+    column by column from the left; full-column drops take a whole empty
+    column from the right, addressed by nozzle A1. Once the rack is full
+    tips go to the trash as before, and dispose() sends the rack to the chute
+    with the gripper in one move.
+    """
+
+    def __init__(self, rack: Any, trash_location: Any) -> None:
+        self.rack = rack
+        self.trash_location = trash_location
+        self._empty_columns = list(range(1, 13)) if rack is not None else []
+        self._single_column = None
+        self._single_row = len(ROWS)
+        self.parked = 0
+
+    def _parking_well(self, nozzles: int) -> Any:
+        if nozzles == 1:
+            if self._single_row == len(ROWS):
+                if not self._empty_columns:
+                    return None
+                self._single_column = self._empty_columns.pop(0)
+                self._single_row = 0
+            well = f"{ROWS[self._single_row]}{self._single_column}"
+            self._single_row += 1
+            return well
+        if not self._empty_columns:
+            return None
+        column = self._empty_columns.pop()
+        return f"A{column}"
+
+    def drop(self, pipette: Any) -> None:
+        """Drop the pipette's tips in the parking rack, or the trash once it is full."""
+        nozzles = pipette.active_channels
+        well = self._parking_well(nozzles)
+        if well is None:
+            pipette.drop_tip(self.trash_location)
+            return
+        pipette.drop_tip(self.rack[well])
+        self.parked += nozzles
+
+    def dispose(self, protocol: protocol_api.ProtocolContext) -> None:
+        """Move the rack and every tip parked in it into the waste chute."""
+        if self.parked:
+            protocol.move_labware(self.rack, self.trash_location, use_gripper=True)
+            self.parked = 0
+            self._empty_columns = []
+
+
+class ConsumptionTracker:
+    """Counts the tips and reagent a run uses, for restocking the next run.
+
+    Liquids are loaded through load_liquid() and pipettes wrapped with
+    track(), so every liquid class transfer is charged to the wells it
+    draws from, all nozzles included, and liquids_in() tells which loaded
+    liquids have reached a well. Volumes are the nominal ones asked for;
+    conditioning and disposal volumes are not counted. report() ends
+    the run with a comment block, the same figures as a JSON comment, and
+    on the robot a JSON file at CONSUMPTION_REPORT_PATH.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext, tip_racks: Dict[str, Any]) -> None:
+        self._protocol = protocol
+        self._tip_racks = tip_racks
+        self._loaded: Dict[Tuple[int, str], Tuple[str, float]] = {}
+        self._drawn: Dict[Tuple[int, str], float] = {}
+        self._contents: Dict[Tuple[int, str], Set[str]] = {}
+
+    def load_liquid(self, labware: Any, wells: List[str], liquid: Any, volume: float) -> None:
+        labware.load_liquid(wells=wells, liquid=liquid, volume=volume)
+        for well in wells:
+            self._loaded[(id(labware), well)] = (liquid.name, volume)
+            self._contents[(id(labware), well)] = {liquid.name}
+
+    def liquids_in(self, labware: Any, well: str) -> Set[str]:
+        """Names of the loaded liquids that have reached a well so far."""
+        return set(self._contents.get((id(labware), well), ()))
+
+    def track(self, pipette: Any) -> Any:
+        return _TrackedPipette(self, pipette)
+
+    def _covered(self, pipette: Any, well: Any) -> List[Any]:
+        """Wells the pipette's active nozzles enter when its primary nozzle goes to `well`."""
+        nozzles = pipette.active_channels
+        if nozzles == 1:
+            return [well]
+        row, column = ROWS.index(well.well_name[0]), well.well_name[1:]
+        return [well.parent[f"{ROWS[index]}{column}"] for index in range(row, row + nozzles)]
+
+    def draw(self, pipette: Any, volume: float, source: Any, dest: Any) -> None:
+        sources = list(source) if isinstance(source, (list, tuple)) else [source]
+        dests = list(dest) if isinstance(dest, (list, tuple)) else [dest]
+        if len(sources) == 1:
+            draws = [(sources[0], volume * len(dests))]
+        else:
+            draws = [(well, volume) for well in sources]
+        for well, amount in draws:
+            for covered in self._covered(pipette, well):
+                key = (id(covered.parent), covered.well_name)
+                self._drawn[key] = self._drawn.get(key, 0.0) + amount
+        moves = [(sources[0], well) for well in dests] if len(sources) == 1 else list(zip(sources, dests))
+        for source_well, dest_well in moves:
+            for nozzle_source, nozzle_dest in zip(self._covered(pipette, source_well), self._covered(pipette, dest_well)):
+                liquids = self._contents.get((id(nozzle_source.parent), nozzle_source.well_name), set())
+                self._contents.setdefault((id(nozzle_dest.parent), nozzle_dest.well_name), set()).update(liquids)
+
+    def summary(self) -> Dict[str, Any]:
+        tips = {
+            name: sum(1 for well in rack.wells() if not well.has_tip)
+            for name, rack in self._tip_racks.items()
+        }
+        liquids: Dict[str, Dict[str, Any]] = {}
+        for (labware, well), (liquid, loaded) in self._loaded.items():
+            drawn = self._drawn.get((labware, well), 0.0)
+            entry = liquids.setdefault(liquid, {"drawn": 0.0, "wells": {}})
+            entry["drawn"] = round(entry["drawn"] + drawn, 2)
+            entry["wells"][well] = {"loaded": loaded, "drawn": round(drawn, 2), "left": round(loaded - drawn, 2)}
+        return {"tips_used": tips, "liquids": liquids}
+
+    def report(self, path: str) -> None:
+        summary = self.summary()
+        self._protocol.comment("Consumption:")
+        for name, used in summary["tips_used"].items():
+            self._protocol.comment(f"  {name}: {used} tips used")
+        for liquid, entry in summary["liquids"].items():
+            wells = ", ".join(
+                f"{well} {figures['left']:.1f} µL left" for well, figures in entry["wells"].items()
+            )
+            self._protocol.comment(f"  {liquid}: {entry['drawn']:.1f} µL drawn; {wells}")
+        self._protocol.comment(f"CONSUMPTION-JSON {json.dumps(summary)}")
+        if path and not self._protocol.is_simulating():
+            try:
+                with open(path, "w", encoding="utf-8") as handle:
+                    json.dump(summary, handle, indent=2)
+            except OSError as error:
+                self._protocol.comment(f"Could not write {path}: {error}")
+
+
+class _TrackedPipette:
+    """Pipette wrapper that charges liquid class transfers to a ConsumptionTracker."""
+
+    def __init__(self, tracker: ConsumptionTracker, pipette: Any) -> None:
+        self._tracker = tracker
+        self._pipette = pipette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pipette, name)
+
+    def __repr__(self) -> str:
+        return repr(self._pipette)
+
+    def transfer_with_liquid_class(self, liquid_class: Any, volume: float, source: Any, dest: Any, **kwargs: Any) -> None:
+        self._tracker.draw(self._pipette, volume, source, dest)
+        self._pipette.transfer_with_liquid_class(
+            liquid_class=liquid_class, volume=volume, source=source, dest=dest, **kwargs,
+        )
+
+    def distribute_with_liquid_class(self, liquid_class: Any, volume: float, source: Any, dest: Any, **kwargs: Any) -> None:
+        self._tracker.draw(self._pipette, volume, source, dest)
+        self._pipette.distribute_with_liquid_class(
+            liquid_class=liquid_class, volume=volume, source=source, dest=dest, **kwargs,
+        )
+
+
+class LidPreheat:
+    """Ramps the thermocycler lid while pipetting continues.
+
+    start() hands the lid temperature to the module as a background task;
+    wait() is the barrier to place right before the profile that needs the
+    hot lid.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext, thermocycler: Any) -> None:
+        self._protocol = protocol
+        self._thermocycler = thermocycler
+        self._task = None
+
+    def start(self, temperature: float) -> None:
+        self._task = self._thermocycler.start_set_lid_temperature(temperature)
+
+    def wait(self) -> None:
+        if self._task is not None:
+            self._protocol.wait_for_tasks([self._task])
+        self._task = None
+
+
+class ModuleWarmUp:
+    """Starts every module's ramp at once, with one barrier for the steps that need them.
+
+    Temperature modules and thermocycler blocks all ramp as background tasks,
+    so the setup costs the slowest ramp rather than the sum of them.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext) -> None:
+        self._protocol = protocol
+        self._tasks: List[Any] = []
+
+    def temperature_module(self, module: Any, celsius: float) -> None:
+        self._tasks.append(module.start_set_temperature(celsius))
+
+    def thermocycler_block(self, thermocycler: Any, celsius: float) -> None:
+        self._tasks.append(thermocycler.start_set_block_temperature(celsius))
+
+    def wait(self) -> None:
+        """Block until every module started here has reached its set-point."""
+        if self._tasks:
+            self._protocol.wait_for_tasks(self._tasks)
+        self._tasks = []
+
+
+# Fragment assembly map for Steps 12-31: destination well on the thermocycler
+# plate -> (PCR product well on the cold block plate, volume in µL) for every
+# fragment it receives.
+ASSEMBLY_MAP = {
+    "A1": [("A1", 1.5), ("A3", 1.5)],
+    "B1": [("B1", 1.5), ("B3", 1.5)],
+    "C1": [("C1", 1.5)],
+    "D1": [("D1", 1.5)],
+    "E1": [("E1", 1.5), ("F3", 1.5)],
+    "F1": [("F1", 1.5), ("G3", 1.5)],
+    "G1": [("G1", 1.5), ("H3", 1.5)],
+    "H1": [("A2", 1.5), ("E2", 1.5)],
+    "A2": [("G2", 1.5)],
+    "B2": [("H2", 1.5)],
+    "C2": [("A3", 1.5)],
+    "D2": [("B3", 1.5)],
+    "E2": [("C3", 1.5)],
+    "F2": [("D3", 1.5)],
+    "G2": [("E3", 1.5), ("A4", 1.5)],
+    "H2": [("A9", 1.5), ("E9", 1.5)],
+    "A3": [("B9", 1.5), ("F9", 1.5)],
+    "B3": [("C9", 1.5), ("G9", 1.5)],
+    "C3": [("D9", 1.5), ("E9", 1.5)],
+    "D3": [("D2", 1.5), ("F2", 1.5)],
+}
+
+ROWS = "ABCDEFGH"
+
+# Park used tips in an empty rack next to the plates instead of crossing the
+# deck to the waste chute after every transfer. The rack goes into the chute
+# with the gripper before the final thermocycler program.
+PARK_USED_TIPS = True
+USED_TIP_RACK_SLOT = "C2"
+
+# Where the robot saves the ConsumptionTracker report, for staging the next
+# run's deck; nothing is written when simulating.
+CONSUMPTION_REPORT_PATH = "/data/user_storage/hifi_assembly_consumption.json"
+
+# How the finished assemblies are mixed before the 50 C incubation:
+#   "last_fragment" - the final Steps 12-31 transfer into each well mixes after
+#                     dispensing, so Step 32 needs no tips and no time;
+#   "heater_shaker" - Step 32 carries the plate to the heater-shaker with the
+#                     gripper and back once shaking is done (validate the
+#                     speed and time for the fill volume first);
+#   "pipette"       - Step 32 mixes columns 1-3 with three columns of tips.
+ASSEMBLY_MIX = "last_fragment"
+ASSEMBLY_MIX_STRATEGIES = ("last_fragment", "heater_shaker", "pipette")
+ASSEMBLY_MIX_REPETITIONS = 5
+ASSEMBLY_MIX_VOLUME = 8
+ASSEMBLY_MIX_RPM = 1500
+ASSEMBLY_MIX_SECONDS = 60
+
+
+class TransferPass(NamedTuple):
+    """One liquid-class transfer call: wells are named per nozzle-A1 target."""
+
+    channels: int
+    volume: float
+    sources: List[str]
+    dests: List[str]
+
+
+def well_grid_position(well_name: str) -> Tuple[int, int]:
+    """Return the zero-based (row, column) of a 96-well name such as "C7"."""
+    return ROWS.index(well_name[0]), int(well_name[1:]) - 1
+
+
+def _grid_distance(well_a: str, well_b: str) -> float:
+    row_a, column_a = well_grid_position(well_a)
+    row_b, column_b = well_grid_position(well_b)
+    return math.hypot(row_a - row_b, column_a - column_b)
+
+
+def _nearest_neighbour_order(wells: List[str], start: str) -> List[str]:
+    ordered = []
+    remaining = list(wells)
+    current = start
+    while remaining:
+        current = min(remaining, key=lambda well: _grid_distance(current, well))
+        remaining.remove(current)
+        ordered.append(current)
+    return ordered
+
+
+def plan_fragment_transfers(assembly_map: Dict[str, List[Tuple[str, float]]]) -> List[TransferPass]:
+    """Turn an assembly map into an ordered list of transfer passes.
+
+    Full source columns that land row-for-row in a full destination column at
+    the same volume become 8-channel passes. Everything else is grouped by
+    source well, the groups are ordered nearest-neighbour across the source
+    plate, and runs of equal volume are merged into single-channel passes.
+    """
+    pending = [
+        (source, dest, volume)
+        for dest, fragments in assembly_map.items()
+        for source, volume in fragments
+    ]
+
+    column_transfers = []
+    for source, dest, volume in list(pending):
+        if source[0] != "A" or dest[0] != "A":
+            continue
+        column = [(row + source[1:], row + dest[1:], volume) for row in ROWS]
+        if all(transfer in pending for transfer in column):
+            for transfer in column:
+                pending.remove(transfer)
+            column_transfers.append((source, dest, volume))
+
+    passes = []
+    for source, dest, volume in column_transfers:
+        if passes and passes[-1].volume == volume:
+            passes[-1].sources.append(source)
+            passes[-1].dests.append(dest)
+        else:
+            passes.append(TransferPass(8, volume, [source], [dest]))
+
+    groups: Dict[Tuple[str, float], List[str]] = {}
+    for source, dest, volume in pending:
+        groups.setdefault((source, volume), []).append(dest)
+    group_order = _nearest_neighbour_order(list(dict.fromkeys(source for source, _ in groups)), start="A1")
+
+    single_passes: List[TransferPass] = []
+    for source in group_order:
+        for (group_source, volume), dests in groups.items():
+            if group_source != source:
+                continue
+            for dest in _nearest_neighbour_order(dests, start=dests[0]):
+                if single_passes and single_passes[-1].volume == volume:
+                    single_passes[-1].sources.append(source)
+                    single_passes[-1].dests.append(dest)
+                else:
+                    single_passes.append(TransferPass(1, volume, [source], [dest]))
+    return passes + single_passes
+
+
+def final_additions(passes: List[TransferPass]) -> List[List[bool]]:
+    """Flag, per pass and pair, the transfers that complete a destination well.
+
+    An 8-channel pair covers its whole destination column and is flagged when
+    it is the last addition to any of those wells.
+    """
+    last_pair: Dict[str, Tuple[int, int]] = {}
+    for pass_index, transfer_pass in enumerate(passes):
+        for pair_index, dest in enumerate(transfer_pass.dests):
+            rows = ROWS if transfer_pass.channels == 8 else dest[0]
+            for row in rows:
+                last_pair[row + dest[1:]] = (pass_index, pair_index)
+    completing = set(last_pair.values())
+    return [
+        [(pass_index, pair_index) in completing for pair_index in range(len(transfer_pass.dests))]
+        for pass_index, transfer_pass in enumerate(passes)
+    ]
+
+
+def with_dispense_mix(properties: Dict[str, Any], repetitions: int, volume: float) -> Dict[str, Any]:
+    """Return a copy of a liquid class property tree that mixes after each dispense."""
+    mixed = copy.deepcopy(properties)
+    for tip_properties in mixed.values():
+        for phases in tip_properties.values():
+            phases["dispense"]["mix"] = {"enabled": True, "repetitions": repetitions, "volume": volume}
+    return mixed
+
+
+def retarget_properties(properties: Dict[str, Any], pipette_model: str) -> Dict[str, Any]:
+    """Reuse a single-pipette liquid class property tree for another pipette model."""
+    (tip_properties,) = properties.values()
+    return {pipette_model: tip_properties}
+
+
+def _deck_xy(well: Any) -> Tuple[float, float]:
+    point = well.top().point
+    return point.x, point.y
+
+
+def _path_length(points: List[Tuple[float, float]], start: Tuple[float, float], order: List[int]) -> float:
+    path = [start] + [points[index] for index in order]
+    return sum(math.dist(a, b) for a, b in zip(path, path[1:]))
+
+
+def travel_order(wells: List[Any], start: Any) -> List[Any]:
+    """Order wells into a short gantry path that starts over `start`.
+
+    Uses the wells' deck coordinates: nearest neighbour from `start`, then
+    2-opt until no segment reversal shortens the path. Only for wells that
+    all receive the same reagent, such as distribute destinations, where
+    any order gives the same result.
+    """
+    points = [_deck_xy(well) for well in wells]
+    origin = _deck_xy(start)
+    order: List[int] = []
+    remaining = list(range(len(wells)))
+    current = origin
+    while remaining:
+        nearest = min(remaining, key=lambda index: math.dist(current, points[index]))
+        remaining.remove(nearest)
+        order.append(nearest)
+        current = points[nearest]
+
+    best = _path_length(points, origin, order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            for j in range(i + 1, len(order)):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                length = _path_length(points, origin, candidate)
+                if length < best - 1e-6:
+                    order, best = candidate, length
+                    improved = True
+    return [wells[index] for index in order]
+
+
+CONTACT_FREE_MAX_VOLUME = 2
+
+
+def distribute_contact_free(
+    pipette: Any,
+    volume: float,
+    source: Any,
+    dest_plate: Any,
+    dest_wells: List[str],
+    template_wells: Set[str],
+    multi_dispense_class: Any,
+    per_well_class: Any,
+    tip_parking: TipParking,
+) -> int:
+    """Add a small reagent volume to many wells with one aspiration per tip.
+
+    Wells that do not hold template yet are served by a single multi-dispense
+    that releases each droplet above the liquid, so the tip never touches the
+    destination and can stay on for the whole run. Wells that already hold
+    template fall back to a fresh tip per well. Returns the tips saved over
+    one tip per destination.
+    """
+    if not 0 < volume <= CONTACT_FREE_MAX_VOLUME:
+        raise ValueError(
+            f"Contact-free multi-dispense is validated for volumes up to "
+            f"{CONTACT_FREE_MAX_VOLUME} µL, got {volume} µL"
+        )
+    contact_free = [well for well in dest_wells if well not in template_wells]
+    per_well = [well for well in dest_wells if well in template_wells]
+    tips_used = 0
+    if contact_free:
+        pipette.distribute_with_liquid_class(
+            volume=volume,
+            source=[source],
+            dest=travel_order([dest_plate[well] for well in contact_free], start=source),
+            new_tip="once",
+            trash_location=tip_parking.trash_location,
+            keep_last_tip=True,
+            liquid_class=multi_dispense_class,
+        )
+        tip_parking.drop(pipette)
+        tips_used += 1
+    for well in per_well:
+        pipette.transfer_with_liquid_class(
+            volume=volume,
+            source=[source],
+            dest=[dest_plate[well]],
+            new_tip="once",
+            trash_location=tip_parking.trash_location,
+            keep_last_tip=True,
+            liquid_class=per_well_class,
+        )
+        tip_parking.drop(pipette)
+        tips_used += 1
+    return len(dest_wells) - tips_used
+
+
+def mix_on_heater_shaker(
+    protocol: protocol_api.ProtocolContext,
+    plate: Any,
+    heater_shaker: Any,
+    adapter: Any,
+    home: Any,
+    rpm: int,
+    seconds: float,
+) -> None:
+    """Carry a plate onto the heater-shaker with the gripper, shake it, and return it to `home`."""
+    heater_shaker.open_labware_latch()
+    protocol.move_labware(plate, adapter, use_gripper=True)
+    heater_shaker.close_labware_latch()
+    heater_shaker.set_and_wait_for_shake_speed(rpm)
+    protocol.delay(seconds=seconds)
+    heater_shaker.deactivate_shaker()
+    heater_shaker.open_labware_latch()
+    protocol.move_labware(plate, home, use_gripper=True)
+    heater_shaker.close_labware_latch()
+
 
 def run(protocol: protocol_api.ProtocolContext) -> None:
     # Load Modules:
     thermocycler_module_1 = protocol.load_module("thermocyclerModuleV2", "B1")
     heater_shaker_module_1 = protocol.load_module("heaterShakerModuleV1", "D1")
     temperature_module_1 = protocol.load_module("temperatureModuleV2", "C1")
+    lid_preheat = LidPreheat(protocol, thermocycler_module_1)
 
     # Load Adapters:
     aluminum_block_1 = temperature_module_1.load_adapter(
@@ -25,6 +583,15 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         namespace="opentrons",
         version=1,
     )
+    if ASSEMBLY_MIX not in ASSEMBLY_MIX_STRATEGIES:
+        raise ValueError(f"ASSEMBLY_MIX must be one of {ASSEMBLY_MIX_STRATEGIES}, not {ASSEMBLY_MIX!r}")
+    pcr_adapter_1 = None
+    if ASSEMBLY_MIX == "heater_shaker":
+        pcr_adapter_1 = heater_shaker_module_1.load_adapter(
+            "opentrons_96_pcr_adapter",
+            namespace="opentrons",
+            version=1,
+        )
 
     # Load Labware:
     tip_rack_1 = protocol.load_labware(
@@ -51,16 +618,29 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         version=1,
     )
 
+    used_tip_rack = None
+    if PARK_USED_TIPS:
+        used_tip_rack = protocol.load_labware(
+            "opentrons_flex_96_filtertiprack_50ul",
+            location=USED_TIP_RACK_SLOT,
+            label="Empty Tip Rack for Used Tips",
+            namespace="opentrons",
+            version=1,
+        )
+
+    consumption = ConsumptionTracker(protocol, {"tip_rack_1": tip_rack_1, "tip_rack_2": tip_rack_2})
+
     # Load Pipettes:
-    pipette_right = protocol.load_instrument(
+    pipette_right = consumption.track(protocol.load_instrument(
         "flex_1channel_50", "right", tip_racks=[tip_rack_1, tip_rack_2],
-    )
-    pipette_left = protocol.load_instrument(
+    ))
+    pipette_left = consumption.track(protocol.load_instrument(
         "flex_8channel_50", "left", tip_racks=[tip_rack_1, tip_rack_2],
-    )
+    ))
 
     # Load Waste Chute:
     waste_chute = protocol.load_waste_chute()
+    tip_parking = TipParking(used_tip_rack, waste_chute)
 
     # Define Liquids:
     liquid_9 = protocol.define_liquid(
@@ -106,7 +686,8 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
     )
 
     # Load Liquids:
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=[
             "A10", "B10", "C10", "D10", "E10", "F10", "G10", "H10",
             "H11"
@@ -114,7 +695,8 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         liquid=liquid_10,
         volume=200,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=[
             "A1", "B1", "C1", "D1", "E1", "F1", "G1", "A2",
             "B2", "C2", "D2", "E2", "F2", "G2", "H2", "A3",
@@ -124,273 +706,116 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         liquid=liquid_5,
         volume=30,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["G12", "H12"],
         liquid=liquid_9,
         volume=145,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["A11", "B11"],
         liquid=liquid_6,
         volume=100,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["C11", "D11"],
         liquid=liquid_7,
         volume=100,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["A9"],
         liquid=liquid_4,
         volume=10,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["B9"],
         liquid=liquid_3,
         volume=10,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["C9"],
         liquid=liquid_2,
         volume=10,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["D9"],
         liquid=liquid_1,
         volume=10,
     )
-    well_plate_1.load_liquid(
+    consumption.load_liquid(
+        well_plate_1,
         wells=["E9", "F9", "G9"],
         liquid=liquid_8,
         volume=10,
     )
 
     # Load Liquid Classes:
+    liquid_classes = LiquidClassRegistry(protocol)
     water_base_class = protocol.get_liquid_class("water")
     glycerol_50_base_class = protocol.get_liquid_class("glycerol_50")
 
     # PROTOCOL STEPS
 
+    # Steps 1-2 start both cooling ramps at once. Steps 3-4 only move water,
+    # so they run while the modules settle; Step 5 waits for them.
+
     # Step 1:
-    temperature_module_1.start_set_temperature(10)
+    warm_up = ModuleWarmUp(protocol)
+    warm_up.temperature_module(temperature_module_1, 10)
 
     # Step 2:
     thermocycler_module_1.open_lid()
-    thermocycler_module_1.set_block_temperature(10)
+    warm_up.thermocycler_block(thermocycler_module_1, 10)
 
     # Step 3:
     pipette_right.distribute_with_liquid_class(
         volume=5.5,
         source=[well_plate_1["H11"]],
-        dest=[well_plate_2["C1"], well_plate_2["D1"], well_plate_2["A2"], well_plate_2["B2"], well_plate_2["C2"], well_plate_2["D2"], well_plate_2["E2"], well_plate_2["F2"]],
+        dest=travel_order(
+            [well_plate_2[well] for well in ["C1", "D1", "A2", "B2", "C2", "D2", "E2", "F2"]],
+            start=well_plate_1["H11"],
+        ),
         new_tip="once",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_3",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.5)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 48)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 48)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_3_PROPERTIES,
         ),
     )
-    pipette_right.drop_tip(waste_chute)
+    tip_parking.drop(pipette_right)
 
     # Step 4:
     pipette_right.distribute_with_liquid_class(
         volume=4,
         source=[well_plate_1["H11"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["E1"], well_plate_2["F1"], well_plate_2["G1"], well_plate_2["H1"], well_plate_2["G2"], well_plate_2["H2"], well_plate_2["A3"], well_plate_2["B3"], well_plate_2["C3"], well_plate_2["D3"]],
+        dest=travel_order(
+            [
+                well_plate_2[well]
+                for well in ["A1", "B1", "E1", "F1", "G1", "H1", "G2", "H2", "A3", "B3", "C3", "D3"]
+            ],
+            start=well_plate_1["H11"],
+        ),
         new_tip="once",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_4",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 29.5)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 45)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 45)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_4_PROPERTIES,
         ),
     )
-    pipette_right.drop_tip(waste_chute)
+    tip_parking.drop(pipette_right)
 
     # Step 5:
+    warm_up.wait()
     pipette_right.distribute_with_liquid_class(
         volume=25,
         source=[well_plate_1["G12"]],
@@ -398,100 +823,10 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         new_tip="once",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_5",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 0)],
-                    "disposal_by_volume": [(0, 0)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_5_PROPERTIES,
         ),
     )
 
@@ -503,100 +838,10 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         new_tip="never",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_6",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 0)],
-                    "disposal_by_volume": [(0, 0)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_5_PROPERTIES,
         ),
     )
 
@@ -608,100 +853,10 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         new_tip="never",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_7",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 30)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_7_PROPERTIES,
         ),
     )
 
@@ -713,103 +868,13 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         new_tip="never",
         trash_location=waste_chute,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="distribute_step_8",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 30)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_7_PROPERTIES,
         ),
     )
-    pipette_right.drop_tip(waste_chute)
+    tip_parking.drop(pipette_right)
 
     # Step 9:
     pipette_left.transfer_with_liquid_class(
@@ -820,1793 +885,148 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         trash_location=waste_chute,
         group_wells=False,
         keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+        liquid_class=liquid_classes.define(
             name="transfer_step_9",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_8channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 10)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_left.drop_tip(waste_chute)
-
-    # Step 10:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"], well_plate_1["A11"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["C1"], well_plate_2["D1"], well_plate_2["E1"], well_plate_2["F1"], well_plate_2["G1"], well_plate_2["H1"], well_plate_2["A2"], well_plate_2["B2"], well_plate_2["C2"], well_plate_2["D2"], well_plate_2["E2"], well_plate_2["F2"], well_plate_2["G2"], well_plate_2["H2"], well_plate_2["A3"], well_plate_2["B3"], well_plate_2["C3"], well_plate_2["D3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_10",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 0},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
+            properties=TRANSFER_STEP_9_PROPERTIES,
         ),
     )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 11:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"], well_plate_1["C11"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["C1"], well_plate_2["D1"], well_plate_2["E1"], well_plate_2["F1"], well_plate_2["G1"], well_plate_2["H1"], well_plate_2["A2"], well_plate_2["B2"], well_plate_2["C2"], well_plate_2["D2"], well_plate_2["E2"], well_plate_2["F2"], well_plate_2["G2"], well_plate_2["H2"], well_plate_2["A3"], well_plate_2["B3"], well_plate_2["C3"], well_plate_2["D3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_11",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 0},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 12:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["A1"], well_plate_1["A3"]],
-        dest=[well_plate_2["A1"], well_plate_2["A1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_12",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 13:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["B1"], well_plate_1["B3"]],
-        dest=[well_plate_2["B1"], well_plate_2["B1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_13",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 14:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["C1"]],
-        dest=[well_plate_2["C1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_14",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 15:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["D1"]],
-        dest=[well_plate_2["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_15",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 16:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["E1"], well_plate_1["F3"]],
-        dest=[well_plate_2["E1"], well_plate_2["E1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_16",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 17:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["F1"], well_plate_1["G3"]],
-        dest=[well_plate_2["F1"], well_plate_2["F1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_17",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 18:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["G1"], well_plate_1["H3"]],
-        dest=[well_plate_2["G1"], well_plate_2["G1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_18",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 19:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["A2"], well_plate_1["E2"]],
-        dest=[well_plate_2["H1"], well_plate_2["H1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_19",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 20:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["G2"]],
-        dest=[well_plate_2["A2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_20",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 21:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["H2"]],
-        dest=[well_plate_2["B2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_21",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 22:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["A3"]],
-        dest=[well_plate_2["C2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_22",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 23:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["B3"]],
-        dest=[well_plate_2["D2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_23",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 24:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["C3"]],
-        dest=[well_plate_2["E2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_24",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 25:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["D3"]],
-        dest=[well_plate_2["F2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_25",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 26:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["E3"], well_plate_1["A4"]],
-        dest=[well_plate_2["G2"], well_plate_2["G2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_26",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 27:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["A9"], well_plate_1["E9"]],
-        dest=[well_plate_2["H2"], well_plate_2["H2"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_27",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 28:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["B9"], well_plate_1["F9"]],
-        dest=[well_plate_2["A3"], well_plate_2["A3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_28",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
+    tip_parking.drop(pipette_left)
+
+    # Steps 10-11:
+    backbone_class = liquid_classes.define(
+        name="transfer_step_10",
+        base_liquid_class=water_base_class,
+        properties=BACKBONE_MULTI_DISPENSE_PROPERTIES,
     )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 29:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["C9"], well_plate_1["G9"]],
-        dest=[well_plate_2["B3"], well_plate_2["B3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_29",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
+    backbone_per_well_class = liquid_classes.define(
+        name="transfer_step_10_per_well",
+        base_liquid_class=water_base_class,
+        properties=TRANSFER_STEP_10_PROPERTIES,
     )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 30:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["D9"], well_plate_1["E9"]],
-        dest=[well_plate_2["C3"], well_plate_2["C3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_30",
+    # Wells that already hold a fragment or PCR product take the backbone
+    # with a fresh tip each.
+    template_liquids = {liquid.name for liquid in (liquid_1, liquid_2, liquid_3, liquid_4, liquid_5, liquid_8)}
+    template_wells = {
+        well for well in ASSEMBLY_MAP if consumption.liquids_in(well_plate_2, well) & template_liquids
+    }
+    tips_saved = 0
+    for backbone_well in ["A11", "C11"]:
+        tips_saved += distribute_contact_free(
+            pipette_right,
+            volume=1.5,
+            source=well_plate_1[backbone_well],
+            dest_plate=well_plate_2,
+            dest_wells=list(ASSEMBLY_MAP),
+            template_wells=template_wells,
+            multi_dispense_class=backbone_class,
+            per_well_class=backbone_per_well_class,
+            tip_parking=tip_parking,
+        )
+    protocol.comment(f"Backbone multi-dispense saved {tips_saved} tips")
+
+    # Steps 12-31:
+    # The Step 33 lid ramp runs alongside the fragment transfers.
+    lid_preheat.start(110)
+    fragment_passes = plan_fragment_transfers(ASSEMBLY_MAP)
+    completing = final_additions(fragment_passes)
+    for transfer_pass, pass_completing in zip(fragment_passes, completing):
+        if transfer_pass.channels == 8:
+            pipette = pipette_left
+            properties = retarget_properties(TRANSFER_STEP_12_PROPERTIES, "flex_8channel_50")
+            class_name = "transfer_step_12_multi"
+        else:
+            pipette = pipette_right
+            properties = TRANSFER_STEP_12_PROPERTIES
+            class_name = "transfer_step_12"
+        fragment_class = liquid_classes.define(
+            name=class_name,
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 31:
-    pipette_right.transfer_with_liquid_class(
-        volume=1.5,
-        source=[well_plate_1["D2"], well_plate_1["F2"]],
-        dest=[well_plate_2["D3"], well_plate_2["D3"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_31",
+            properties=properties,
+        )
+        mixing_class = liquid_classes.define(
+            name=class_name + "_mix",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 34.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 38)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
+            properties=with_dispense_mix(properties, ASSEMBLY_MIX_REPETITIONS, ASSEMBLY_MIX_VOLUME),
+        )
+        # One call per tip, so every used tip can be parked.
+        for source, dest, completes_well in zip(transfer_pass.sources, transfer_pass.dests, pass_completing):
+            mix_here = completes_well and ASSEMBLY_MIX == "last_fragment"
+            pipette.transfer_with_liquid_class(
+                volume=transfer_pass.volume,
+                source=[well_plate_1[source]],
+                dest=[well_plate_2[dest]],
+                new_tip="once",
+                trash_location=waste_chute,
+                keep_last_tip=True,
+                liquid_class=mixing_class if mix_here else fragment_class,
+            )
+            tip_parking.drop(pipette)
 
     # Step 32:
-    pipette_left.pick_up_tip(location=tip_rack_1)
-    pipette_left.configure_for_volume(8)
-    pipette_left.prepare_to_aspirate()
-    pipette_left.mix(
-        repetitions=5,
-        volume=8,
-        location=well_plate_2["A1"].bottom(z=2),
-        aspirate_flow_rate=9.3,
-        dispense_flow_rate=25,
-        aspirate_delay=1,
-        dispense_delay=0.5,
-        final_push_out=3.9,
-    )
-    pipette_left.drop_tip(waste_chute)
-    pipette_left.pick_up_tip(location=tip_rack_2)
-    pipette_left.configure_for_volume(8)
-    pipette_left.prepare_to_aspirate()
-    pipette_left.mix(
-        repetitions=5,
-        volume=8,
-        location=well_plate_2["A2"].bottom(z=2),
-        aspirate_flow_rate=9.3,
-        dispense_flow_rate=25,
-        aspirate_delay=1,
-        dispense_delay=0.5,
-        final_push_out=3.9,
-    )
-    pipette_left.drop_tip(waste_chute)
-    pipette_left.pick_up_tip(location=tip_rack_2)
-    pipette_left.configure_for_volume(8)
-    pipette_left.prepare_to_aspirate()
-    pipette_left.mix(
-        repetitions=5,
-        volume=8,
-        location=well_plate_2["A3"].bottom(z=2),
-        aspirate_flow_rate=9.3,
-        dispense_flow_rate=25,
-        aspirate_delay=1,
-        dispense_delay=0.5,
-        final_push_out=3.9,
-    )
-    pipette_left.drop_tip(waste_chute)
+    # With ASSEMBLY_MIX = "last_fragment" every well was mixed by its final
+    # Steps 12-31 transfer, so there is nothing left to do here.
+    if ASSEMBLY_MIX == "heater_shaker":
+        mix_on_heater_shaker(
+            protocol,
+            well_plate_2,
+            heater_shaker_module_1,
+            adapter=pcr_adapter_1,
+            home=thermocycler_module_1,
+            rpm=ASSEMBLY_MIX_RPM,
+            seconds=ASSEMBLY_MIX_SECONDS,
+        )
+    elif ASSEMBLY_MIX == "pipette":
+        pipette_left.pick_up_tip(location=tip_rack_1)
+        pipette_left.configure_for_volume(8)
+        pipette_left.prepare_to_aspirate()
+        pipette_left.mix(
+            repetitions=5,
+            volume=8,
+            location=well_plate_2["A1"].bottom(z=2),
+            aspirate_flow_rate=9.3,
+            dispense_flow_rate=25,
+            aspirate_delay=1,
+            dispense_delay=0.5,
+            final_push_out=3.9,
+        )
+        tip_parking.drop(pipette_left)
+        pipette_left.pick_up_tip(location=tip_rack_2)
+        pipette_left.configure_for_volume(8)
+        pipette_left.prepare_to_aspirate()
+        pipette_left.mix(
+            repetitions=5,
+            volume=8,
+            location=well_plate_2["A2"].bottom(z=2),
+            aspirate_flow_rate=9.3,
+            dispense_flow_rate=25,
+            aspirate_delay=1,
+            dispense_delay=0.5,
+            final_push_out=3.9,
+        )
+        tip_parking.drop(pipette_left)
+        pipette_left.pick_up_tip(location=tip_rack_2)
+        pipette_left.configure_for_volume(8)
+        pipette_left.prepare_to_aspirate()
+        pipette_left.mix(
+            repetitions=5,
+            volume=8,
+            location=well_plate_2["A3"].bottom(z=2),
+            aspirate_flow_rate=9.3,
+            dispense_flow_rate=25,
+            aspirate_delay=1,
+            dispense_delay=0.5,
+            final_push_out=3.9,
+        )
+        tip_parking.drop(pipette_left)
 
     # Step 33:
+    tip_parking.dispose(protocol)
+    # All pipetting is done: report what it used while the last program runs,
+    # so the next deck can be staged in the meantime.
+    consumption.report(CONSUMPTION_REPORT_PATH)
     thermocycler_module_1.close_lid()
-    thermocycler_module_1.set_lid_temperature(110)
+    lid_preheat.wait()
     thermocycler_module_1.execute_profile(
         [
             {"temperature": 50, "hold_time_seconds": 3600},
@@ -2617,4 +1037,657 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
     thermocycler_module_1.set_block_temperature(10)
     thermocycler_module_1.set_lid_temperature(37)
 
-DESIGNER_APPLICATION = """{"robot":{"model":"OT-3 Standard"},"designerApplication":{"name":"opentrons/protocol-designer","version":"8.5.0","data":{"pipetteTiprackAssignments":{"63555313-4253-4347-be9c-8b6e64189bb7":["opentrons/opentrons_flex_96_filtertiprack_50ul/1"],"8e36439e-b289-4759-8202-396adc7c9436":["opentrons/opentrons_flex_96_filtertiprack_50ul/1"]},"dismissedWarnings":{"form":[],"timeline":[]},"ingredients":{"3":{"displayName":"HiFi assembly MM","description":"Use at 2X","displayColor":"#ff9900","liquidGroupId":"3","liquidClass":"glycerol50V1"},"6":{"displayName":"NF H2O","description":null,"displayColor":"#7eff42","liquidGroupId":"6","liquidClass":"waterV1"},"14":{"displayName":"CD5-CYCB-1","description":null,"displayColor":"#7eff42","liquidGroupId":"14","liquidClass":"waterV1"},"15":{"displayName":"CD5-MTA-1","description":null,"displayColor":"#ff4f4f","liquidGroupId":"15","liquidClass":"waterV1"},"16":{"displayName":"CD5-LpPU-1","description":null,"displayColor":"#b925ff","liquidGroupId":"16","liquidClass":"waterV1"},"17":{"displayName":"CD5-LpGS-1","description":null,"displayColor":"#ffd600","liquidGroupId":"17","liquidClass":"waterV1"},"19":{"displayName":"PCR product","displayColor":"#2a6d0dff","description":null,"liquidGroupId":"19"},"20":{"displayName":"minos-ITR-backbone-1","displayColor":"#50d5ff","liquidClass":"waterV1","description":null,"liquidGroupId":"20"},"21":{"displayName":"minos-ITR-backbone-2","displayColor":"#ff80f5","liquidClass":"waterV1","description":null,"liquidGroupId":"21"},"22":{"displayName":"CD5-mNG-H2A-2","displayColor":"#ff4f4fff","liquidClass":"waterV1","description":null,"liquidGroupId":"22"}},"ingredLocations":{"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{"A10":{"6":{"volume":200}},"B10":{"6":{"volume":200}},"C10":{"6":{"volume":200}},"D10":{"6":{"volume":200}},"E10":{"6":{"volume":200}},"F10":{"6":{"volume":200}},"G10":{"6":{"volume":200}},"H10":{"6":{"volume":200}},"A1":{"19":{"volume":30}},"B1":{"19":{"volume":30}},"C1":{"19":{"volume":30}},"D1":{"19":{"volume":30}},"E1":{"19":{"volume":30}},"F1":{"19":{"volume":30}},"G1":{"19":{"volume":30}},"A2":{"19":{"volume":30}},"B2":{"19":{"volume":30}},"C2":{"19":{"volume":30}},"D2":{"19":{"volume":30}},"E2":{"19":{"volume":30}},"F2":{"19":{"volume":30}},"G2":{"19":{"volume":30}},"H2":{"19":{"volume":30}},"A3":{"19":{"volume":30}},"B3":{"19":{"volume":30}},"C3":{"19":{"volume":30}},"D3":{"19":{"volume":30}},"E3":{"19":{"volume":30}},"F3":{"19":{"volume":30}},"G3":{"19":{"volume":30}},"H3":{"19":{"volume":30}},"A4":{"19":{"volume":30}},"B4":{"19":{"volume":30}},"C4":{"19":{"volume":30}},"D4":{"19":{"volume":30}},"E4":{"19":{"volume":30}},"G12":{"3":{"volume":145}},"H12":{"3":{"volume":145}},"A11":{"20":{"volume":100}},"B11":{"20":{"volume":100}},"C11":{"21":{"volume":100}},"D11":{"21":{"volume":100}},"A9":{"17":{"volume":10}},"B9":{"16":{"volume":10}},"C9":{"15":{"volume":10}},"D9":{"14":{"volume":10}},"E9":{"22":{"volume":10}},"F9":{"22":{"volume":10}},"G9":{"22":{"volume":10}},"H11":{"6":{"volume":200}}},"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{},"4abab807-c9d3-4722-a634-852815723c2e:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{}},"savedStepForms":{"__INITIAL_DECK_SETUP_STEP__":{"labwareLocationUpdate":{"c4037252-d31d-48da-bc54-bf3427ca692d:opentrons/opentrons_flex_96_filtertiprack_50ul/1":"B2","0b42db65-b772-4f84-a00b-4584c94bde99:opentrons/opentrons_96_well_aluminum_block/1":"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType","2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":"0b42db65-b772-4f84-a00b-4584c94bde99:opentrons/opentrons_96_well_aluminum_block/1","81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","4abab807-c9d3-4722-a634-852815723c2e:opentrons/opentrons_flex_96_filtertiprack_50ul/1":"A2"},"moduleLocationUpdate":{"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType":"B1","ab876e4b-79ff-4c3e-8f5f-220e5289df0f:heaterShakerModuleType":"D1","d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType":"C1"},"pipetteLocationUpdate":{"63555313-4253-4347-be9c-8b6e64189bb7":"right","8e36439e-b289-4759-8202-396adc7c9436":"left"},"trashBinLocationUpdate":{},"wasteChuteLocationUpdate":{"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute":"cutoutD3"},"stagingAreaLocationUpdate":{"b5e29851-8f38-4701-a8c8-37bd3e2de6a0:stagingArea":"cutoutD3"},"gripperLocationUpdate":{"05d06909-404b-47dd-b2bd-40a6fe66a6be:gripper":"mounted"},"stepType":"manualIntervention","id":"__INITIAL_DECK_SETUP_STEP__"},"696dc525-e134-4c01-83a6-1f66c9b37c14":{"moduleId":"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType","setTemperature":"true","targetTemperature":"10","id":"696dc525-e134-4c01-83a6-1f66c9b37c14","stepType":"temperature","stepName":"temperature","stepDetails":""},"820c5ebf-9e8d-46f8-8c70-addba98830e0":{"blockIsActive":true,"blockIsActiveHold":false,"blockTargetTemp":"10","blockTargetTempHold":null,"lidIsActive":false,"lidIsActiveHold":false,"lidOpen":true,"lidOpenHold":null,"lidTargetTemp":"","lidTargetTempHold":null,"moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":[],"profileItemsById":{},"profileTargetLidTemp":null,"profileVolume":null,"thermocyclerFormType":"thermocyclerState","id":"820c5ebf-9e8d-46f8-8c70-addba98830e0","stepType":"thermocycler","stepName":"thermocycler","stepDetails":""},"f3f7eba5-58fb-4499-9ae8-30741f20bf5c":{"blockIsActive":false,"blockIsActiveHold":true,"blockTargetTemp":null,"blockTargetTempHold":"10","lidIsActive":false,"lidIsActiveHold":true,"lidOpen":false,"lidOpenHold":false,"lidTargetTemp":null,"lidTargetTempHold":"37","moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":["52916013-fa7c-495f-99d1-e16944cc7003"],"profileItemsById":{"52916013-fa7c-495f-99d1-e16944cc7003":{"durationMinutes":"60","durationSeconds":"00","id":"52916013-fa7c-495f-99d1-e16944cc7003","temperature":"50","title":"HiFi assembly","type":"profileStep"}},"profileTargetLidTemp":"110","profileVolume":"20","thermocyclerFormType":"thermocyclerProfile","id":"f3f7eba5-58fb-4499-9ae8-30741f20bf5c","stepType":"thermocycler","stepName":"HiFi assembly reaction","stepDetails":""},"d52fe3eb-9170-4732-96e2-61b98966cbae":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.5","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"48","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1","A2","B2","C2","D2","E2","F2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"5.5","stepType":"moveLiquid","stepName":"HiFi H2O TRANSFER - 3FRAGMENT","stepDetails":"ADD NF H2O TO SINGLE INSERT REACTIONS","id":"d52fe3eb-9170-4732-96e2-61b98966cbae","dispense_touchTip_mmfromTop":null},"d4d90d70-510a-4573-a61a-b5540ca0f058":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"50","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["G12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":true,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["D12","E12","F12"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"25","stepType":"moveLiquid","stepName":"HiFi distribute (1/2)","stepDetails":"","id":"d4d90d70-510a-4573-a61a-b5540ca0f058","dispense_touchTip_mmfromTop":null},"356de242-f4a0-443b-bb53-e875f63670b1":{"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"9.3","blowout_checkbox":false,"blowout_flowRate":"25","blowout_location":"dest_well","blowout_z_offset":0,"changeTip":"always","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","liquidClassesSupported":true,"liquidClass":"glycerol50V1","mix_mmFromBottom":2,"mix_touchTip_checkbox":false,"mix_touchTip_mmFromTop":null,"mix_wellOrder_first":"t2b","mix_wellOrder_second":"l2r","mix_position_reference":"well-bottom","mix_x_position":0,"mix_y_position":0,"nozzles":null,"pipette":"8e36439e-b289-4759-8202-396adc7c9436","pushOut_checkbox":true,"pushOut_volume":"3.9","times":"5","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"8","wells":["A1","A2","A3"],"stepType":"mix","stepName":"Mix HiFi","stepDetails":"","id":"356de242-f4a0-443b-bb53-e875f63670b1"},"e569a742-1e0e-4dcc-9aa6-ed9aede5ec88":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"50","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":true,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"never","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A12","B12","C12"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"25","stepType":"moveLiquid","stepName":"HiFi distribute (2/2)","stepDetails":"","id":"e569a742-1e0e-4dcc-9aa6-ed9aede5ec88","dispense_touchTip_mmfromTop":null},"97969f8e-2550-4f06-8a2c-2ecd47feeddc":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A1","A3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 1","stepDetails":"","id":"97969f8e-2550-4f06-8a2c-2ecd47feeddc","dispense_touchTip_mmfromTop":null},"d135ce3a-58aa-4cc3-86f2-22693a7ad2d9":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D1"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 4","stepDetails":"","id":"d135ce3a-58aa-4cc3-86f2-22693a7ad2d9","dispense_touchTip_mmfromTop":null},"63e9bbbc-17b2-4940-b391-8177f854289c":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["E1","F3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["E1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 5","stepDetails":"","id":"63e9bbbc-17b2-4940-b391-8177f854289c","dispense_touchTip_mmfromTop":null},"647bcfcd-c514-48dc-ac70-919713adde75":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["F1","G3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["F1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 6","stepDetails":"","id":"647bcfcd-c514-48dc-ac70-919713adde75","dispense_touchTip_mmfromTop":null},"b00e9fd5-4e3f-46ee-92b5-bda9effe4971":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["G1","H3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["G1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 7","stepDetails":"","id":"b00e9fd5-4e3f-46ee-92b5-bda9effe4971","dispense_touchTip_mmfromTop":null},"5435e9ff-22e1-4a45-8bf8-fffcb004b3d8":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["G2"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 9","stepDetails":"","id":"5435e9ff-22e1-4a45-8bf8-fffcb004b3d8","dispense_touchTip_mmfromTop":null},"8969b3c0-209d-4bba-85e0-458d1cd18ed3":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H2"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["B2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 10","stepDetails":"","id":"8969b3c0-209d-4bba-85e0-458d1cd18ed3","dispense_touchTip_mmfromTop":null},"67d9b7ef-c737-42e1-a726-0ad59c51b625":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 11","stepDetails":"","id":"67d9b7ef-c737-42e1-a726-0ad59c51b625","dispense_touchTip_mmfromTop":null},"a2b03d21-7127-4957-813e-b8b3c30c28b7":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["B3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["D2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 12","stepDetails":"","id":"a2b03d21-7127-4957-813e-b8b3c30c28b7","dispense_touchTip_mmfromTop":null},"bd004927-1e9e-45f9-8cc5-0c9910655d81":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["E2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 13","stepDetails":"","id":"bd004927-1e9e-45f9-8cc5-0c9910655d81","dispense_touchTip_mmfromTop":null},"cac0bfe6-501d-4d0c-9c58-43e81bac17c2":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["F2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 14","stepDetails":"","id":"cac0bfe6-501d-4d0c-9c58-43e81bac17c2","dispense_touchTip_mmfromTop":null},"c597e545-94d5-4348-bd19-15f70074ec65":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["E3","A4"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["G2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 15","stepDetails":"","id":"c597e545-94d5-4348-bd19-15f70074ec65","dispense_touchTip_mmfromTop":null},"b23be48c-5aa4-4467-9816-75123ade9f73":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A9","E9"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["H2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 16 - CD5-GS","stepDetails":"","id":"b23be48c-5aa4-4467-9816-75123ade9f73","dispense_touchTip_mmfromTop":null},"f478bb31-6b0b-424e-89d4-4c45ad702e70":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["B9","F9"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 17 - CD5-LpPU","stepDetails":"","id":"f478bb31-6b0b-424e-89d4-4c45ad702e70","dispense_touchTip_mmfromTop":null},"04e09027-0212-427a-b4ae-0968702043b5":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C9","G9"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["B3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 18 - CD5-MTA","stepDetails":"","id":"04e09027-0212-427a-b4ae-0968702043b5","dispense_touchTip_mmfromTop":null},"5c6b8ff6-3232-4693-9c21-4d80d1a90176":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D9","E9"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 19 - CD5-CYCB","stepDetails":"","id":"5c6b8ff6-3232-4693-9c21-4d80d1a90176","dispense_touchTip_mmfromTop":null},"8d04c2c4-d14a-463f-a39b-c6d44b19136c":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":null,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":null,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1","C1","D1","E1","F1","G1","H1","A2","B2","C2","D2","E2","F2","G2","H2","A3","B3","C3","D3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"Minos-ITR-BB-1","stepDetails":"","id":"8d04c2c4-d14a-463f-a39b-c6d44b19136c","dispense_touchTip_mmfromTop":null},"cfeee348-bf84-4d1e-86f2-d6204e37df83":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"29.5","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"45","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1","E1","F1","G1","H1","G2","H2","A3","B3","C3","D3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"4","stepType":"moveLiquid","stepName":"HiFi H2O TRANSFER -  4FRAGMENT","stepDetails":"ADD NF H2O TO TWO INSERT REACTIONS","id":"cfeee348-bf84-4d1e-86f2-d6204e37df83","dispense_touchTip_mmfromTop":null},"2fc0038c-741d-44c4-a17b-4a395cc290c2":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":null,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":null,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1","C1","D1","E1","F1","G1","H1","A2","B2","C2","D2","E2","F2","G2","H2","A3","B3","C3","D3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"Minos-ITR-BB-2","stepDetails":"","id":"2fc0038c-741d-44c4-a17b-4a395cc290c2","dispense_touchTip_mmfromTop":null},"10ee123a-f0ce-4827-ab5b-3e1763cd6291":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"10","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"25","blowout_location":"dest_well","changeTip":"once","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","A2"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":"ALL","path":"single","pipette":"8e36439e-b289-4759-8202-396adc7c9436","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"10","stepType":"moveLiquid","stepName":"HiFi distribute (5/5)","stepDetails":"","id":"10ee123a-f0ce-4827-ab5b-3e1763cd6291","dispense_touchTip_mmfromTop":null},"e1adc901-4b6a-4e48-a658-17fe3811b25e":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"30","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"never","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A3","B3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"10","stepType":"moveLiquid","stepName":"HiFi distribute (3/3)","stepDetails":"","id":"e1adc901-4b6a-4e48-a658-17fe3811b25e","dispense_touchTip_mmfromTop":null},"4957b749-559a-4339-a5a0-6afed18ae02b":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"30","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["G12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"never","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C3","D3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"10","stepType":"moveLiquid","stepName":"HiFi distribute (4/4)","stepDetails":"","id":"4957b749-559a-4339-a5a0-6afed18ae02b","dispense_touchTip_mmfromTop":null},"f25b2383-bfb8-4558-aa80-dd7c81c3047a":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A2","E2"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["H1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 8","stepDetails":"","id":"f25b2383-bfb8-4558-aa80-dd7c81c3047a","dispense_touchTip_mmfromTop":null},"fb7e80a2-d40c-4b16-823a-b7c50af2d39f":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D2","F2"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["D3"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 20","stepDetails":"","id":"fb7e80a2-d40c-4b16-823a-b7c50af2d39f","dispense_touchTip_mmfromTop":null},"b64603ab-4d2f-49ba-8dbb-d4facd057146":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C1"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 3","stepDetails":"","id":"b64603ab-4d2f-49ba-8dbb-d4facd057146","dispense_touchTip_mmfromTop":null},"1ebb988a-80a8-4138-b600-c0f4fdcccf8a":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"34.3","aspirate_labware":"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["B1","B3"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"38","dispense_labware":"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1.5","stepType":"moveLiquid","stepName":"HiFi RXN 2","stepDetails":"","id":"1ebb988a-80a8-4138-b600-c0f4fdcccf8a","dispense_touchTip_mmfromTop":null}},"orderedStepIds":["696dc525-e134-4c01-83a6-1f66c9b37c14","820c5ebf-9e8d-46f8-8c70-addba98830e0","d52fe3eb-9170-4732-96e2-61b98966cbae","cfeee348-bf84-4d1e-86f2-d6204e37df83","d4d90d70-510a-4573-a61a-b5540ca0f058","e569a742-1e0e-4dcc-9aa6-ed9aede5ec88","e1adc901-4b6a-4e48-a658-17fe3811b25e","4957b749-559a-4339-a5a0-6afed18ae02b","10ee123a-f0ce-4827-ab5b-3e1763cd6291","8d04c2c4-d14a-463f-a39b-c6d44b19136c","2fc0038c-741d-44c4-a17b-4a395cc290c2","97969f8e-2550-4f06-8a2c-2ecd47feeddc","1ebb988a-80a8-4138-b600-c0f4fdcccf8a","b64603ab-4d2f-49ba-8dbb-d4facd057146","d135ce3a-58aa-4cc3-86f2-22693a7ad2d9","63e9bbbc-17b2-4940-b391-8177f854289c","647bcfcd-c514-48dc-ac70-919713adde75","b00e9fd5-4e3f-46ee-92b5-bda9effe4971","f25b2383-bfb8-4558-aa80-dd7c81c3047a","5435e9ff-22e1-4a45-8bf8-fffcb004b3d8","8969b3c0-209d-4bba-85e0-458d1cd18ed3","67d9b7ef-c737-42e1-a726-0ad59c51b625","a2b03d21-7127-4957-813e-b8b3c30c28b7","bd004927-1e9e-45f9-8cc5-0c9910655d81","cac0bfe6-501d-4d0c-9c58-43e81bac17c2","c597e545-94d5-4348-bd19-15f70074ec65","b23be48c-5aa4-4467-9816-75123ade9f73","f478bb31-6b0b-424e-89d4-4c45ad702e70","04e09027-0212-427a-b4ae-0968702043b5","5c6b8ff6-3232-4693-9c21-4d80d1a90176","fb7e80a2-d40c-4b16-823a-b7c50af2d39f","356de242-f4a0-443b-bb53-e875f63670b1","f3f7eba5-58fb-4499-9ae8-30741f20bf5c"],"pipettes":{"63555313-4253-4347-be9c-8b6e64189bb7":{"pipetteName":"p50_single_flex"},"8e36439e-b289-4759-8202-396adc7c9436":{"pipetteName":"p50_multi_flex"}},"modules":{"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType":{"model":"thermocyclerModuleV2"},"ab876e4b-79ff-4c3e-8f5f-220e5289df0f:heaterShakerModuleType":{"model":"heaterShakerModuleV1"},"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType":{"model":"temperatureModuleV2"}},"labware":{"c4037252-d31d-48da-bc54-bf3427ca692d:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{"displayName":"Opentrons Flex 96 Filter Tip Rack 50 µL","labwareDefURI":"opentrons/opentrons_flex_96_filtertiprack_50ul/1"},"0b42db65-b772-4f84-a00b-4584c94bde99:opentrons/opentrons_96_well_aluminum_block/1":{"displayName":"Opentrons 96 Well Aluminum Block","labwareDefURI":"opentrons/opentrons_96_well_aluminum_block/1"},"2f958da7-e81d-46ed-91ea-95f566175924:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{"displayName":"Opentrons Tough 96 Well Plate 200 µL PCR Full Skirt","labwareDefURI":"opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2"},"81ab696e-017e-4357-b436-2a034fe185ef:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{"displayName":"Opentrons Tough 96 Well Plate 200 µL PCR Full Skirt","labwareDefURI":"opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2"},"4abab807-c9d3-4722-a634-852815723c2e:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{"displayName":"Opentrons Flex 96 Filter Tip Rack 50 µL (1)","labwareDefURI":"opentrons/opentrons_flex_96_filtertiprack_50ul/1"}}}},"metadata":{"protocolName":"HiFi Assembly v10","author":"Evan Tjeerdema - SIO","description":"Ligation for HiFi assembly. Uses PCR fragments generated by separate protocol. 10C hold at the end. All reagents kept at 10C. ","created":1753768164600,"lastModified":1756575890403,"category":null,"subcategory":null,"tags":[],"source":"Protocol Designer"}}"""
+
+# Liquid Class Properties:
+
+DISTRIBUTE_STEP_3_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 34.5)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 48)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 48)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "conditioning_by_volume": [(0, 5)],
+        "disposal_by_volume": [(0, 5)],
+    },
+}}}
+
+DISTRIBUTE_STEP_4_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 29.5)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 45)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 45)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "conditioning_by_volume": [(0, 5)],
+        "disposal_by_volume": [(0, 5)],
+    },
+}}}
+
+DISTRIBUTE_STEP_5_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "delay": {"enabled": True, "duration": 1},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "push_out_by_volume": [(0, 3.9)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "conditioning_by_volume": [(0, 0)],
+        "disposal_by_volume": [(0, 0)],
+    },
+}}}
+
+DISTRIBUTE_STEP_7_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 30)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "delay": {"enabled": True, "duration": 1},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "push_out_by_volume": [(0, 3.9)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "conditioning_by_volume": [(0, 5)],
+        "disposal_by_volume": [(0, 5)],
+    },
+}}}
+
+TRANSFER_STEP_9_PROPERTIES = {"flex_8channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 10)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "delay": {"enabled": True, "duration": 1},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "push_out_by_volume": [(0, 3.9)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+TRANSFER_STEP_10_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 0},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 34.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 38)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+# Same aspirate/dispense as TRANSFER_STEP_10_PROPERTIES; multi-dispense releases
+# each droplet 6 mm above the well bottom, clear of the ~17 µL already in the well.
+BACKBONE_MULTI_DISPENSE_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 0},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 34.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 38)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 6},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 38)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "conditioning_by_volume": [(0, 2)],
+        "disposal_by_volume": [(0, 2)],
+    },
+}}}
+
+TRANSFER_STEP_12_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 34.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 38)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+# Protocol Designer data, moved to a gzip file next to this one. Restore it
+# with `python tools/designer_blob.py unpack` before reopening in the designer.
+DESIGNER_APPLICATION_SIDECAR = "HiFi_Assembly_v10 (1).designer.json.gz"
@@ -1,4 +1,9 @@
+import copy
+import hashlib
 import json
+import math
+from typing import Any, Dict, List, NamedTuple, Tuple
+
 from opentrons import protocol_api, types
 
 metadata = {
@@ -11,13 +16,620 @@ metadata = {
     "source": "Protocol Designer",
 }
 
-requirements = {"robotType": "Flex", "apiLevel": "2.24"}
+# 2.27 added the non-blocking module calls (start_set_block_temperature,
+# start_set_lid_temperature, start_execute_profile, task-returning
+# start_set_temperature) and wait_for_tasks that the helpers below rely on.
+requirements = {"robotType": "Flex", "apiLevel": "2.27"}
+
+
+class LiquidClassRegistry:
+    """Hands out one shared liquid class per distinct property definition.
+
+    Each property tree is canonicalized and hashed; steps asking for a
+    definition that was already built get the existing liquid class back
+    instead of defining and validating a new one. The API converts the
+    properties it is given into parameter objects in place, so it only ever
+    sees a copy; the caller's dict stays plain JSON for the next fingerprint.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext) -> None:
+        self._protocol = protocol
+        self._classes: Dict[str, Any] = {}
+
+    @classmethod
+    def canonicalize(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(k): cls.canonicalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls.canonicalize(v) for v in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @classmethod
+    def fingerprint(cls, base_liquid_class: Any, properties: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            [base_liquid_class.name, cls.canonicalize(properties)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def define(self, name: str, base_liquid_class: Any, properties: Dict[str, Any]) -> Any:
+        key = self.fingerprint(base_liquid_class, properties)
+        if key not in self._classes:
+            self._classes[key] = self._protocol.define_liquid_class(
+                name=name,
+                base_liquid_class=base_liquid_class,
+                properties=copy.deepcopy(properties),
+            )
+        return self._classes[key]
+
+
+class TipParking:
+    """Parks used tips in an empty rack beside the work area.
+
+    Dropping in the rack is a short hop from the plates where the waste chute
+    is a trip across the deck. The rack is never given to a pipette as a tip
+    rack, so parked tips are never picked up again. Tips fill it well by well,
+    column by column. Once the rack is full tips go to the trash as before,
+    and dispose() sends the rack to the chute with the gripper in one move.
+    """
+
+    def __init__(self, rack: Any, trash_location: Any) -> None:
+        self.rack = rack
+        self.trash_location = trash_location
+        self._capacity = len(ROWS) * 12 if rack is not None else 0
+        self.parked = 0
+
+    def drop(self, pipette: Any) -> None:
+        """Drop the pipette's tip in the parking rack, or the trash once it is full."""
+        if self.parked == self._capacity:
+            pipette.drop_tip(self.trash_location)
+            return
+        column, row = divmod(self.parked, len(ROWS))
+        pipette.drop_tip(self.rack[f"{ROWS[row]}{column + 1}"])
+        self.parked += 1
+
+    def dispose(self, protocol: protocol_api.ProtocolContext) -> None:
+        """Move the rack and every tip parked in it into the waste chute."""
+        if self.parked:
+            protocol.move_labware(self.rack, self.trash_location, use_gripper=True)
+            self.parked = 0
+            self._capacity = 0
+
+
+class ConsumptionTracker:
+    """Counts the tips and reagent a run uses, for restocking the next run.
+
+    Liquids are loaded through load_liquid() and pipettes wrapped with
+    track(), so every liquid class transfer is charged to the wells it
+    draws from. Volumes are the nominal ones asked for; conditioning and
+    disposal volumes are not counted. report() ends the run with a comment
+    block, the same figures as a JSON comment, and on the robot a JSON file
+    at CONSUMPTION_REPORT_PATH.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext, tip_racks: Dict[str, Any]) -> None:
+        self._protocol = protocol
+        self._tip_racks = tip_racks
+        self._loaded: Dict[Tuple[int, str], Tuple[str, float]] = {}
+        self._drawn: Dict[Tuple[int, str], float] = {}
+
+    def load_liquid(self, labware: Any, wells: List[str], liquid: Any, volume: float) -> None:
+        labware.load_liquid(wells=wells, liquid=liquid, volume=volume)
+        for well in wells:
+            self._loaded[(id(labware), well)] = (liquid.name, volume)
+
+    def track(self, pipette: Any) -> Any:
+        return _TrackedPipette(self, pipette)
+
+    def draw(self, volume: float, source: Any, dest: Any) -> None:
+        sources = list(source) if isinstance(source, (list, tuple)) else [source]
+        dests = list(dest) if isinstance(dest, (list, tuple)) else [dest]
+        if len(sources) == 1:
+            draws = [(sources[0], volume * len(dests))]
+        else:
+            draws = [(well, volume) for well in sources]
+        for well, amount in draws:
+            key = (id(well.parent), well.well_name)
+            self._drawn[key] = self._drawn.get(key, 0.0) + amount
+
+    def summary(self) -> Dict[str, Any]:
+        tips = {
+            name: sum(1 for well in rack.wells() if not well.has_tip)
+            for name, rack in self._tip_racks.items()
+        }
+        liquids: Dict[str, Dict[str, Any]] = {}
+        for (labware, well), (liquid, loaded) in self._loaded.items():
+            drawn = self._drawn.get((labware, well), 0.0)
+            entry = liquids.setdefault(liquid, {"drawn": 0.0, "wells": {}})
+            entry["drawn"] = round(entry["drawn"] + drawn, 2)
+            entry["wells"][well] = {"loaded": loaded, "drawn": round(drawn, 2), "left": round(loaded - drawn, 2)}
+        return {"tips_used": tips, "liquids": liquids}
+
+    def report(self, path: str) -> None:
+        summary = self.summary()
+        self._protocol.comment("Consumption:")
+        for name, used in summary["tips_used"].items():
+            self._protocol.comment(f"  {name}: {used} tips used")
+        for liquid, entry in summary["liquids"].items():
+            wells = ", ".join(
+                f"{well} {figures['left']:.1f} µL left" for well, figures in entry["wells"].items()
+            )
+            self._protocol.comment(f"  {liquid}: {entry['drawn']:.1f} µL drawn; {wells}")
+        self._protocol.comment(f"CONSUMPTION-JSON {json.dumps(summary)}")
+        if path and not self._protocol.is_simulating():
+            try:
+                with open(path, "w", encoding="utf-8") as handle:
+                    json.dump(summary, handle, indent=2)
+            except OSError as error:
+                self._protocol.comment(f"Could not write {path}: {error}")
+
+
+class _TrackedPipette:
+    """Pipette wrapper that charges liquid class transfers to a ConsumptionTracker."""
+
+    def __init__(self, tracker: ConsumptionTracker, pipette: Any) -> None:
+        self._tracker = tracker
+        self._pipette = pipette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pipette, name)
+
+    def __repr__(self) -> str:
+        return repr(self._pipette)
+
+    def transfer_with_liquid_class(self, liquid_class: Any, volume: float, source: Any, dest: Any, **kwargs: Any) -> None:
+        self._tracker.draw(volume, source, dest)
+        self._pipette.transfer_with_liquid_class(
+            liquid_class=liquid_class, volume=volume, source=source, dest=dest, **kwargs,
+        )
+
+    def distribute_with_liquid_class(self, liquid_class: Any, volume: float, source: Any, dest: Any, **kwargs: Any) -> None:
+        self._tracker.draw(volume, source, dest)
+        self._pipette.distribute_with_liquid_class(
+            liquid_class=liquid_class, volume=volume, source=source, dest=dest, **kwargs,
+        )
+
+
+class LidPreheat:
+    """Ramps the thermocycler lid while pipetting continues.
+
+    start() hands the lid temperature to the module as a background task;
+    wait() is the barrier to place right before the profile that needs the
+    hot lid.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext, thermocycler: Any) -> None:
+        self._protocol = protocol
+        self._thermocycler = thermocycler
+        self._task = None
+
+    def start(self, temperature: float) -> None:
+        self._task = self._thermocycler.start_set_lid_temperature(temperature)
+
+    def wait(self) -> None:
+        if self._task is not None:
+            self._protocol.wait_for_tasks([self._task])
+        self._task = None
+
+
+class ModuleWarmUp:
+    """Starts every module's ramp at once, with one barrier for the steps that need them.
+
+    Temperature modules and thermocycler blocks all ramp as background tasks,
+    so the setup costs the slowest ramp rather than the sum of them.
+    """
+
+    def __init__(self, protocol: protocol_api.ProtocolContext) -> None:
+        self._protocol = protocol
+        self._tasks: List[Any] = []
+
+    def temperature_module(self, module: Any, celsius: float) -> None:
+        self._tasks.append(module.start_set_temperature(celsius))
+
+    def thermocycler_block(self, thermocycler: Any, celsius: float) -> None:
+        self._tasks.append(thermocycler.start_set_block_temperature(celsius))
+
+    def wait(self) -> None:
+        """Block until every module started here has reached its set-point."""
+        if self._tasks:
+            self._protocol.wait_for_tasks(self._tasks)
+        self._tasks = []
+
+
+class ThermocyclerProfile(NamedTuple):
+    """A PCR program split into initial denaturation, cycle block and final extension."""
+
+    initial: List[Dict[str, float]]
+    cycle: List[Dict[str, float]]
+    cycles: int
+    final: List[Dict[str, float]]
+
+    def flatten(self) -> List[Dict[str, float]]:
+        """Return the temperature trace as a single flat list of steps."""
+        return self.initial + self.cycle * self.cycles + self.final
+
+    def execute(self, thermocycler: Any, block_max_volume: float) -> None:
+        """Run each stage as its own profile, repeating the cycle block on the module."""
+        for steps, repetitions in ((self.initial, 1), (self.cycle, self.cycles), (self.final, 1)):
+            if steps and repetitions:
+                thermocycler.execute_profile(steps, repetitions, block_max_volume=block_max_volume)
+
+    def start(self, thermocycler: Any, block_max_volume: float) -> Any:
+        """Start the whole trace without blocking and return the module task."""
+        return thermocycler.start_execute_profile(self.flatten(), 1, block_max_volume=block_max_volume)
+
+
+def _by_volume(points: List[Tuple[float, float]], volume: float) -> float:
+    """Interpolate a liquid class *_by_volume curve, holding its end values."""
+    points = sorted(points)
+    if volume <= points[0][0]:
+        return points[0][1]
+    for (v0, y0), (v1, y1) in zip(points, points[1:]):
+        if volume <= v1:
+            return y0 + (y1 - y0) * (volume - v0) / (v1 - v0)
+    return points[-1][1]
+
+
+def plan_trips(volume: float, properties: Dict[str, Any], tip_capacity: float = 50) -> List[float]:
+    """Split one well's transfer into per-trip volumes, largest first.
+
+    A trip fits the tip with its aspirate correction and retract air gap.
+    Both candidates use the fewest trips that fit: equal trips, or full trips
+    plus the remainder. The one whose trips need the smaller summed
+    correction on the aspirate correction_by_volume curve wins, and equal
+    trips win ties.
+    """
+    (tip_properties,) = properties.values()
+    (phases,) = tip_properties.values()
+    correction = phases["aspirate"]["correction_by_volume"]
+    air_gap = max(gap for _, gap in phases["aspirate"]["retract"]["air_gap_by_volume"])
+    full = tip_capacity - air_gap - max(0.0, _by_volume(correction, tip_capacity))
+    count = math.ceil(round(volume / full, 6))
+    equal = [volume / count] * count
+    fill = [full] * (count - 1) + [volume - full * (count - 1)]
+    return min((equal, fill), key=lambda trips: sum(abs(_by_volume(correction, trip)) for trip in trips))
+
+
+def transfer_in_trips(
+    pipette: Any,
+    trips: List[float],
+    sources: List[Any],
+    dests: List[Any],
+    tip_parking: TipParking,
+    liquid_class: Any,
+    new_tip: str = "once",
+) -> None:
+    """Move each source into its dest in the planned trips, then park the tip.
+
+    With new_tip="once" every move shares one tip, which is only safe when
+    the sources hold the same liquid and the dests hold nothing the tip
+    could carry back. With "always" each source/dest pair gets its own tip,
+    as replicate reactions need.
+    """
+    call_tip = "once"
+    for index, (source, dest) in enumerate(zip(sources, dests)):
+        if index and new_tip == "always":
+            tip_parking.drop(pipette)
+            call_tip = "once"
+        for trip_volume in sorted(set(trips), reverse=True):
+            repeats = trips.count(trip_volume)
+            pipette.transfer_with_liquid_class(
+                volume=trip_volume,
+                source=[source] * repeats,
+                dest=[dest] * repeats,
+                new_tip=call_tip,
+                trash_location=tip_parking.trash_location,
+                keep_last_tip=True,
+                liquid_class=liquid_class,
+            )
+            call_tip = "never"
+    tip_parking.drop(pipette)
+
+
+def describe_trips(moves: Dict[str, Tuple[List[float], int]]) -> str:
+    """Summarise planned large-volume moves as "<step>: <wells> x <trips>" lines."""
+    lines = []
+    for step, (trips, wells) in moves.items():
+        volumes = " + ".join(f"{trip:.4g}" for trip in trips)
+        lines.append(f"{step}: {wells} wells x ({volumes}) µL")
+    aspirations = sum(len(trips) * wells for trips, wells in moves.values())
+    lines.append(f"{aspirations} aspirations planned")
+    return "\n".join(lines)
+
+
+def q5_profile(annealing: float, cycles: int, extension_seconds: float) -> ThermocyclerProfile:
+    """The Q5 cycling program of Steps 9 and 16 for one annealing temperature."""
+    return ThermocyclerProfile(
+        initial=[{"temperature": 98, "hold_time_seconds": 30}],
+        cycle=[
+            {"temperature": 98, "hold_time_seconds": 10},
+            {"temperature": annealing, "hold_time_seconds": 10},
+            {"temperature": 72, "hold_time_seconds": extension_seconds},
+        ],
+        cycles=cycles,
+        final=[{"temperature": 72, "hold_time_seconds": 120}],
+    )
+
+
+class PcrLayout(NamedTuple):
+    """Cold block wells feeding one PCR, as named in the plate_map CSV header."""
+
+    name: str
+    master_mix: str
+    forward: str
+    reverse: str
+    template: str
+    water: str
+    digest_water: str
+
+
+# The designer layout. Its PCRs are named after their annealing temperatures
+# once the runtime parameters are known; see read_plate_map().
+DEFAULT_PLATE_MAP = [
+    PcrLayout("PCR 1", master_mix="A12", forward="A11", reverse="B11", template="H11", water="A10", digest_water="C10"),
+    PcrLayout("PCR 2", master_mix="A12", forward="C11", reverse="D11", template="H11", water="B10", digest_water="D10"),
+]
+
+
+def add_parameters(parameters: protocol_api.ParameterContext) -> None:
+    parameters.add_int(
+        variable_name="replicates",
+        display_name="Reactions per PCR",
+        description="Replicate reactions of each PCR; reagent loads cover up to two.",
+        default=2,
+        minimum=1,
+        maximum=2,
+    )
+    parameters.add_float(
+        variable_name="annealing_1",
+        display_name="PCR 1 annealing",
+        description="Annealing temperature of the first PCR (Step 9).",
+        default=65.0,
+        minimum=50.0,
+        maximum=72.0,
+        unit="°C",
+    )
+    parameters.add_float(
+        variable_name="annealing_2",
+        display_name="PCR 2 annealing",
+        description="Annealing temperature of the second PCR (Step 16).",
+        default=68.0,
+        minimum=50.0,
+        maximum=72.0,
+        unit="°C",
+    )
+    parameters.add_int(
+        variable_name="cycles",
+        display_name="Cycles",
+        description="Denature, anneal and extend cycles of both PCRs.",
+        default=25,
+        minimum=10,
+        maximum=40,
+    )
+    parameters.add_int(
+        variable_name="extension_seconds",
+        display_name="Extension time",
+        description="72 °C extension per cycle; Q5 needs 20-30 s per kb.",
+        default=70,
+        minimum=10,
+        maximum=300,
+        unit="s",
+    )
+    parameters.add_csv_file(
+        variable_name="plate_map",
+        display_name="Plate map",
+        description="One row per PCR naming its cold block wells; see PcrLayout for the columns.",
+    )
+
+
+def read_plate_map(parameters: Any) -> List[PcrLayout]:
+    """Read the two PCR layouts from the plate_map CSV, or use DEFAULT_PLATE_MAP.
+
+    The CSV starts with a header row of PcrLayout field names, in any order,
+    followed by one row per PCR. Without a file the default PCRs are named
+    after their annealing temperatures, e.g. "Tm65". A file that is attached
+    but cannot be read stops the protocol.
+    """
+    try:
+        rows = parameters.plate_map.parse_as_csv()
+    except protocol_api.RuntimeParameterRequiredError:
+        # No file attached, as when the protocol is analyzed on upload.
+        return [
+            layout._replace(name=f"Tm{annealing:g}")
+            for layout, annealing in zip(DEFAULT_PLATE_MAP, (parameters.annealing_1, parameters.annealing_2))
+        ]
+    rows = [[cell.strip() for cell in row] for row in rows if any(cell.strip() for cell in row)]
+    if not rows:
+        raise ValueError("Plate map is empty")
+    header, body = rows[0], rows[1:]
+    missing = set(PcrLayout._fields) - set(header)
+    if missing:
+        raise ValueError(f"Plate map is missing columns: {', '.join(sorted(missing))}")
+    layouts = [PcrLayout(**{field: row[header.index(field)] for field in PcrLayout._fields}) for row in body]
+    if len(layouts) != 2:
+        raise ValueError(f"Plate map lists {len(layouts)} PCRs; this protocol runs two")
+    return layouts
+
+
+def column_one(first_row: int, count: int) -> List[str]:
+    """`count` consecutive wells of column 1, starting at a zero-based row."""
+    return [f"{ROWS[row]}1" for row in range(first_row, first_row + count)]
+
+
+class MixComponent(NamedTuple):
+    """One reagent of a reaction: its cold block well, µL per reaction and liquid class.
+
+    Added reaction by reaction, `distribute` components share one tip across
+    the reactions and the rest take a fresh tip per reaction.
+    """
+
+    source: str
+    volume: float
+    properties: Dict[str, Any]
+    liquid_class: Any
+    distribute: bool
+
+
+def reaction_components(
+    layout: PcrLayout,
+    master_mix_class: Any,
+    primer_class: Any,
+    template_class: Any,
+    water_class: Any,
+) -> List[MixComponent]:
+    """The Q5 reaction recipe of one PCR, in the order Protocol Designer added it."""
+    return [
+        MixComponent(layout.master_mix, 25, DISTRIBUTE_STEP_4_PROPERTIES, master_mix_class, True),
+        MixComponent(layout.forward, 2.5, DISTRIBUTE_STEP_5_PROPERTIES, primer_class, True),
+        MixComponent(layout.template, 1, TRANSFER_STEP_6_PROPERTIES, template_class, False),
+        MixComponent(layout.reverse, 2.5, DISTRIBUTE_STEP_5_PROPERTIES, primer_class, True),
+        MixComponent(layout.water, 19, TRANSFER_STEP_8_PROPERTIES, water_class, False),
+    ]
+
+
+def add_component(
+    pipette: Any,
+    plate: Any,
+    component: MixComponent,
+    dests: List[Any],
+    trash_location: Any,
+    tip_parking: TipParking,
+) -> None:
+    """Add one component straight to every reaction in `dests`."""
+    if component.distribute:
+        pipette.distribute_with_liquid_class(
+            volume=component.volume,
+            source=[plate[component.source]],
+            dest=dests,
+            new_tip="once",
+            trash_location=trash_location,
+            keep_last_tip=True,
+            liquid_class=component.liquid_class,
+        )
+    else:
+        pipette.transfer_with_liquid_class(
+            volume=component.volume,
+            source=[plate[component.source]] * len(dests),
+            dest=dests,
+            new_tip="always",
+            trash_location=trash_location,
+            keep_last_tip=True,
+            liquid_class=component.liquid_class,
+        )
+    tip_parking.drop(pipette)
+
+
+def split_premix(
+    components: List[MixComponent], fill_properties: Dict[str, Any],
+) -> Tuple[List[MixComponent], List[MixComponent]]:
+    """Split the components into those added directly and those premixed.
+
+    Premixing pays only while each reaction's share of the premix goes in
+    one trip, so the largest distributed components are taken out and added
+    directly until it does. Both lists keep the recipe order.
+    """
+    premixed = list(components)
+    while len(premixed) > 1 and len(plan_trips(sum(component.volume for component in premixed), fill_properties)) > 1:
+        distributed = [component for component in premixed if component.distribute]
+        if not distributed:
+            break
+        premixed.remove(max(distributed, key=lambda component: component.volume))
+    return [component for component in components if component not in premixed], premixed
+
+
+def build_reactions(
+    pipette: Any,
+    plate: Any,
+    components: List[MixComponent],
+    mix_well: str,
+    dests: List[Any],
+    fill_properties: Dict[str, Any],
+    fill_class: Any,
+    trash_location: Any,
+    tip_parking: TipParking,
+) -> None:
+    """Build every reaction in `dests` from the components, in the order given.
+
+    With PREMIX_REACTIONS, split_premix() picks the components that go
+    into `mix_well`, each scaled to the reaction count plus
+    MASTER_MIX_OVERAGE and on its own tip; the last one's dispense mix
+    homogenises the well. The others are added to the reactions directly
+    first, then a single tip moves the premix into every destination in one
+    trip each. Otherwise each component is added to the reactions directly.
+    """
+    if not PREMIX_REACTIONS:
+        for component in components:
+            add_component(pipette, plate, component, dests, trash_location, tip_parking)
+        return
+
+    direct, premixed = split_premix(components, fill_properties)
+    for component in direct:
+        add_component(pipette, plate, component, dests, trash_location, tip_parking)
+    scale = len(dests) * (1 + MASTER_MIX_OVERAGE)
+    for component in premixed:
+        transfer_in_trips(
+            pipette,
+            plan_trips(component.volume * scale, component.properties),
+            sources=[plate[component.source]],
+            dests=[plate[mix_well]],
+            tip_parking=tip_parking,
+            liquid_class=component.liquid_class,
+        )
+    transfer_in_trips(
+        pipette,
+        plan_trips(sum(component.volume for component in premixed), fill_properties),
+        sources=[plate[mix_well]] * len(dests),
+        dests=dests,
+        tip_parking=tip_parking,
+        liquid_class=fill_class,
+    )
+
+
+# Build the second PCR's reactions on the cold block while Step 9 cycles, then
+# shuttle them into the thermocycler. Set to False to run the two PCRs back to
+# back in the thermocycler.
+PIPELINE_PCR = True
+
+ROWS = "ABCDEFGH"
+
+# Park used tips in an empty rack next to the plates instead of crossing the
+# deck to the waste chute after every transfer. The rack goes into the chute
+# with the gripper before the final thermocycler program.
+PARK_USED_TIPS = True
+USED_TIP_RACK_SLOT = "C2"
+
+# Where the robot saves the ConsumptionTracker report, for staging the next
+# run's deck; nothing is written when simulating.
+CONSUMPTION_REPORT_PATH = "/data/user_storage/q5_pcr_consumption.json"
+
+# Premix each PCR's primers, template and water in a spare cold block well
+# and fill its replicate reactions from it: a tip per reagent plus one for the
+# fill, instead of one or two tips per reagent per reaction. The Q5 master mix
+# is distributed straight into the reactions so each fill is one trip. Water
+# goes in last so its dispense mix stirs the well; the overage is what the
+# tip leaves behind.
+PREMIX_REACTIONS = True
+MASTER_MIX_OVERAGE = 0.1
+MASTER_MIX_WELLS = ["E11", "F11"]
+
+# Assemble the DpnI digests in the PCR wells on the thermocycler. The second
+# PCR's products stay where they were cycled and the first PCR's come back
+# from the cold block after the second run, so Step 17 moves each 50 µL
+# reaction and the Step 22 round trip is gone. The water is cut from 43 to 38 µL
+# so each product makes a 100 µL digest, the thermocycler block_max_volume.
+# Set to False to build the digests on the cold block and move them back.
+DIGEST_IN_PLACE = True
+
 
 def run(protocol: protocol_api.ProtocolContext) -> None:
     # Load Modules:
     thermocycler_module_1 = protocol.load_module("thermocyclerModuleV2", "B1")
     heater_shaker_module_1 = protocol.load_module("heaterShakerModuleV1", "D1")
     temperature_module_1 = protocol.load_module("temperatureModuleV2", "C1")
+    lid_preheat = LidPreheat(protocol, thermocycler_module_1)
 
     # Load Adapters:
     aluminum_block_1 = temperature_module_1.load_adapter(
@@ -60,16 +672,26 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
         version=1,
     )
 
+    used_tip_rack = None
+    if PARK_USED_TIPS:
+        used_tip_rack = protocol.load_labware(
+            "opentrons_flex_96_filtertiprack_50ul",
+            location=USED_TIP_RACK_SLOT,
+            label="Empty Tip Rack for Used Tips",
+            namespace="opentrons",
+            version=1,
+        )
+
+    consumption = ConsumptionTracker(protocol, {"tip_rack_1": tip_rack_1, "tip_rack_2": tip_rack_2, "tip_rack_3": tip_rack_3})
+
     # Load Pipettes:
-    pipette_right = protocol.load_instrument(
+    pipette_right = consumption.track(protocol.load_instrument(
         "flex_1channel_50", "right", tip_racks=[tip_rack_1, tip_rack_2, tip_rack_3],
-    )
-    pipette_left = protocol.load_instrument(
-        "flex_8channel_50", "left", tip_racks=[tip_rack_1, tip_rack_2, tip_rack_3],
-    )
+    ))
 
     # Load Waste Chute:
     waste_chute = protocol.load_waste_chute()
+    tip_parking = TipParking(used_tip_rack, waste_chute)
 
     # Define Liquids:
     liquid_3 = protocol.define_liquid(
@@ -168,47 +790,56 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
     )
 
     # Load Liquids:
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["A12", "B12", "C12", "D12"],
         liquid=liquid_3,
         volume=125,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["H12"],
         liquid=liquid_20,
         volume=10,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["G12"],
         liquid=liquid_21,
         volume=50,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["A11"],
         liquid=liquid_22,
         volume=20,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["B11"],
         liquid=liquid_23,
         volume=20,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["C11"],
         liquid=liquid_24,
         volume=20,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["D11"],
         liquid=liquid_25,
         volume=20,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=["H11"],
         liquid=liquid_6,
         volume=10,
     )
-    well_plate_2.load_liquid(
+    consumption.load_liquid(
+        well_plate_2,
         wells=[
             "A10", "B10", "C10", "D10", "E10", "F10", "G10", "H10"
         ],
@@ -217,1674 +848,274 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
     )
 
     # Load Liquid Classes:
+    liquid_classes = LiquidClassRegistry(protocol)
     glycerol_50_base_class = protocol.get_liquid_class("glycerol_50")
     water_base_class = protocol.get_liquid_class("water")
 
+    master_mix_class = liquid_classes.define(
+        name="distribute_step_4",
+        base_liquid_class=glycerol_50_base_class,
+        properties=DISTRIBUTE_STEP_4_PROPERTIES,
+    )
+    primer_class = liquid_classes.define(
+        name="distribute_step_5",
+        base_liquid_class=water_base_class,
+        properties=DISTRIBUTE_STEP_5_PROPERTIES,
+    )
+    template_class = liquid_classes.define(
+        name="transfer_step_6",
+        base_liquid_class=water_base_class,
+        properties=TRANSFER_STEP_6_PROPERTIES,
+    )
+    water_class = liquid_classes.define(
+        name="transfer_step_8",
+        base_liquid_class=water_base_class,
+        properties=TRANSFER_STEP_8_PROPERTIES,
+    )
+
+    # Runtime Parameters:
+    replicates = protocol.params.replicates
+    pcrs = read_plate_map(protocol.params)
+    profiles = [
+        q5_profile(annealing, protocol.params.cycles, protocol.params.extension_seconds)
+        for annealing in (protocol.params.annealing_1, protocol.params.annealing_2)
+    ]
+    components = [
+        reaction_components(pcr, master_mix_class, primer_class, template_class, water_class)
+        for pcr in pcrs
+    ]
+    # Each PCR's replicates fill the next rows of column 1, on the thermocycler
+    # plate and after Step 10 or 17 on the cold block. A tip that has been in
+    # one replicate would carry it into the next, so every move of a reaction
+    # and every addition to one takes a fresh tip per reaction.
+    # The rows below them stage the second PCR and, when the digests are not
+    # built in place, take them in the thermocycler.
+    amplicon_groups = [column_one(index * replicates, replicates) for index in range(len(pcrs))]
+    spare_row = len(pcrs) * replicates
+    staging_wells = column_one(spare_row, replicates)
+    digest_groups = [column_one(spare_row + index * replicates, replicates) for index in range(len(pcrs))]
+
     # PROTOCOL STEPS
 
-    # Step 1:
-    temperature_module_1.start_set_temperature(10)
+    # Plan the moves larger than a 50 µL tip up front and report the trips.
+    # Reactions move whole, and a digest is its reaction plus water, 2 µL
+    # DpnI and 10 µL rCutsmart.
+    reaction_volume = sum(component.volume for component in components[0])
+    digest_water = 38 if DIGEST_IN_PLACE else 43
+    product_trips = plan_trips(reaction_volume, TRANSFER_STEP_10_PROPERTIES)
+    digest_trips = plan_trips(reaction_volume + digest_water + 12, TRANSFER_STEP_22_PROPERTIES)
+    pipelined = PIPELINE_PCR
+    large_moves = {"Step 10": (product_trips, replicates), "Step 17": (product_trips, replicates)}
+    if pipelined:
+        large_moves["Shuttle"] = (product_trips, replicates)
+    if not DIGEST_IN_PLACE:
+        large_moves["Step 22"] = (digest_trips, spare_row)
+    protocol.comment(describe_trips(large_moves))
 
-    # Step 2:
-    temperature_module_1.start_set_temperature(10)
+    # Steps 1-3 start every module ramp at once, the Step 9 lid included.
+    # Step 4 draws the master mix from the cold block and waits for them.
+
+    # Steps 1-2:
+    warm_up = ModuleWarmUp(protocol)
+    warm_up.temperature_module(temperature_module_1, 10)
 
     # Step 3:
     thermocycler_module_1.open_lid()
-    thermocycler_module_1.set_block_temperature(10)
+    warm_up.thermocycler_block(thermocycler_module_1, 10)
+    lid_preheat.start(110)
 
-    # Step 4:
-    pipette_right.distribute_with_liquid_class(
-        volume=25,
-        source=[well_plate_2["A12"]],
-        dest=[well_plate_1["A1"], well_plate_1["B1"]],
-        new_tip="once",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_4",
-            base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 0)],
-                    "disposal_by_volume": [(0, 0)],
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 5:
-    pipette_right.distribute_with_liquid_class(
-        volume=2.5,
-        source=[well_plate_2["A11"]],
-        dest=[well_plate_1["A1"], well_plate_1["B1"]],
-        new_tip="once",
+    # Steps 4-8:
+    warm_up.wait()
+    build_reactions(
+        pipette_right,
+        well_plate_2,
+        components[0],
+        mix_well=MASTER_MIX_WELLS[0],
+        dests=[well_plate_1[well] for well in amplicon_groups[0]],
+        fill_properties=TRANSFER_STEP_8_PROPERTIES,
+        fill_class=water_class,
         trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_5",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
-        ),
+        tip_parking=tip_parking,
     )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 6:
-    pipette_right.transfer_with_liquid_class(
-        volume=1,
-        source=[well_plate_2["H11"], well_plate_2["H11"]],
-        dest=[well_plate_1["A1"], well_plate_1["B1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_6",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 7:
-    pipette_right.distribute_with_liquid_class(
-        volume=2.5,
-        source=[well_plate_2["B11"]],
-        dest=[well_plate_1["A1"], well_plate_1["B1"]],
-        new_tip="once",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_7",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 8:
-    pipette_right.transfer_with_liquid_class(
-        volume=19,
-        source=[well_plate_2["A10"], well_plate_2["A10"]],
-        dest=[well_plate_1["A1"], well_plate_1["B1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_8",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 26.4)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": True, "repetitions": 5, "volume": 25},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 9:
+    # Once hot, the lid stays at 110 °C until the Step 23 digest has run. Cooling
+    # it to 37 °C between the back-to-back runs only to heat it again would
+    # block the robot for minutes each time.
     thermocycler_module_1.close_lid()
-    thermocycler_module_1.set_lid_temperature(110)
-    thermocycler_module_1.execute_profile(
-        [
-            {"temperature": 98, "hold_time_seconds": 30},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 65, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 72, "hold_time_seconds": 120},
-        ],
-        1,
-        block_max_volume=50,
+    lid_preheat.wait()
+    if pipelined:
+        first_run = profiles[0].start(thermocycler_module_1, block_max_volume=50)
+        second_plate, second_wells = well_plate_2, staging_wells
+    else:
+        profiles[0].execute(thermocycler_module_1, block_max_volume=50)
+        thermocycler_module_1.open_lid()
+        thermocycler_module_1.set_block_temperature(10)
+        second_plate, second_wells = well_plate_1, amplicon_groups[1]
+
+    # Steps 11-15 build the second PCR, on the cold block while Step 9 cycles
+    # in pipelined mode. Step 10 follows once the first run is done.
+
+    # Steps 11-15:
+    build_reactions(
+        pipette_right,
+        well_plate_2,
+        components[1],
+        mix_well=MASTER_MIX_WELLS[1],
+        dests=[second_plate[well] for well in second_wells],
+        fill_properties=TRANSFER_STEP_8_PROPERTIES,
+        fill_class=water_class,
+        trash_location=waste_chute,
+        tip_parking=tip_parking,
     )
-    thermocycler_module_1.open_lid()
-    thermocycler_module_1.set_block_temperature(10)
-    thermocycler_module_1.set_lid_temperature(37)
 
     # Step 10:
-    pipette_right.transfer_with_liquid_class(
-        volume=55,
-        source=[well_plate_1["A1"], well_plate_1["B1"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    if pipelined:
+        protocol.wait_for_tasks([first_run])
+        thermocycler_module_1.open_lid()
+        thermocycler_module_1.set_block_temperature(10)
+    transfer_in_trips(
+        pipette_right,
+        product_trips,
+        sources=[well_plate_1[well] for well in amplicon_groups[0]],
+        dests=[well_plate_2[well] for well in amplicon_groups[0]],
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_10",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 28.8)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 11:
-    pipette_right.distribute_with_liquid_class(
-        volume=25,
-        source=[well_plate_2["A12"]],
-        dest=[well_plate_1["C1"], well_plate_1["D1"]],
-        new_tip="once",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_11",
-            base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 3.9)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "conditioning_by_volume": [(0, 0)],
-                    "disposal_by_volume": [(0, 0)],
-                },
-            }}},
+            properties=TRANSFER_STEP_10_PROPERTIES,
         ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 12:
-    pipette_right.distribute_with_liquid_class(
-        volume=2.5,
-        source=[well_plate_2["C11"]],
-        dest=[well_plate_1["C1"], well_plate_1["D1"]],
-        new_tip="once",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_12",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 13:
-    pipette_right.transfer_with_liquid_class(
-        volume=1,
-        source=[well_plate_2["H11"], well_plate_2["H11"]],
-        dest=[well_plate_1["C1"], well_plate_1["D1"]],
         new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_13",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
-
-    # Step 14:
-    pipette_right.distribute_with_liquid_class(
-        volume=2.5,
-        source=[well_plate_2["D11"]],
-        dest=[well_plate_1["C1"], well_plate_1["D1"]],
-        new_tip="once",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="distribute_step_14",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 7)],
-                    "mix": {"enabled": False},
-                },
-                "multi_dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 43)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "conditioning_by_volume": [(0, 5)],
-                    "disposal_by_volume": [(0, 5)],
-                },
-            }}},
-        ),
     )
-    pipette_right.drop_tip(waste_chute)
 
-    # Step 15:
-    pipette_right.transfer_with_liquid_class(
-        volume=19,
-        source=[well_plate_2["B10"], well_plate_2["B10"]],
-        dest=[well_plate_1["C1"], well_plate_1["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_15",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 26.4)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": True, "repetitions": 5, "volume": 25},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
+    # Shuttle the staged second PCR into the thermocycler.
+    if pipelined:
+        transfer_in_trips(
+            pipette_right,
+            product_trips,
+            sources=[well_plate_2[well] for well in staging_wells],
+            dests=[well_plate_1[well] for well in amplicon_groups[1]],
+            tip_parking=tip_parking,
+            liquid_class=liquid_classes.define(
+                name="transfer_step_16_shuttle",
+                base_liquid_class=water_base_class,
+                properties=TRANSFER_STEP_10_PROPERTIES,
+            ),
+            new_tip="always",
+        )
 
     # Step 16:
     thermocycler_module_1.close_lid()
     thermocycler_module_1.set_lid_temperature(110)
-    thermocycler_module_1.execute_profile(
-        [
-            {"temperature": 98, "hold_time_seconds": 30},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 98, "hold_time_seconds": 10},
-            {"temperature": 68, "hold_time_seconds": 10},
-            {"temperature": 72, "hold_time_seconds": 70},
-            {"temperature": 72, "hold_time_seconds": 120},
-        ],
-        1,
-        block_max_volume=50,
-    )
+    profiles[1].execute(thermocycler_module_1, block_max_volume=50)
     thermocycler_module_1.open_lid()
     thermocycler_module_1.set_block_temperature(10)
-    thermocycler_module_1.set_lid_temperature(37)
 
     # Step 17:
-    pipette_right.transfer_with_liquid_class(
-        volume=55,
-        source=[well_plate_1["C1"], well_plate_1["D1"]],
-        dest=[well_plate_2["C1"], well_plate_2["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    # In-place digests bring the first PCR's products back into the
+    # thermocycler; otherwise the second PCR's join them on the cold block.
+    if DIGEST_IN_PLACE:
+        step_17_source, step_17_wells, digest_plate = well_plate_2, amplicon_groups[0], well_plate_1
+    else:
+        step_17_source, step_17_wells, digest_plate = well_plate_1, amplicon_groups[1], well_plate_2
+    transfer_in_trips(
+        pipette_right,
+        product_trips,
+        sources=[step_17_source[well] for well in step_17_wells],
+        dests=[digest_plate[well] for well in step_17_wells],
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_17",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 28.8)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": False},
-                },
-            }}},
+            properties=TRANSFER_STEP_10_PROPERTIES,
         ),
+        new_tip="always",
     )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 18:
-    pipette_right.transfer_with_liquid_class(
-        volume=2,
-        source=[well_plate_2["H12"], well_plate_2["H12"], well_plate_2["H12"], well_plate_2["H12"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["C1"], well_plate_2["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    digest_wells = [digest_plate[well] for amplicon_wells in amplicon_groups for well in amplicon_wells]
+    transfer_in_trips(
+        pipette_right,
+        plan_trips(2, DISTRIBUTE_STEP_18_PROPERTIES),
+        sources=[well_plate_2["H12"]] * len(digest_wells),
+        dests=digest_wells,
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_18",
             base_liquid_class=glycerol_50_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 7.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "delay": {"enabled": True, "duration": 1},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 25)],
-                    "delay": {"enabled": True, "duration": 0.5},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 4,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 4,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
-                    "push_out_by_volume": [(0, 11.7)],
-                    "mix": {"enabled": False},
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_18_PROPERTIES,
         ),
+        new_tip="always",
     )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 19:
-    pipette_right.transfer_with_liquid_class(
-        volume=10,
-        source=[well_plate_2["G12"], well_plate_2["G12"], well_plate_2["G12"], well_plate_2["G12"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["C1"], well_plate_2["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    transfer_in_trips(
+        pipette_right,
+        plan_trips(10, DISTRIBUTE_STEP_19_PROPERTIES),
+        sources=[well_plate_2["G12"]] * len(digest_wells),
+        dests=digest_wells,
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_19",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 24)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": False},
-                },
-            }}},
+            properties=DISTRIBUTE_STEP_19_PROPERTIES,
         ),
+        new_tip="always",
     )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 20:
-    pipette_right.transfer_with_liquid_class(
-        volume=43,
-        source=[well_plate_2["C10"], well_plate_2["C10"]],
-        dest=[well_plate_2["A1"], well_plate_2["B1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    transfer_in_trips(
+        pipette_right,
+        plan_trips(digest_water, TRANSFER_STEP_20_PROPERTIES),
+        sources=[well_plate_2[pcrs[0].digest_water]] * replicates,
+        dests=[digest_plate[well] for well in amplicon_groups[0]],
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_20",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": True, "repetitions": 5, "volume": 45},
-                },
-            }}},
+            properties=TRANSFER_STEP_20_PROPERTIES,
         ),
+        new_tip="always",
     )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 21:
-    pipette_right.transfer_with_liquid_class(
-        volume=43,
-        source=[well_plate_2["D10"], well_plate_2["D10"]],
-        dest=[well_plate_2["C1"], well_plate_2["D1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
+    transfer_in_trips(
+        pipette_right,
+        plan_trips(digest_water, TRANSFER_STEP_20_PROPERTIES),
+        sources=[well_plate_2[pcrs[1].digest_water]] * replicates,
+        dests=[digest_plate[well] for well in amplicon_groups[1]],
+        tip_parking=tip_parking,
+        liquid_class=liquid_classes.define(
             name="transfer_step_21",
             base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 33)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": True, "repetitions": 5, "volume": 45},
-                },
-            }}},
+            properties=TRANSFER_STEP_20_PROPERTIES,
         ),
+        new_tip="always",
     )
-    pipette_right.drop_tip(waste_chute)
 
     # Step 22:
-    pipette_right.transfer_with_liquid_class(
-        volume=110,
-        source=[well_plate_2["A1"], well_plate_2["B1"], well_plate_2["C1"], well_plate_2["D1"]],
-        dest=[well_plate_1["E1"], well_plate_1["F1"], well_plate_1["G1"], well_plate_1["H1"]],
-        new_tip="always",
-        trash_location=waste_chute,
-        keep_last_tip=True,
-        liquid_class=protocol.define_liquid_class(
-            name="transfer_step_22",
-            base_liquid_class=water_base_class,
-            properties={"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
-                "aspirate": {
-                    "aspirate_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 31.3)],
-                    "pre_wet": False,
-                    "correction_by_volume": [(0, 0)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "mix": {"enabled": False},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                    },
-                },
-                "dispense": {
-                    "dispense_position": {
-                        "offset": {"x": 0, "y": 0, "z": 2},
-                        "position_reference": "well-bottom",
-                    },
-                    "flow_rate_by_volume": [(0, 50)],
-                    "delay": {"enabled": True, "duration": 0.2},
-                    "submerge": {
-                        "delay": {"enabled": False},
-                        "speed": 100,
-                        "start_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                    },
-                    "retract": {
-                        "air_gap_by_volume": [(0, 0.1)],
-                        "delay": {"enabled": False},
-                        "end_position": {
-                            "offset": {"x": 0, "y": 0, "z": 2},
-                            "position_reference": "well-top",
-                        },
-                        "speed": 50,
-                        "touch_tip": {"enabled": False},
-                        "blowout": {"enabled": False},
-                    },
-                    "correction_by_volume": [(0, 0)],
-                    "push_out_by_volume": [(0, 2)],
-                    "mix": {"enabled": False},
-                },
-            }}},
-        ),
-    )
-    pipette_right.drop_tip(waste_chute)
+    # The in-place digests are already in the thermocycler.
+    if not DIGEST_IN_PLACE:
+        for amplicon_wells, digest_wells in zip(amplicon_groups, digest_groups):
+            transfer_in_trips(
+                pipette_right,
+                digest_trips,
+                sources=[well_plate_2[well] for well in amplicon_wells],
+                dests=[well_plate_1[well] for well in digest_wells],
+                tip_parking=tip_parking,
+                liquid_class=liquid_classes.define(
+                    name="transfer_step_22",
+                    base_liquid_class=water_base_class,
+                    properties=TRANSFER_STEP_22_PROPERTIES,
+                ),
+                new_tip="always",
+            )
 
     # Step 23:
+    tip_parking.dispose(protocol)
+    # All pipetting is done: report what it used while the last program runs,
+    # so the next deck can be staged in the meantime.
+    consumption.report(CONSUMPTION_REPORT_PATH)
     thermocycler_module_1.close_lid()
     thermocycler_module_1.set_lid_temperature(110)
     thermocycler_module_1.execute_profile(
@@ -1898,4 +1129,687 @@ def run(protocol: protocol_api.ProtocolContext) -> None:
     thermocycler_module_1.set_block_temperature(10)
     thermocycler_module_1.set_lid_temperature(37)
 
-DESIGNER_APPLICATION = """{"robot":{"model":"OT-3 Standard"},"designerApplication":{"name":"opentrons/protocol-designer","version":"8.5.0","data":{"pipetteTiprackAssignments":{"63555313-4253-4347-be9c-8b6e64189bb7":["opentrons/opentrons_flex_96_filtertiprack_50ul/1"],"8e36439e-b289-4759-8202-396adc7c9436":["opentrons/opentrons_flex_96_filtertiprack_50ul/1"]},"dismissedWarnings":{"form":[],"timeline":[]},"ingredients":{"2":{"displayName":"Q5MM","description":"Appropriate volume of Q5MM","displayColor":"#ff4f4fff","liquidGroupId":"2","liquidClass":"glycerol50V1"},"3":{"displayName":"HiFi assembly MM","description":"Use at 2X","displayColor":"#ff9900","liquidGroupId":"3","liquidClass":"glycerol50V1"},"4":{"displayName":"DNA fragment - 1ng/ul","description":null,"displayColor":"#14a502ff","liquidGroupId":"4","liquidClass":"waterV1"},"5":{"displayName":"Plasmid template - 1ng/ul","description":null,"displayColor":"#0028ffff","liquidGroupId":"5","liquidClass":"waterV1"},"6":{"displayName":"NF H2O","description":null,"displayColor":"#7eff42","liquidGroupId":"6","liquidClass":"waterV1"},"7":{"displayName":"PRIMER MIX","description":null,"displayColor":"#ff9900ff","liquidGroupId":"7","liquidClass":"waterV1"},"8":{"displayName":"FP 10µM -Tm58","description":null,"displayColor":"#b925ff","liquidGroupId":"8","liquidClass":"waterV1"},"9":{"displayName":"FP 10µM -Tm62","description":null,"displayColor":"#50d5ffff","liquidGroupId":"9","liquidClass":"waterV1"},"10":{"displayName":"FP 10µM -Tm66","description":null,"displayColor":"#ff9900ff","liquidGroupId":"10","liquidClass":"waterV1"},"11":{"displayName":"RP 10µM -Tm58","description":null,"displayColor":"#ff4f4fff","liquidGroupId":"11","liquidClass":"waterV1"},"12":{"displayName":"RP 10µM -Tm62","description":null,"displayColor":"#ff80f5ff","liquidGroupId":"12","liquidClass":"waterV1"},"13":{"displayName":"RP 10µM -Tm66","description":null,"displayColor":"#b925ffff","liquidGroupId":"13","liquidClass":"waterV1"},"14":{"displayName":"CYCLIN-CD5","description":null,"displayColor":"#7eff42","liquidGroupId":"14","liquidClass":"waterV1"},"15":{"displayName":"MTA-CD5","description":null,"displayColor":"#ff4f4f","liquidGroupId":"15","liquidClass":"waterV1"},"16":{"displayName":"LpPU-CD5","description":null,"displayColor":"#b925ff","liquidGroupId":"16","liquidClass":"waterV1"},"17":{"displayName":"LpGS-CD5","description":null,"displayColor":"#ffd600","liquidGroupId":"17","liquidClass":"waterV1"},"18":{"displayName":"LVP_MINOS_LINEAR_BACKBONE","description":null,"displayColor":"#b925ffff","liquidGroupId":"18","liquidClass":"waterV1"},"19":{"displayName":"DpnI","displayColor":"#ff9900","liquidClass":"glycerol50V1","description":null,"liquidGroupId":"19"},"20":{"displayName":"rCutsmart 10X","displayColor":"#50d5ff","liquidClass":"waterV1","description":null,"liquidGroupId":"20"},"21":{"displayName":"F1","displayColor":"#ff80f5","liquidClass":"waterV1","description":null,"liquidGroupId":"21"},"22":{"displayName":"R1","displayColor":"#7eff42","liquidClass":"waterV1","description":null,"liquidGroupId":"22"},"23":{"displayName":"F2","displayColor":"#ff4f4f","liquidClass":"waterV1","description":null,"liquidGroupId":"23"},"24":{"displayName":"R2","displayColor":"#b925ff","liquidClass":"waterV1","description":null,"liquidGroupId":"24"}},"ingredLocations":{"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{},"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3":{"A12":{"2":{"volume":125}},"B12":{"2":{"volume":125}},"C12":{"2":{"volume":125}},"D12":{"2":{"volume":125}},"H12":{"19":{"volume":10}},"G12":{"20":{"volume":50}},"A11":{"21":{"volume":20}},"B11":{"22":{"volume":20}},"C11":{"23":{"volume":20}},"D11":{"24":{"volume":20}},"H11":{"5":{"volume":10}},"A10":{"6":{"volume":200}},"B10":{"6":{"volume":200}},"C10":{"6":{"volume":200}},"D10":{"6":{"volume":200}},"E10":{"6":{"volume":200}},"F10":{"6":{"volume":200}},"G10":{"6":{"volume":200}},"H10":{"6":{"volume":200}}},"1a5fd57e-53b2-42ee-9803-80f9ea6be0cd:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{},"d267ddb1-a4ed-4278-9a0b-3c076d137ece:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{}},"savedStepForms":{"__INITIAL_DECK_SETUP_STEP__":{"labwareLocationUpdate":{"c4037252-d31d-48da-bc54-bf3427ca692d:opentrons/opentrons_flex_96_filtertiprack_50ul/1":"A2","a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","9058e65f-a2d8-43dc-949b-5f08562afeb6:opentrons/opentrons_96_well_aluminum_block/1":"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType","e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3":"9058e65f-a2d8-43dc-949b-5f08562afeb6:opentrons/opentrons_96_well_aluminum_block/1","1a5fd57e-53b2-42ee-9803-80f9ea6be0cd:opentrons/opentrons_flex_96_filtertiprack_50ul/1":"A3","d267ddb1-a4ed-4278-9a0b-3c076d137ece:opentrons/opentrons_flex_96_filtertiprack_50ul/1":"B2"},"moduleLocationUpdate":{"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType":"B1","ab876e4b-79ff-4c3e-8f5f-220e5289df0f:heaterShakerModuleType":"D1","d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType":"C1"},"pipetteLocationUpdate":{"63555313-4253-4347-be9c-8b6e64189bb7":"right","8e36439e-b289-4759-8202-396adc7c9436":"left"},"trashBinLocationUpdate":{},"wasteChuteLocationUpdate":{"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute":"cutoutD3"},"stagingAreaLocationUpdate":{"b5e29851-8f38-4701-a8c8-37bd3e2de6a0:stagingArea":"cutoutD3"},"gripperLocationUpdate":{"05d06909-404b-47dd-b2bd-40a6fe66a6be:gripper":"mounted"},"stepType":"manualIntervention","id":"__INITIAL_DECK_SETUP_STEP__"},"6b6b5be8-7602-400b-b3b6-6b884d86227d":{"blockIsActive":false,"blockIsActiveHold":true,"blockTargetTemp":null,"blockTargetTempHold":"10","lidIsActive":false,"lidIsActiveHold":true,"lidOpen":false,"lidOpenHold":true,"lidTargetTemp":null,"lidTargetTempHold":"37","moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":["2b1eabcf-3368-4b00-93e9-199420b95037","1d50b86f-5f8c-4537-808b-f049f901bf1b","7dcce4b4-ccad-4935-99e0-211844372afb"],"profileItemsById":{"2b1eabcf-3368-4b00-93e9-199420b95037":{"durationMinutes":"00","durationSeconds":"30","id":"2b1eabcf-3368-4b00-93e9-199420b95037","temperature":"98","title":"denature","type":"profileStep"},"1d50b86f-5f8c-4537-808b-f049f901bf1b":{"id":"1d50b86f-5f8c-4537-808b-f049f901bf1b","title":"","steps":[{"durationMinutes":"00","durationSeconds":"10","id":"2ed9985d-1920-4034-a608-28b2d62e38e8","temperature":"98","title":"d","type":"profileStep"},{"durationMinutes":"00","durationSeconds":"10","id":"e66646c5-9443-487c-a472-e07ac50fa557","temperature":"68","title":"a","type":"profileStep"},{"durationMinutes":"01","durationSeconds":"10","id":"832cd7a7-3562-45da-862d-e4120d496036","temperature":"72","title":"e","type":"profileStep"}],"type":"profileCycle","repetitions":"25"},"7dcce4b4-ccad-4935-99e0-211844372afb":{"durationMinutes":"02","durationSeconds":"00","id":"7dcce4b4-ccad-4935-99e0-211844372afb","temperature":"72","title":"final ext","type":"profileStep"}},"profileTargetLidTemp":"110","profileVolume":"50","thermocyclerFormType":"thermocyclerProfile","id":"6b6b5be8-7602-400b-b3b6-6b884d86227d","stepType":"thermocycler","stepName":"Q5 Tm 68","stepDetails":""},"22e85f9f-5dfe-4324-988f-4426ac635b57":{"moduleId":"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType","setTemperature":"true","targetTemperature":"10","id":"22e85f9f-5dfe-4324-988f-4426ac635b57","stepType":"temperature","stepName":"temperature module state","stepDetails":"","stepNumber":0},"9130e663-8749-4ae7-8d43-092d2f293afe":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"50","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":true,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"25","stepType":"moveLiquid","stepName":"Q5 distribute: Tm68","stepDetails":"","id":"9130e663-8749-4ae7-8d43-092d2f293afe","dispense_touchTip_mmfromTop":null},"25396779-4b61-4266-91db-7e71661c5061":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"28.8","aspirate_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C1","D1"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"55","id":"25396779-4b61-4266-91db-7e71661c5061","stepType":"moveLiquid","stepName":"Move PCR to 10C block","stepDetails":"","stepNumber":0},"6adc5c02-a723-433d-8525-b32aa540b6df":{"id":"6adc5c02-a723-433d-8525-b32aa540b6df","stepType":"moveLiquid","stepName":"Transfer F1","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"25.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"43","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"2.5"},"15eeacba-785b-4129-8640-02e178e2e617":{"id":"15eeacba-785b-4129-8640-02e178e2e617","stepType":"moveLiquid","stepName":"Transfer R1","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"25.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"43","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"2.5"},"c899893d-9a28-4268-9b6c-209ceec7484d":{"moduleId":"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType","setTemperature":"true","targetTemperature":"10","id":"c899893d-9a28-4268-9b6c-209ceec7484d","stepType":"temperature","stepName":"temperature module state","stepDetails":"","stepNumber":0},"1e5d6e91-368b-4e6f-bde4-72e947aba73d":{"blockIsActive":true,"blockIsActiveHold":false,"blockTargetTemp":"10","blockTargetTempHold":null,"lidIsActive":false,"lidIsActiveHold":false,"lidOpen":true,"lidOpenHold":null,"lidTargetTemp":"","lidTargetTempHold":null,"moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":[],"profileItemsById":{},"profileTargetLidTemp":null,"profileVolume":null,"thermocyclerFormType":"thermocyclerState","id":"1e5d6e91-368b-4e6f-bde4-72e947aba73d","stepType":"thermocycler","stepName":"thermocycler","stepDetails":""},"2c06beaa-eb2c-4176-966d-884b676e90ee":{"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"50","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":true,"blowout_flowRate":"25","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"3.9","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"25","stepType":"moveLiquid","stepName":"Q5 distribute: Tm67","stepDetails":"","id":"2c06beaa-eb2c-4176-966d-884b676e90ee","dispense_touchTip_mmfromTop":null},"616bfbd0-20c6-46fc-8818-d1d1f0e638a4":{"id":"616bfbd0-20c6-46fc-8818-d1d1f0e638a4","stepType":"moveLiquid","stepName":"Transfer F1","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"25.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"43","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"2.5"},"2f169473-7063-4090-8147-8fa205353857":{"id":"2f169473-7063-4090-8147-8fa205353857","stepType":"moveLiquid","stepName":"Transfer R1","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":null,"aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"25.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["B11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","changeTip":"once","conditioning_checkbox":true,"conditioning_volume":"5","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"43","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":null,"dispense_mix_volume":null,"dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":true,"disposalVolume_volume":"5","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"multiDispense","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"2.5"},"6bfcd2ea-e9c2-4bc3-9650-430aed17dca4":{"blockIsActive":false,"blockIsActiveHold":true,"blockTargetTemp":null,"blockTargetTempHold":"10","lidIsActive":false,"lidIsActiveHold":true,"lidOpen":false,"lidOpenHold":true,"lidTargetTemp":null,"lidTargetTempHold":"37","moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":["2b1eabcf-3368-4b00-93e9-199420b95037","1d50b86f-5f8c-4537-808b-f049f901bf1b","7dcce4b4-ccad-4935-99e0-211844372afb"],"profileItemsById":{"2b1eabcf-3368-4b00-93e9-199420b95037":{"durationMinutes":"00","durationSeconds":"30","id":"2b1eabcf-3368-4b00-93e9-199420b95037","temperature":"98","title":"denature","type":"profileStep"},"1d50b86f-5f8c-4537-808b-f049f901bf1b":{"id":"1d50b86f-5f8c-4537-808b-f049f901bf1b","title":"","steps":[{"durationMinutes":"00","durationSeconds":"10","id":"2ed9985d-1920-4034-a608-28b2d62e38e8","temperature":"98","title":"d","type":"profileStep"},{"durationMinutes":"00","durationSeconds":"10","id":"e66646c5-9443-487c-a472-e07ac50fa557","temperature":"65","title":"a","type":"profileStep"},{"durationMinutes":"01","durationSeconds":"10","id":"832cd7a7-3562-45da-862d-e4120d496036","temperature":"72","title":"e","type":"profileStep"}],"type":"profileCycle","repetitions":"25"},"7dcce4b4-ccad-4935-99e0-211844372afb":{"durationMinutes":"02","durationSeconds":"00","id":"7dcce4b4-ccad-4935-99e0-211844372afb","temperature":"72","title":"final ext","type":"profileStep"}},"profileTargetLidTemp":"110","profileVolume":"50","thermocyclerFormType":"thermocyclerProfile","id":"6bfcd2ea-e9c2-4bc3-9650-430aed17dca4","stepType":"thermocycler","stepName":"Q5 Tm 65","stepDetails":""},"92919ef7-2411-4bc9-9f37-96b33666f8bb":{"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"28.8","aspirate_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A1","B1"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"55","id":"92919ef7-2411-4bc9-9f37-96b33666f8bb","stepType":"moveLiquid","stepName":"Move PCR to 10C block","stepDetails":"","stepNumber":0},"6705aa27-ac02-4787-8de7-e806dde4f05f":{"id":"6705aa27-ac02-4787-8de7-e806dde4f05f","stepType":"moveLiquid","stepName":"Transfer H2O","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"26.4","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A10"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":true,"dispense_mix_times":"5","dispense_mix_volume":"25","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"19"},"1d7e711f-88e6-42ce-85cd-45718dc8e698":{"id":"1d7e711f-88e6-42ce-85cd-45718dc8e698","stepType":"moveLiquid","stepName":"Transfer H2O","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"26.4","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["B10"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":true,"dispense_mix_times":"5","dispense_mix_volume":"25","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"19"},"c6a27936-66a4-4fb7-bc6f-00b1feb06884":{"id":"c6a27936-66a4-4fb7-bc6f-00b1feb06884","stepType":"moveLiquid","stepName":"Transfer template","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"33","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"33","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1"},"f7b1426b-4e38-4c89-bf3c-5793f4f6af9b":{"id":"f7b1426b-4e38-4c89-bf3c-5793f4f6af9b","stepType":"moveLiquid","stepName":"Transfer template","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"33","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H11"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"33","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"1"},"680fd73b-48b1-43b6-a586-747ce57342bd":{"id":"680fd73b-48b1-43b6-a586-747ce57342bd","stepType":"moveLiquid","stepName":"Transfer DpnI","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":false,"aspirate_airGap_volume":"","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"1","aspirate_flowRate":"7.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"4","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"4","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["H12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"25","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":false,"dispense_airGap_volume":"","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.5","dispense_flowRate":"25","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"4","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"4","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1","C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"glycerol50V1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"11.7","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"2"},"f7136876-6d56-4899-b370-8384affb5eb9":{"id":"f7136876-6d56-4899-b370-8384affb5eb9","stepType":"moveLiquid","stepName":"transfer","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"24","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["G12"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1","C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"10"},"d5c9baff-d0b3-42bb-b974-f3e2371b092e":{"id":"d5c9baff-d0b3-42bb-b974-f3e2371b092e","stepType":"moveLiquid","stepName":"Transfer H2O","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"33.0","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["C10"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":true,"dispense_mix_times":"5","dispense_mix_volume":"45","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["A1","B1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"43"},"78801764-49ec-4814-b46f-94d9cfe9d50d":{"id":"78801764-49ec-4814-b46f-94d9cfe9d50d","stepType":"moveLiquid","stepName":"Transfer H2O","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"33.0","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["D10"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","dispense_mix_checkbox":true,"dispense_mix_times":"5","dispense_mix_volume":"45","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["C1","D1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"43"},"b7a266ec-b29f-41b5-aa51-6fb6dd4d3213":{"id":"b7a266ec-b29f-41b5-aa51-6fb6dd4d3213","stepType":"moveLiquid","stepName":"transfer","stepDetails":"","stepNumber":0,"aspirate_airGap_checkbox":true,"aspirate_airGap_volume":"0.1","aspirate_delay_checkbox":true,"aspirate_delay_seconds":"0.2","aspirate_flowRate":"31.3","aspirate_labware":"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3","aspirate_mix_checkbox":false,"aspirate_mix_times":"1","aspirate_mix_volume":"50","aspirate_mmFromBottom":2,"aspirate_position_reference":"well-bottom","aspirate_retract_delay_seconds":"0","aspirate_retract_mmFromBottom":2,"aspirate_retract_speed":"50","aspirate_retract_x_position":0,"aspirate_retract_y_position":0,"aspirate_retract_position_reference":"well-top","aspirate_submerge_delay_seconds":"0","aspirate_submerge_speed":"100","aspirate_submerge_mmFromBottom":2,"aspirate_submerge_x_position":0,"aspirate_submerge_y_position":0,"aspirate_submerge_position_reference":"well-top","aspirate_touchTip_checkbox":false,"aspirate_touchTip_mmFromTop":-1,"aspirate_touchTip_speed":"30","aspirate_touchTip_mmFromEdge":"0.5","aspirate_wellOrder_first":"t2b","aspirate_wellOrder_second":"l2r","aspirate_wells_grouped":false,"aspirate_wells":["A1","B1","C1","D1"],"aspirate_x_position":0,"aspirate_y_position":0,"blowout_checkbox":false,"blowout_flowRate":"50","blowout_location":"dest_well","changeTip":"always","conditioning_checkbox":false,"conditioning_volume":"","dispense_airGap_checkbox":true,"dispense_airGap_volume":"0.1","dispense_delay_checkbox":true,"dispense_delay_seconds":"0.2","dispense_flowRate":"50","dispense_labware":"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2","dispense_mix_checkbox":false,"dispense_mix_times":"1","dispense_mix_volume":"50","dispense_mmFromBottom":2,"dispense_position_reference":"well-bottom","dispense_retract_delay_seconds":"0","dispense_retract_mmFromBottom":2,"dispense_retract_speed":"50","dispense_retract_x_position":0,"dispense_retract_y_position":0,"dispense_retract_position_reference":"well-top","dispense_submerge_delay_seconds":"0","dispense_submerge_speed":"100","dispense_submerge_mmFromBottom":2,"dispense_submerge_x_position":0,"dispense_submerge_y_position":0,"dispense_submerge_position_reference":"well-top","dispense_touchTip_checkbox":false,"dispense_touchTip_mmFromTop":-1,"dispense_touchTip_speed":"30","dispense_touchTip_mmFromEdge":"0.5","dispense_wellOrder_first":"t2b","dispense_wellOrder_second":"l2r","dispense_wells":["E1","F1","G1","H1"],"dispense_x_position":0,"dispense_y_position":0,"disposalVolume_checkbox":false,"disposalVolume_volume":"","dropTip_location":"0c55a7dd-a000-4ab5-ba2f-6e318b4d58c3:wasteChute","liquidClassesSupported":true,"liquidClass":"waterV1","nozzles":null,"path":"single","pipette":"63555313-4253-4347-be9c-8b6e64189bb7","preWetTip":false,"pushOut_checkbox":true,"pushOut_volume":"2","tipRack":"opentrons/opentrons_flex_96_filtertiprack_50ul/1","volume":"110"},"9e1dfa82-1e91-4c80-ab6b-0b7d38d0ea3b":{"id":"9e1dfa82-1e91-4c80-ab6b-0b7d38d0ea3b","stepType":"thermocycler","stepName":"Thermocycler: DpnI","stepDetails":"","stepNumber":0,"blockIsActive":false,"blockIsActiveHold":true,"blockTargetTemp":null,"blockTargetTempHold":"10","lidIsActive":false,"lidIsActiveHold":true,"lidOpen":false,"lidOpenHold":null,"lidTargetTemp":null,"lidTargetTempHold":"37","moduleId":"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType","orderedProfileItems":["0d2410d2-4601-4882-9846-cd876f80a7d2","e677c6e2-9936-443d-8611-cef44feca878"],"profileItemsById":{"0d2410d2-4601-4882-9846-cd876f80a7d2":{"durationMinutes":"30","durationSeconds":"00","id":"0d2410d2-4601-4882-9846-cd876f80a7d2","temperature":"37","title":"DpnI","type":"profileStep"},"e677c6e2-9936-443d-8611-cef44feca878":{"durationMinutes":"20","durationSeconds":"00","id":"e677c6e2-9936-443d-8611-cef44feca878","temperature":"65","title":"heat denature","type":"profileStep"}},"profileTargetLidTemp":"110","profileVolume":"100","thermocyclerFormType":"thermocyclerProfile"}},"orderedStepIds":["22e85f9f-5dfe-4324-988f-4426ac635b57","c899893d-9a28-4268-9b6c-209ceec7484d","1e5d6e91-368b-4e6f-bde4-72e947aba73d","2c06beaa-eb2c-4176-966d-884b676e90ee","616bfbd0-20c6-46fc-8818-d1d1f0e638a4","c6a27936-66a4-4fb7-bc6f-00b1feb06884","2f169473-7063-4090-8147-8fa205353857","6705aa27-ac02-4787-8de7-e806dde4f05f","6bfcd2ea-e9c2-4bc3-9650-430aed17dca4","92919ef7-2411-4bc9-9f37-96b33666f8bb","9130e663-8749-4ae7-8d43-092d2f293afe","6adc5c02-a723-433d-8525-b32aa540b6df","f7b1426b-4e38-4c89-bf3c-5793f4f6af9b","15eeacba-785b-4129-8640-02e178e2e617","1d7e711f-88e6-42ce-85cd-45718dc8e698","6b6b5be8-7602-400b-b3b6-6b884d86227d","25396779-4b61-4266-91db-7e71661c5061","680fd73b-48b1-43b6-a586-747ce57342bd","f7136876-6d56-4899-b370-8384affb5eb9","d5c9baff-d0b3-42bb-b974-f3e2371b092e","78801764-49ec-4814-b46f-94d9cfe9d50d","b7a266ec-b29f-41b5-aa51-6fb6dd4d3213","9e1dfa82-1e91-4c80-ab6b-0b7d38d0ea3b"],"pipettes":{"63555313-4253-4347-be9c-8b6e64189bb7":{"pipetteName":"p50_single_flex"},"8e36439e-b289-4759-8202-396adc7c9436":{"pipetteName":"p50_multi_flex"}},"modules":{"7c5b741b-c2ac-4c8e-9f34-f51291c0301b:thermocyclerModuleType":{"model":"thermocyclerModuleV2"},"ab876e4b-79ff-4c3e-8f5f-220e5289df0f:heaterShakerModuleType":{"model":"heaterShakerModuleV1"},"d0f9135f-5d38-4678-baa5-3c6c9ebafd66:temperatureModuleType":{"model":"temperatureModuleV2"}},"labware":{"c4037252-d31d-48da-bc54-bf3427ca692d:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{"displayName":"Opentrons Flex 96 Filter Tip Rack 50 µL","labwareDefURI":"opentrons/opentrons_flex_96_filtertiprack_50ul/1"},"a8e358d7-441e-424e-a17d-2696f9d818ae:opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2":{"displayName":"Opentrons Tough 96 Well Plate 200 µL PCR Full Skirt (1)","labwareDefURI":"opentrons/opentrons_96_wellplate_200ul_pcr_full_skirt/2"},"9058e65f-a2d8-43dc-949b-5f08562afeb6:opentrons/opentrons_96_well_aluminum_block/1":{"displayName":"Opentrons 96 Well Aluminum Block","labwareDefURI":"opentrons/opentrons_96_well_aluminum_block/1"},"e12464ad-5c4e-4bd8-9585-e2001d8068f7:opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3":{"displayName":"(Retired) Armadillo 96 Well Plate 200 µL PCR Full Skirt","labwareDefURI":"opentrons/armadillo_96_wellplate_200ul_pcr_full_skirt/3"},"1a5fd57e-53b2-42ee-9803-80f9ea6be0cd:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{"displayName":"Opentrons Flex 96 Filter Tip Rack 50 µL (1)","labwareDefURI":"opentrons/opentrons_flex_96_filtertiprack_50ul/1"},"d267ddb1-a4ed-4278-9a0b-3c076d137ece:opentrons/opentrons_flex_96_filtertiprack_50ul/1":{"displayName":"Opentrons Flex 96 Filter Tip Rack 50 µL (2)","labwareDefURI":"opentrons/opentrons_flex_96_filtertiprack_50ul/1"}}}},"metadata":{"protocolName":"Q5 PCR (Tm65+Tm68) + DpnI","author":"Evan Tjeerdema - SIO","description":"PCR for HiFi assembly. PCR off sequence fragments & plasmid. 10C hold at the end. Oligos and DNA fragments held at RT. Q5 and DpnI held at 10C. ","created":1753768164600,"lastModified":1756522456470,"category":null,"subcategory":null,"tags":[],"source":"Protocol Designer"}}"""
+
+# Liquid Class Properties:
+
+DISTRIBUTE_STEP_4_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "delay": {"enabled": True, "duration": 1},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "push_out_by_volume": [(0, 3.9)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "conditioning_by_volume": [(0, 0)],
+        "disposal_by_volume": [(0, 0)],
+    },
+}}}
+
+DISTRIBUTE_STEP_5_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 43)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 43)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "conditioning_by_volume": [(0, 5)],
+        "disposal_by_volume": [(0, 5)],
+    },
+}}}
+
+TRANSFER_STEP_6_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 33)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 33)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 7)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+TRANSFER_STEP_8_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 26.4)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": True, "repetitions": 5, "volume": 25},
+    },
+}}}
+
+TRANSFER_STEP_10_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 28.8)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+DISTRIBUTE_STEP_18_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 7.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "delay": {"enabled": True, "duration": 1},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "push_out_by_volume": [(0, 11.7)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 25)],
+        "delay": {"enabled": True, "duration": 0.5},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 4,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 4,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 25},
+        },
+        "correction_by_volume": [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+        "conditioning_by_volume": [(0, 0)],
+        "disposal_by_volume": [(0, 0)],
+    },
+}}}
+
+DISTRIBUTE_STEP_19_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 24)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": False},
+    },
+    "multi_dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": True, "location": "trash", "flow_rate": 50},
+        },
+        "correction_by_volume": [(0, 0)],
+        "conditioning_by_volume": [(0, 0)],
+        "disposal_by_volume": [(0, 0)],
+    },
+}}}
+
+TRANSFER_STEP_20_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 33)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": True, "repetitions": 5, "volume": 45},
+    },
+}}}
+
+TRANSFER_STEP_22_PROPERTIES = {"flex_1channel_50": {"opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+    "aspirate": {
+        "aspirate_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 31.3)],
+        "pre_wet": False,
+        "correction_by_volume": [(0, 0)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "mix": {"enabled": False},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+        },
+    },
+    "dispense": {
+        "dispense_position": {
+            "offset": {"x": 0, "y": 0, "z": 2},
+            "position_reference": "well-bottom",
+        },
+        "flow_rate_by_volume": [(0, 50)],
+        "delay": {"enabled": True, "duration": 0.2},
+        "submerge": {
+            "delay": {"enabled": False},
+            "speed": 100,
+            "start_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+        },
+        "retract": {
+            "air_gap_by_volume": [(0, 0.1)],
+            "delay": {"enabled": False},
+            "end_position": {
+                "offset": {"x": 0, "y": 0, "z": 2},
+                "position_reference": "well-top",
+            },
+            "speed": 50,
+            "touch_tip": {"enabled": False},
+            "blowout": {"enabled": False},
+        },
+        "correction_by_volume": [(0, 0)],
+        "push_out_by_volume": [(0, 2)],
+        "mix": {"enabled": False},
+    },
+}}}
+
+# Protocol Designer data, moved to a gzip file next to this one. Restore it
+# with `python tools/designer_blob.py unpack` before reopening in the designer.
+DESIGNER_APPLICATION_SIDECAR = "Q5_PCR_Tm65Tm68__DpnI.designer.json.gz"
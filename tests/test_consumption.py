@@ -0,0 +1,57 @@
+"""ConsumptionTracker follows loaded liquids into the wells they are moved to."""
+import json
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from estimate_runtime import estimate  # noqa: E402
+from protocol_recorder import (  # noqa: E402
+    RecordingLiquid,
+    RecordingLiquidClass,
+    RecordingProtocol,
+    load_protocol,
+    record,
+)
+
+HIFI = os.path.join(REPO_ROOT, "HiFi_Assembly_v10 (1).py")
+Q5 = os.path.join(REPO_ROOT, "Q5_PCR_Tm65Tm68__DpnI.py")
+PLATE = "opentrons_96_wellplate_200ul_pcr_full_skirt"
+
+
+def test_liquids_follow_transfers():
+    module = load_protocol(HIFI)
+    context = RecordingProtocol({}, HIFI)
+    source = context.load_labware(PLATE, "C1")
+    dest = context.load_labware(PLATE, "B1")
+    tracker = module.ConsumptionTracker(context, {})
+    tracker.load_liquid(source, ["A1"], RecordingLiquid("PCR product", None, None), 30)
+    tracker.load_liquid(source, [f"{row}2" for row in "ABCDEFGH"], RecordingLiquid("NF H2O", None, None), 30)
+    liquid_class = RecordingLiquidClass("water", {})
+
+    single = tracker.track(context.load_instrument("flex_1channel_50", "right"))
+    single.transfer_with_liquid_class(liquid_class=liquid_class, volume=2, source=[source["A1"]], dest=[dest["C3"]])
+    multi = tracker.track(context.load_instrument("flex_8channel_50", "left"))
+    multi.distribute_with_liquid_class(
+        liquid_class=liquid_class, volume=5, source=[source["A2"]], dest=[dest["A3"], dest["A4"]],
+    )
+
+    assert tracker.liquids_in(dest, "C3") == {"PCR product", "NF H2O"}
+    assert tracker.liquids_in(dest, "H4") == {"NF H2O"}
+    assert tracker.liquids_in(dest, "A5") == set()
+    assert tracker.liquids_in(source, "A1") == {"PCR product"}
+
+
+@pytest.mark.parametrize("path", [Q5, HIFI], ids=os.path.basename)
+def test_report_counts_the_tips_picked_up(path):
+    reports = [
+        command.params["msg"].split(" ", 1)[1]
+        for command in record(path).commands
+        if command.name == "comment" and command.params["msg"].startswith("CONSUMPTION-JSON ")
+    ]
+    assert len(reports) == 1
+    tips_used = json.loads(reports[0])["tips_used"]
+    assert sum(tips_used.values()) == estimate(path).counters["tips_used"] > 0
@@ -0,0 +1,46 @@
+"""HiFi's backbone multi-dispense falls back to a parked tip per well that holds template."""
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from protocol_recorder import RecordingLiquidClass, RecordingProtocol, load_protocol  # noqa: E402
+
+HIFI = os.path.join(REPO_ROOT, "HiFi_Assembly_v10 (1).py")
+PLATE = "opentrons_96_wellplate_200ul_pcr_full_skirt"
+TIPS = "opentrons_flex_96_filtertiprack_50ul"
+
+
+def test_template_wells_take_a_parked_tip_each():
+    module = load_protocol(HIFI)
+    context = RecordingProtocol({}, HIFI)
+    source_plate = context.load_labware(PLATE, "C1")
+    dest_plate = context.load_labware(PLATE, "B1")
+    pipette = context.load_instrument("flex_1channel_50", "right", tip_racks=[context.load_labware(TIPS, "A2")])
+    waste_chute = context.load_waste_chute()
+    tip_parking = module.TipParking(context.load_labware(TIPS, "B3"), waste_chute)
+
+    saved = module.distribute_contact_free(
+        pipette,
+        volume=1.5,
+        source=source_plate["A11"],
+        dest_plate=dest_plate,
+        dest_wells=["A1", "B1", "C1", "D1"],
+        template_wells={"B1", "D1"},
+        multi_dispense_class=RecordingLiquidClass("transfer_step_10", {}),
+        per_well_class=RecordingLiquidClass("transfer_step_10_per_well", {}),
+        tip_parking=tip_parking,
+    )
+
+    assert saved == 1
+    calls = [command for command in context.commands if command.name.endswith("_with_liquid_class")]
+    assert [command.name for command in calls] == [
+        "distribute_with_liquid_class", "transfer_with_liquid_class", "transfer_with_liquid_class",
+    ]
+    assert {well.well_name for well in calls[0].params["dest"]} == {"A1", "C1"}
+    assert [command.params["dest"][0].well_name for command in calls[1:]] == ["B1", "D1"]
+    assert all(command.params["new_tip"] == "once" for command in calls)
+    drops = [command.params["location"] for command in context.commands if command.name == "drop_tip"]
+    assert [well.well_name for well in drops] == ["A1", "B1", "C1"]
+    assert tip_parking.parked == 3
@@ -0,0 +1,109 @@
+"""HiFi's transfer planning: fragment passes, final additions, travel order and tip parking."""
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from protocol_recorder import RecordingProtocol, RecordingWasteChute, load_protocol  # noqa: E402
+
+HIFI = os.path.join(REPO_ROOT, "HiFi_Assembly_v10 (1).py")
+PLATE = "opentrons_96_wellplate_200ul_pcr_full_skirt"
+TIPS = "opentrons_flex_96_filtertiprack_50ul"
+ROWS = "ABCDEFGH"
+
+hifi = load_protocol(HIFI)
+
+
+def expand(passes):
+    """Every (source, dest, volume) a list of passes moves, 8-channel pairs written out per row."""
+    moved = []
+    for transfer_pass in passes:
+        for source, dest in zip(transfer_pass.sources, transfer_pass.dests):
+            if transfer_pass.channels == 8:
+                moved.extend((row + source[1:], row + dest[1:], transfer_pass.volume) for row in ROWS)
+            else:
+                moved.append((source, dest, transfer_pass.volume))
+    return moved
+
+
+def test_full_columns_become_eight_channel_passes():
+    assembly_map = {f"{row}1": [(f"{row}5", 2)] for row in ROWS}
+    assembly_map["A2"] = [("C7", 1.5)]
+    assembly_map["B2"] = [("C7", 1.5), ("D7", 1.5)]
+
+    passes = hifi.plan_fragment_transfers(assembly_map)
+
+    assert passes[0] == hifi.TransferPass(8, 2, ["A5"], ["A1"])
+    assert all(transfer_pass.channels == 1 for transfer_pass in passes[1:])
+    assert sorted(expand(passes)) == sorted(
+        (source, dest, volume) for dest, fragments in assembly_map.items() for source, volume in fragments
+    )
+
+
+def test_passes_cover_the_assembly_map():
+    passes = hifi.plan_fragment_transfers(hifi.ASSEMBLY_MAP)
+    assert sorted(expand(passes)) == sorted(
+        (source, dest, volume) for dest, fragments in hifi.ASSEMBLY_MAP.items() for source, volume in fragments
+    )
+
+
+def test_final_additions_flag_the_last_pair_into_each_well():
+    passes = [
+        hifi.TransferPass(8, 2, ["A5"], ["A1"]),
+        hifi.TransferPass(1, 1.5, ["C7", "D7", "E7"], ["B1", "B2", "B1"]),
+    ]
+    assert hifi.final_additions(passes) == [[True], [False, True, True]]
+
+    # A later 8-channel pass is the last addition to every well of its column.
+    passes = [
+        hifi.TransferPass(1, 1.5, ["C7"], ["B1"]),
+        hifi.TransferPass(8, 2, ["A5"], ["A1"]),
+    ]
+    assert hifi.final_additions(passes) == [[False], [True]]
+
+
+def test_travel_order_walks_a_column_from_its_start():
+    context = RecordingProtocol({}, HIFI)
+    plate = context.load_labware(PLATE, "B1")
+    wells = [plate[f"{row}1"] for row in "DGABHCEF"]
+
+    ordered = hifi.travel_order(wells, start=plate["A1"])
+
+    assert [well.well_name for well in ordered] == [f"{row}1" for row in ROWS]
+
+
+def test_tip_parking_fills_single_tips_from_the_left_and_columns_from_the_right():
+    context = RecordingProtocol({}, HIFI)
+    rack = context.load_labware(TIPS, "C2")
+    single = context.load_instrument("flex_1channel_50", "right")
+    multi = context.load_instrument("flex_8channel_50", "left")
+    waste_chute = context.load_waste_chute()
+    parking = hifi.TipParking(rack, waste_chute)
+
+    parking.drop(multi)
+    for _ in range(9):
+        parking.drop(single)
+
+    drops = [command.params["location"] for command in context.commands if command.name == "drop_tip"]
+    assert [well.well_name for well in drops] == ["A12"] + [f"{row}1" for row in ROWS] + ["A2"]
+    assert parking.parked == 17
+
+    parking.dispose(context)
+    moves = [command for command in context.commands if command.name == "move_labware"]
+    assert [(move.params["labware"], move.params["new_location"]) for move in moves] == [(rack, waste_chute)]
+    assert parking.parked == 0
+
+
+def test_full_tip_parking_falls_back_to_the_trash():
+    context = RecordingProtocol({}, HIFI)
+    multi = context.load_instrument("flex_8channel_50", "left")
+    parking = hifi.TipParking(context.load_labware(TIPS, "C2"), context.load_waste_chute())
+
+    for _ in range(13):
+        parking.drop(multi)
+
+    drops = [command.params["location"] for command in context.commands if command.name == "drop_tip"]
+    assert [well.well_name for well in drops[:12]] == [f"A{column}" for column in range(12, 0, -1)]
+    assert isinstance(drops[12], RecordingWasteChute)
+    assert parking.parked == 96
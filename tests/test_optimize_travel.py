@@ -0,0 +1,38 @@
+"""The travel optimizer leaves every mixing dispense after the other additions to its well."""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from optimize_travel import _respects_order, find_blocks, solve_open_path  # noqa: E402
+from protocol_recorder import record  # noqa: E402
+
+PROTOCOLS = [
+    os.path.join(REPO_ROOT, "Q5_PCR_Tm65Tm68__DpnI.py"),
+    os.path.join(REPO_ROOT, "HiFi_Assembly_v10 (1).py"),
+]
+
+
+@pytest.mark.parametrize("path", PROTOCOLS, ids=os.path.basename)
+def test_mixing_dispense_stays_last(path):
+    context = record(path)
+    pipettes = {
+        repr(command.params["instrument"]): command.params["instrument"]
+        for command in context.commands
+        if command.name == "load_instrument"
+    }
+    mixing = 0
+    for block in find_blocks(context.commands, pipettes):
+        order = solve_open_path(block)
+        assert _respects_order(block, order), block.step
+        for place, index in enumerate(order):
+            visit = block.visits[index]
+            if not visit.mixes:
+                continue
+            mixing += 1
+            later = [block.visits[other] for other in order[place + 1:]]
+            assert not [other for other in later if set(other.writes) & set(visit.writes)], visit.label
+    assert mixing
@@ -0,0 +1,42 @@
+"""The staged thermocycler profiles run the same temperature trace as the designer's flat ones."""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from designer_blob import read_designer_application  # noqa: E402
+from designer_compiler import DesignerCompiler, Profile  # noqa: E402
+from protocol_recorder import record  # noqa: E402
+
+Q5 = os.path.join(REPO_ROOT, "Q5_PCR_Tm65Tm68__DpnI.py")
+
+
+def designer_traces(protocol_path):
+    """The flat profile of every thermocycler step in the protocol's Protocol Designer data."""
+    return {
+        step.marker: [trace_step for stage, repetitions in op.stages for trace_step in stage * repetitions]
+        for step in DesignerCompiler(read_designer_application(protocol_path)).lower()
+        for op in step.ops
+        if isinstance(op, Profile)
+    }
+
+
+def recorded_traces(context):
+    """The temperature trace each step's execute_profile calls run, repetitions written out."""
+    traces = {}
+    for command in context.commands:
+        if command.name in ("execute_profile", "start_execute_profile"):
+            traces.setdefault(command.step, []).extend(list(command.params["steps"]) * command.params["repetitions"])
+    return traces
+
+
+@pytest.mark.parametrize("pipeline_pcr", [False, True])
+def test_q5_profiles_match_designer(pipeline_pcr):
+    expected = designer_traces(Q5)
+    recorded = recorded_traces(record(Q5, settings={"PIPELINE_PCR": pipeline_pcr}))
+    assert set(expected) == {"Step 9", "Step 16", "Step 23"}
+    for step, trace in expected.items():
+        assert recorded[step] == trace, step
@@ -0,0 +1,88 @@
+"""Q5's planning helpers: trip splitting and the plate map CSV."""
+import os
+import sys
+import types
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from protocol_recorder import RecordingCsvFile, load_protocol  # noqa: E402
+
+Q5 = os.path.join(REPO_ROOT, "Q5_PCR_Tm65Tm68__DpnI.py")
+
+q5 = load_protocol(Q5)
+
+HEADER = ["name", "master_mix", "forward", "reverse", "template", "water", "digest_water"]
+
+
+def trip_properties(correction, air_gap=1):
+    return {
+        "flex_1channel_50": {
+            "opentrons/opentrons_flex_96_filtertiprack_50ul/1": {
+                "aspirate": {
+                    "correction_by_volume": correction,
+                    "retract": {"air_gap_by_volume": [(0, air_gap)]},
+                },
+            },
+        },
+    }
+
+
+def test_plan_trips_keeps_one_trip_when_it_fits():
+    assert q5.plan_trips(27.5, q5.TRANSFER_STEP_10_PROPERTIES) == [27.5]
+
+
+def test_plan_trips_prefers_equal_trips_on_a_tie():
+    # No correction: a full trip is 50 uL less the 0.1 uL air gap.
+    assert q5.plan_trips(50, q5.TRANSFER_STEP_10_PROPERTIES) == [25, 25]
+
+
+def test_plan_trips_picks_the_split_with_the_smaller_correction():
+    # Mid-range volumes need the largest correction, so one full trip and a
+    # small remainder beat two equal trips.
+    trips = q5.plan_trips(60, trip_properties([(0, 0), (30, 3), (49, 0)]))
+    assert trips == [49, 11]
+    assert q5.plan_trips(60, trip_properties([(0, 0), (50, 0)])) == [30, 30]
+
+
+def parameters(rows=None):
+    if rows is None:
+        plate_map = RecordingCsvFile()
+    else:
+        plate_map = types.SimpleNamespace(parse_as_csv=lambda: rows)
+    return types.SimpleNamespace(plate_map=plate_map, annealing_1=65.0, annealing_2=68.5)
+
+
+def test_plate_map_defaults_without_a_file():
+    layouts = q5.read_plate_map(parameters())
+    assert [layout.name for layout in layouts] == ["Tm65", "Tm68.5"]
+    assert [layout._replace(name="") for layout in layouts] == [
+        layout._replace(name="") for layout in q5.DEFAULT_PLATE_MAP
+    ]
+
+
+def test_plate_map_reads_columns_in_any_order():
+    header = list(reversed(HEADER))
+    rows = [
+        [" " + cell + " " for cell in header],
+        list(reversed(["GFP", "A12", "A11", "B11", "H11", "A10", "C10"])),
+        ["", "", "", "", "", "", ""],
+        list(reversed(["RFP", "B12", "C11", "D11", "G11", "B10", "D10"])),
+    ]
+    layouts = q5.read_plate_map(parameters(rows))
+    assert layouts == [
+        q5.PcrLayout("GFP", "A12", "A11", "B11", "H11", "A10", "C10"),
+        q5.PcrLayout("RFP", "B12", "C11", "D11", "G11", "B10", "D10"),
+    ]
+
+
+@pytest.mark.parametrize("rows, message", [
+    ([], "empty"),
+    ([HEADER[:-1], ["PCR 1", "A12", "A11", "B11", "H11", "A10"]], "missing columns: digest_water"),
+    ([HEADER, ["PCR 1", "A12", "A11", "B11", "H11", "A10", "C10"]], "lists 1 PCRs"),
+])
+def test_plate_map_rejects_bad_files(rows, message):
+    with pytest.raises(ValueError, match=message):
+        q5.read_plate_map(parameters(rows))
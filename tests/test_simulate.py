@@ -0,0 +1,49 @@
+"""Both protocols, and what the designer compiler makes of them, run through the Opentrons simulator."""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+import designer_compiler  # noqa: E402
+
+simulate = pytest.importorskip(
+    "opentrons.simulate", reason="the simulator tests need requirements-test.txt installed",
+)
+
+PROTOCOLS = [
+    os.path.join(REPO_ROOT, "Q5_PCR_Tm65Tm68__DpnI.py"),
+    os.path.join(REPO_ROOT, "HiFi_Assembly_v10 (1).py"),
+]
+
+
+def run_simulator(path):
+    """The simulator's run log for the protocol at path."""
+    with open(path, encoding="utf-8") as handle:
+        run_log, _ = simulate.simulate(handle, file_name=os.path.basename(path))
+    return run_log
+
+
+@pytest.mark.parametrize("path", PROTOCOLS, ids=os.path.basename)
+def test_protocol_simulates(path):
+    assert run_simulator(path)
+
+
+@pytest.mark.parametrize("path", PROTOCOLS, ids=os.path.basename)
+def test_compiled_protocol_simulates(path, tmp_path):
+    output = str(tmp_path / "compiled.py")
+    designer_compiler.main([path, "-o", output])
+    assert run_simulator(output)
+
+
+def test_heater_shaker_mix_simulates(tmp_path):
+    with open(PROTOCOLS[1], encoding="utf-8") as handle:
+        source = handle.read()
+    default = 'ASSEMBLY_MIX = "last_fragment"'
+    assert default in source
+    path = tmp_path / "heater_shaker_mix.py"
+    path.write_text(source.replace(default, 'ASSEMBLY_MIX = "heater_shaker"'), encoding="utf-8")
+    texts = [entry["payload"]["text"] for entry in run_simulator(str(path))]
+    assert any("Shake at" in text for text in texts)
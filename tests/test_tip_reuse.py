@@ -0,0 +1,79 @@
+"""The tip-reuse analyzer keeps replicate reactions on their own tips."""
+import os
+import sys
+import textwrap
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from tip_reuse import analyze, rewrite_once  # noqa: E402
+
+# Q5's original Steps 4-10 and 17 in miniature: two replicate reactions built
+# on the thermocycler plate, moved to the cold block and back with
+# new_tip="always", plus water into two fresh wells.
+REPLICATES_PROTOCOL = textwrap.dedent('''
+    requirements = {"robotType": "Flex", "apiLevel": "2.27"}
+
+
+    def run(protocol):
+        tip_rack = protocol.load_labware("opentrons_flex_96_filtertiprack_50ul", "A2")
+        cycler_plate = protocol.load_labware("opentrons_96_wellplate_200ul_pcr_full_skirt", "B1")
+        cold_block = protocol.load_labware("opentrons_96_wellplate_200ul_pcr_full_skirt", "C1")
+        pipette = protocol.load_instrument("flex_1channel_50", "right", tip_racks=[tip_rack])
+        waste_chute = protocol.load_waste_chute()
+        cold_block.load_liquid(wells=["A12"], liquid=protocol.define_liquid("Q5MM"), volume=125)
+        cold_block.load_liquid(wells=["A11"], liquid=protocol.define_liquid("F1"), volume=20)
+        cold_block.load_liquid(wells=["A10"], liquid=protocol.define_liquid("NF H2O"), volume=200)
+        liquid_class = protocol.define_liquid_class(
+            name="transfer", base_liquid_class=protocol.get_liquid_class("water"), properties={},
+        )
+        reactions = [cycler_plate["A1"], cycler_plate["B1"]]
+        products = [cold_block["A1"], cold_block["B1"]]
+
+        # Step 4:
+        pipette.distribute_with_liquid_class(
+            volume=25, source=[cold_block["A12"]], dest=reactions, new_tip="once",
+            trash_location=waste_chute, liquid_class=liquid_class,
+        )
+
+        # Step 5:
+        pipette.distribute_with_liquid_class(
+            volume=2.5, source=[cold_block["A11"]], dest=reactions, new_tip="once",
+            trash_location=waste_chute, liquid_class=liquid_class,
+        )
+
+        # Step 8:
+        pipette.transfer_with_liquid_class(
+            volume=20, source=[cold_block["A10"]] * 2, dest=[cold_block["C1"], cold_block["D1"]],
+            new_tip="always", trash_location=waste_chute, liquid_class=liquid_class,
+        )
+
+        # Step 10:
+        pipette.transfer_with_liquid_class(
+            volume=27.5, source=reactions, dest=products, new_tip="always",
+            trash_location=waste_chute, liquid_class=liquid_class,
+        )
+
+        # Step 17:
+        pipette.transfer_with_liquid_class(
+            volume=27.5, source=products, dest=reactions, new_tip="always",
+            trash_location=waste_chute, liquid_class=liquid_class,
+        )
+''')
+
+
+def test_replicate_moves_keep_a_tip_each(tmp_path):
+    path = tmp_path / "replicates.py"
+    path.write_text(REPLICATES_PROTOCOL, encoding="utf-8")
+    findings = {finding.step: finding for finding in analyze(str(path))}
+
+    assert findings["Step 8"].rewrite == "once"
+    for step in ("Step 10", "Step 17"):
+        assert findings[step].rewrite == "", step
+        assert "reaction in" in findings[step].note, step
+
+    rewritten, skipped = rewrite_once(
+        REPLICATES_PROTOCOL, [finding.line for finding in findings.values() if finding.rewrite == "once"],
+    )
+    assert not skipped
+    assert rewritten.count('new_tip="always"') == 2
@@ -0,0 +1,51 @@
+"""The volume ledger spreads an 8-channel call over every well of the column."""
+import os
+import sys
+import textwrap
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+from volume_ledger import check  # noqa: E402
+
+# HiFi's Step 9 in miniature: a full-column transfer from a plate that was
+# never given a nozzle layout, so all eight nozzles draw and dispense.
+FULL_COLUMN_PROTOCOL = textwrap.dedent('''
+    requirements = {"robotType": "Flex", "apiLevel": "2.27"}
+
+
+    def run(protocol):
+        tip_rack = protocol.load_labware("opentrons_flex_96_filtertiprack_50ul", "A2")
+        source = protocol.load_labware("opentrons_96_wellplate_200ul_pcr_full_skirt", "C1")
+        dest = protocol.load_labware("opentrons_96_wellplate_200ul_pcr_full_skirt", "B1")
+        pipette = protocol.load_instrument("flex_8channel_50", "left", tip_racks=[tip_rack])
+        waste_chute = protocol.load_waste_chute()
+        source.load_liquid(
+            wells=[f"{row}12" for row in "ABCDEFGH"], liquid=protocol.define_liquid("HiFi assembly MM"), volume=25,
+        )
+        liquid_class = protocol.define_liquid_class(
+            name="transfer", base_liquid_class=protocol.get_liquid_class("water"), properties={},
+        )
+
+        # Step 9:
+        pipette.transfer_with_liquid_class(
+            volume=20, source=[source["A12"]], dest=[dest["A1"]], new_tip="once",
+            trash_location=waste_chute, liquid_class=liquid_class,
+        )
+''')
+
+
+def test_full_column_transfer_covers_the_column(tmp_path):
+    path = tmp_path / "full_column.py"
+    path.write_text(FULL_COLUMN_PROTOCOL, encoding="utf-8")
+    ledger = check(str(path))
+
+    assert not ledger.overdraws
+    needed = {item.well: item.needed for item in ledger.load_volumes(0)}
+    assert needed == {f"{row}12": 20 for row in "ABCDEFGH"}
+    volumes = {
+        labware.name.split("@")[-1]: labware.volume.reshape(labware.rows, labware.columns)
+        for labware in ledger.labware.values()
+    }
+    assert list(volumes["C1"][:, 11]) == [5] * 8
+    assert list(volumes["B1"][:, 0]) == [20] * 8
@@ -0,0 +1,186 @@
+"""Benchmark the protocols and flag regressions against a stored baseline.
+
+Every protocol is recorded and estimated as estimate_runtime.py does, and the
+totals and per-step figures are compared with the baseline in a JSON history
+file. Any figure that got slower or uses more tips than in the baseline is
+flagged, and the exit status is 1. The history is only written on request:
+--record appends the run together with the commit it was measured at, and
+--update-baseline makes it the new baseline.
+
+    python tools/benchmark.py                      # every protocol in the repository
+    python tools/benchmark.py --record
+    python tools/benchmark.py Q5_PCR_Tm65Tm68__DpnI.py --update-baseline
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from estimate_runtime import estimate
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.path.join(REPO_ROOT, "tools", "benchmarks.json")
+
+# Figures that may not grow. Seconds get the --tolerance slack; counts none.
+GUARDED_SECONDS = ("critical_path_seconds", "robot_seconds", "thermocycler_idle_seconds")
+GUARDED_COUNTS = ("tips_used", "tip_pickups", "waste_chute_trips")
+# Reported next to the guarded figures, never flagged.
+REPORTED = ("aspirates", "dispenses", "gantry_mm", "analysis_seconds")
+
+
+class Regression:
+    def __init__(self, protocol: str, metric: str, baseline: float, current: float) -> None:
+        self.protocol = protocol
+        self.metric = metric
+        self.baseline = baseline
+        self.current = current
+
+    def __str__(self) -> str:
+        return f"{self.protocol}: {self.metric} {self.baseline:g} -> {self.current:g}"
+
+
+def protocol_paths() -> List[str]:
+    """The protocol files at the top of the repository, without instrumented or compiled copies."""
+    return sorted(
+        path for path in glob.glob(os.path.join(REPO_ROOT, "*.py"))
+        if not path.endswith(("_steps.py", "_compiled.py"))
+    )
+
+
+def measure(path: str, non_blocking_modules: bool = False) -> Dict[str, Any]:
+    """Totals, counters and per-step seconds and counters of one protocol."""
+    started = time.perf_counter()
+    result = estimate(path, non_blocking_modules=non_blocking_modules)
+    analysis_seconds = time.perf_counter() - started
+    step_counters = result.step_counters()
+    steps = {
+        step: {"seconds": round(sum(totals.values()), 1), **step_counters[step]}
+        for step, totals in result.step_totals().items()
+    }
+    return {
+        "critical_path_seconds": round(result.critical_path_seconds, 1),
+        "robot_seconds": round(result.robot_seconds, 1),
+        **{name: round(value, 1) for name, value in result.counters.items()},
+        "analysis_seconds": round(analysis_seconds, 3),
+        "steps": steps,
+    }
+
+
+def current_commit() -> Optional[str]:
+    """Short hash of HEAD, marked "+dirty" when the tree has changes; None outside git."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+dirty" if status else "")
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], protocol: str, tolerance: float) -> List[Regression]:
+    """Every guarded figure of `current` that grew past `baseline`, totals first, then steps."""
+    regressions = []
+    for metric in GUARDED_SECONDS + GUARDED_COUNTS:
+        slack = tolerance if metric in GUARDED_SECONDS else 0
+        if metric in baseline and current[metric] > baseline[metric] + slack:
+            regressions.append(Regression(protocol, metric, baseline[metric], current[metric]))
+    for step, figures in current["steps"].items():
+        before = baseline["steps"].get(step)
+        if before is None:
+            continue
+        if figures["seconds"] > before["seconds"] + tolerance:
+            regressions.append(Regression(protocol, f"{step} seconds", before["seconds"], figures["seconds"]))
+        for metric in GUARDED_COUNTS:
+            if figures.get(metric, 0) > before.get(metric, 0):
+                regressions.append(Regression(protocol, f"{step} {metric}", before.get(metric, 0), figures[metric]))
+    return regressions
+
+
+def print_comparison(protocol: str, baseline: Optional[Dict[str, Any]], current: Dict[str, Any]) -> None:
+    print(protocol)
+    for metric in GUARDED_SECONDS + GUARDED_COUNTS + REPORTED:
+        if metric not in current:
+            continue
+        if baseline is None or metric not in baseline:
+            print(f"  {metric:<28} {current[metric]:>12g}")
+        else:
+            delta = current[metric] - baseline[metric]
+            print(f"  {metric:<28} {current[metric]:>12g}  baseline {baseline[metric]:>12g}  {delta:+g}")
+
+
+def load_history(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"baseline": None, "runs": []}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("protocols", nargs="*", help="protocol files; every protocol in the repository by default")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="seconds a time may grow unflagged")
+    parser.add_argument("--record", action="store_true", help="append this run to the history")
+    parser.add_argument("--update-baseline", action="store_true", help="make this run the baseline")
+    parser.add_argument(
+        "--non-blocking-modules",
+        action="store_true",
+        help="record at API 2.27, with start_execute_profile/wait_for_tasks available",
+    )
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    run = {
+        "commit": current_commit(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "non_blocking_modules": args.non_blocking_modules,
+        "protocols": {
+            os.path.basename(path): measure(path, args.non_blocking_modules)
+            for path in (args.protocols or protocol_paths())
+        },
+    }
+
+    baseline = history["baseline"]
+    if baseline is not None and baseline["non_blocking_modules"] != args.non_blocking_modules:
+        print("Baseline was measured with different module behaviour; not comparing.\n")
+        baseline = None
+    regressions = []
+    for protocol, figures in run["protocols"].items():
+        before = baseline["protocols"].get(protocol) if baseline else None
+        print_comparison(protocol, before, figures)
+        if before is not None:
+            regressions += compare(before, figures, protocol, args.tolerance)
+    print()
+
+    if args.update_baseline or (args.record and history["baseline"] is None):
+        history["baseline"] = run
+        print(f"Baseline set to {run['commit']}")
+    if args.record:
+        history["runs"].append(run)
+    if args.record or args.update_baseline:
+        with open(args.history, "w", encoding="utf-8") as handle:
+            json.dump(history, handle, indent=1)
+            handle.write("\n")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  {regression}")
+        if not args.update_baseline:
+            sys.exit(1)
+    elif baseline is not None:
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
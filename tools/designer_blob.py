@@ -0,0 +1,143 @@
+"""Move a protocol's Protocol Designer data out of the way, and bring it back.
+
+Protocol Designer ends every exported protocol with a DESIGNER_APPLICATION
+string of its own JSON state. The run never reads it, but every upload,
+analysis and diff carries it. `pack` replaces the string with a gzip sidecar
+next to the protocol, or with `--inline` a compressed one-line constant that
+keeps the file self-contained. `unpack` restores the original string byte for
+byte; run it before reopening the protocol in the designer.
+
+    python tools/designer_blob.py pack Q5_PCR_Tm65Tm68__DpnI.py
+    python tools/designer_blob.py unpack Q5_PCR_Tm65Tm68__DpnI.py
+    python tools/designer_blob.py show Q5_PCR_Tm65Tm68__DpnI.py
+"""
+import argparse
+import ast
+import base64
+import gzip
+import io
+import json
+import os
+import re
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+_SIDECAR_STUB = '''# Protocol Designer data, moved to a gzip file next to this one. Restore it
+# with `python tools/designer_blob.py unpack` before reopening in the designer.
+DESIGNER_APPLICATION_SIDECAR = "{name}"
+'''
+
+_INLINE_STUB = '''# Protocol Designer data, zlib-compressed and base85-encoded. Restore it
+# with `python tools/designer_blob.py unpack` before reopening in the designer.
+DESIGNER_APPLICATION_PACKED = "{data}"
+'''
+
+
+def _stub_pattern(stub: str, field: str) -> re.Pattern:
+    before, after = stub.split("{" + field + "}")
+    return re.compile("^" + re.escape(before) + '([^"]+)' + re.escape(after), re.M)
+
+
+LITERAL = re.compile(r'^DESIGNER_APPLICATION = """(.*?)"""\n', re.S | re.M)
+SIDECAR = _stub_pattern(_SIDECAR_STUB, "name")
+INLINE = _stub_pattern(_INLINE_STUB, "data")
+
+
+def sidecar_name(protocol_path: str) -> str:
+    return f"{os.path.splitext(os.path.basename(protocol_path))[0]}.designer.json.gz"
+
+
+def _gzip(raw: str) -> bytes:
+    # Fixed mtime and no file name, so packing the same data gives the same bytes.
+    buffer = io.BytesIO()
+    with gzip.GzipFile(filename="", mode="wb", fileobj=buffer, compresslevel=9, mtime=0) as handle:
+        handle.write(raw.encode("utf-8"))
+    return buffer.getvalue()
+
+
+def sidecar(raw: str, protocol_path: str) -> Tuple[str, bytes]:
+    """The stub that points `protocol_path` at its sidecar, and the sidecar's bytes."""
+    return _SIDECAR_STUB.format(name=sidecar_name(protocol_path)), _gzip(raw)
+
+
+def pack(source: str, protocol_path: str, inline: bool = False) -> Tuple[str, Optional[bytes]]:
+    """Return the packed source and, unless `inline`, the sidecar's bytes."""
+    match = LITERAL.search(source)
+    if match is None:
+        raise ValueError(f"{protocol_path} has no DESIGNER_APPLICATION string to pack")
+    raw = match.group(1)
+    if inline:
+        data = base64.b85encode(zlib.compress(raw.encode("utf-8"), 9)).decode("ascii")
+        return source[:match.start()] + _INLINE_STUB.format(data=data) + source[match.end():], None
+    stub, packed = sidecar(raw, protocol_path)
+    return source[:match.start()] + stub + source[match.end():], packed
+
+
+def _packed_raw(source: str, protocol_path: str) -> Tuple[re.Match, str]:
+    """The packed form's match and the original string's source text."""
+    match = INLINE.search(source)
+    if match is not None:
+        return match, zlib.decompress(base64.b85decode(match.group(1))).decode("utf-8")
+    match = SIDECAR.search(source)
+    if match is not None:
+        sidecar = os.path.join(os.path.dirname(os.path.abspath(protocol_path)), match.group(1))
+        with gzip.open(sidecar, "rt", encoding="utf-8") as handle:
+            return match, handle.read()
+    raise ValueError(f"{protocol_path} has no packed Protocol Designer data")
+
+
+def unpack(source: str, protocol_path: str) -> str:
+    """Return the source with the DESIGNER_APPLICATION string restored."""
+    match, raw = _packed_raw(source, protocol_path)
+    return f'{source[:match.start()]}DESIGNER_APPLICATION = """{raw}"""\n{source[match.end():]}'
+
+
+def designer_source(protocol_path: str) -> str:
+    """The source text of a protocol's DESIGNER_APPLICATION string, whether packed or not."""
+    with open(protocol_path, encoding="utf-8") as handle:
+        source = handle.read()
+    match = LITERAL.search(source)
+    return match.group(1) if match is not None else _packed_raw(source, protocol_path)[1]
+
+
+def read_designer_application(protocol_path: str) -> Dict[str, Any]:
+    """The Protocol Designer JSON of a protocol, whether packed or not."""
+    return json.loads(ast.literal_eval(f'"""{designer_source(protocol_path)}"""'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack_parser = commands.add_parser("pack", help="move DESIGNER_APPLICATION to a sidecar or inline packed form")
+    pack_parser.add_argument("protocol", help="path to the protocol .py file")
+    pack_parser.add_argument("--inline", action="store_true", help="keep the data in the file, compressed")
+    unpack_parser = commands.add_parser("unpack", help="restore DESIGNER_APPLICATION for the designer")
+    unpack_parser.add_argument("protocol", help="path to the protocol .py file")
+    show_parser = commands.add_parser("show", help="print the Protocol Designer JSON")
+    show_parser.add_argument("protocol", help="path to the protocol .py file")
+    args = parser.parse_args()
+
+    if args.command == "show":
+        print(json.dumps(read_designer_application(args.protocol), indent=2, ensure_ascii=False))
+        return
+    with open(args.protocol, encoding="utf-8") as handle:
+        source = handle.read()
+    if args.command == "pack":
+        packed, sidecar = pack(source, args.protocol, inline=args.inline)
+        if sidecar is not None:
+            sidecar_path = os.path.join(os.path.dirname(os.path.abspath(args.protocol)), sidecar_name(args.protocol))
+            with open(sidecar_path, "wb") as handle:
+                handle.write(sidecar)
+            print(f"Wrote {sidecar_path} ({len(sidecar)} bytes)")
+        with open(args.protocol, "w", encoding="utf-8") as handle:
+            handle.write(packed)
+        print(f"{args.protocol}: {len(source.encode('utf-8'))} -> {len(packed.encode('utf-8'))} bytes")
+    else:
+        restored = unpack(source, args.protocol)
+        with open(args.protocol, "w", encoding="utf-8") as handle:
+            handle.write(restored)
+        print(f"Restored DESIGNER_APPLICATION in {args.protocol}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,993 @@
+"""Compile a protocol's Protocol Designer data into a compact run().
+
+Protocol Designer exports every step fully expanded: a liquid class definition
+per liquid handling step, every cycle of a PCR profile written out, and module
+commands repeated wherever a form sets them. The designer's step forms
+(`savedStepForms` in `orderedStepIds` order) describe the same protocol in a
+few fields per step. This compiler lowers each form to a short list of calls,
+runs the optimization passes below over them and writes the protocol out:
+
+  dedup-liquid-classes  one definition per distinct set of liquid class properties
+  merge-same-source     adjacent steps drawing from the same well share one call, or
+                        at least one tip
+  compress-cycles       repeated thermocycler steps run as cycles on the module
+  hoist-temperatures    drop module commands that repeat the module's state, and
+                        start temperature module set-points as early as possible
+
+Change the protocol in the designer, then compile again instead of editing the
+output. The input is a protocol exported by the designer (packed or not, see
+designer_blob.py) or the designer's saved JSON:
+
+    python tools/designer_compiler.py Q5_PCR_Tm65Tm68__DpnI.py
+    python tools/designer_compiler.py export.json -o Q5_PCR.py --skip merge-same-source
+
+The output keeps the designer data in a gzip sidecar, so it can be reopened in
+the designer after `designer_blob.py unpack`, or compiled again.
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import textwrap
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from designer_blob import designer_source, read_designer_application, sidecar, sidecar_name
+
+API_LEVEL = "2.24"
+PASSES = ("dedup-liquid-classes", "merge-same-source", "compress-cycles", "hoist-temperatures")
+INITIAL_DECK_SETUP = "__INITIAL_DECK_SETUP_STEP__"
+LINE_WIDTH = 110
+
+BASE_LIQUID_CLASSES = {"waterV1": "water", "glycerol50V1": "glycerol_50", "ethanol80V1": "ethanol_80"}
+FILTER_TIPS_50 = "opentrons/opentrons_flex_96_filtertiprack_50ul/1"
+
+# The designer copies the base class's volume correction into every step it
+# exports, but the step forms do not carry it. Combinations missing here are
+# left to the base class, with a warning.
+BASE_CORRECTIONS = {
+    ("glycerol50V1", "flex_1channel_50", FILTER_TIPS_50): [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+    ("glycerol50V1", "flex_8channel_50", FILTER_TIPS_50): [(0, 0), (1, -0.2), (10, 0.1), (50, -0.2)],
+    ("waterV1", "flex_1channel_50", FILTER_TIPS_50): [(0, 0)],
+}
+BLOWOUT_LOCATIONS = {"source_well": "source", "dest_well": "destination"}
+LIQUID_METHODS = {"single": "transfer", "multiDispense": "distribute", "multiAspirate": "consolidate"}
+
+
+class Well(NamedTuple):
+    labware: str  # variable name in run()
+    name: str
+
+
+class LiquidClassDef(NamedTuple):
+    base: str  # designer name, e.g. "waterV1"
+    pipette: str
+    tip_rack: str
+    sections: Dict[str, Any]
+
+
+class LiquidStep(NamedTuple):
+    pipette: str
+    method: str  # transfer, distribute or consolidate
+    volume: float
+    sources: List[Well]
+    dests: List[Well]
+    new_tip: str
+    liquid_class: str
+    trash: str
+    multichannel: bool
+
+
+class MixStep(NamedTuple):
+    pipette: str
+    wells: List[Well]
+    repetitions: int
+    volume: float
+    reference: str  # "bottom" or "top"
+    z: float
+    options: Dict[str, float]
+    new_tip: str
+    trash: str
+
+
+class ModuleCall(NamedTuple):
+    module: str
+    method: str
+    args: Tuple[Any, ...] = ()
+
+
+class Profile(NamedTuple):
+    module: str
+    stages: List[Tuple[List[Dict[str, float]], int]]
+    block_max_volume: float
+
+
+class Code(NamedTuple):
+    """A protocol-level call passed through as source, e.g. a pause or a gripper move."""
+
+    line: str
+
+
+class Step(NamedTuple):
+    numbers: List[int]
+    names: List[str]
+    ops: List[Any]
+
+    @property
+    def marker(self) -> str:
+        if len(self.numbers) == 1:
+            return f"Step {self.numbers[0]}"
+        return f"Steps {min(self.numbers)}-{max(self.numbers)}"
+
+
+def _number(value: Any) -> Any:
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _snake(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _flex_pipette(name: str) -> str:
+    """The Protocol API name of a designer pipette, e.g. p50_single_flex -> flex_1channel_50."""
+    match = re.fullmatch(r"p(\d+)_(single|multi)_flex", name)
+    if match:
+        return f"flex_{1 if match.group(2) == 'single' else 8}channel_{match.group(1)}"
+    match = re.fullmatch(r"p(\d+)_96", name)
+    return f"flex_96channel_{match.group(1)}" if match else name
+
+
+def _labware_kind(uri: str) -> str:
+    load_name = uri.split("/")[1]
+    for marker, kind in (
+        ("tiprack", "tip_rack"),
+        ("wellplate", "well_plate"),
+        ("aluminum_block", "aluminum_block"),
+        ("adapter", "adapter"),
+        ("reservoir", "reservoir"),
+        ("tuberack", "tube_rack"),
+    ):
+        if marker in load_name:
+            return kind
+    return "labware"
+
+
+def _numbered(items: Dict[str, Any], kind: Callable[[Any], str]) -> Dict[str, str]:
+    """Variable names like well_plate_1, well_plate_2, numbered per kind in designer order."""
+    counts: Dict[str, int] = {}
+    names = {}
+    for item_id, item in items.items():
+        prefix = kind(item)
+        counts[prefix] = counts.get(prefix, 0) + 1
+        names[item_id] = f"{prefix}_{counts[prefix]}"
+    return names
+
+
+def _by_volume(enabled: Any, volume: Any) -> List[Tuple[float, float]]:
+    return [(0, _number(volume) if enabled and volume not in (None, "") else 0)]
+
+
+def _seconds_delay(seconds: Any) -> Dict[str, Any]:
+    seconds = _number(seconds or 0)
+    return {"enabled": True, "duration": seconds} if seconds else {"enabled": False}
+
+
+def liquid_class_sections(form: Dict[str, Any], correction: Optional[List[Tuple[float, float]]]) -> Dict[str, Any]:
+    """The liquid class properties a moveLiquid form describes, laid out as the designer exports them."""
+
+    def position(prefix: str) -> Dict[str, Any]:
+        return {
+            "offset": {
+                "x": _number(form.get(f"{prefix}_x_position") or 0),
+                "y": _number(form.get(f"{prefix}_y_position") or 0),
+                "z": _number(form.get(f"{prefix}_mmFromBottom") or 0),
+            },
+            "position_reference": form[f"{prefix}_position_reference"],
+        }
+
+    def flag_delay(phase: str) -> Dict[str, Any]:
+        if form.get(f"{phase}_delay_checkbox"):
+            return {"enabled": True, "duration": _number(form[f"{phase}_delay_seconds"])}
+        return {"enabled": False}
+
+    def mix(phase: str) -> Dict[str, Any]:
+        if form.get(f"{phase}_mix_checkbox"):
+            return {
+                "enabled": True,
+                "repetitions": int(form[f"{phase}_mix_times"]),
+                "volume": _number(form[f"{phase}_mix_volume"]),
+            }
+        return {"enabled": False}
+
+    def touch_tip(phase: str) -> Dict[str, Any]:
+        if form.get(f"{phase}_touchTip_checkbox"):
+            return {
+                "enabled": True,
+                "z_offset": _number(form[f"{phase}_touchTip_mmFromTop"]),
+                "mm_from_edge": _number(form[f"{phase}_touchTip_mmFromEdge"]),
+                "speed": _number(form[f"{phase}_touchTip_speed"]),
+            }
+        return {"enabled": False}
+
+    def submerge(phase: str) -> Dict[str, Any]:
+        return {
+            "delay": _seconds_delay(form.get(f"{phase}_submerge_delay_seconds")),
+            "speed": _number(form[f"{phase}_submerge_speed"]),
+            "start_position": position(f"{phase}_submerge"),
+        }
+
+    def retract(phase: str, blowout: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        section = {
+            "air_gap_by_volume": _by_volume(form.get(f"{phase}_airGap_checkbox"), form.get(f"{phase}_airGap_volume")),
+            "delay": _seconds_delay(form.get(f"{phase}_retract_delay_seconds")),
+            "end_position": position(f"{phase}_retract"),
+            "speed": _number(form[f"{phase}_retract_speed"]),
+            "touch_tip": touch_tip(phase),
+        }
+        if blowout is not None:
+            section["blowout"] = blowout
+        return section
+
+    corrected = {"correction_by_volume": correction} if correction is not None else {}
+    multi_dispense = form["path"] == "multiDispense"
+    # A disposal volume is always blown out, whatever the blowout checkbox says.
+    if form.get("blowout_checkbox") or (multi_dispense and form.get("disposalVolume_checkbox")):
+        blowout = {
+            "enabled": True,
+            "location": BLOWOUT_LOCATIONS.get(form["blowout_location"], "trash"),
+            "flow_rate": _number(form["blowout_flowRate"]),
+        }
+    else:
+        blowout = {"enabled": False}
+    dispense_common = {
+        "dispense_position": position("dispense"),
+        "flow_rate_by_volume": [(0, _number(form["dispense_flowRate"]))],
+        "delay": flag_delay("dispense"),
+        "submerge": submerge("dispense"),
+        "retract": retract("dispense", blowout),
+        **corrected,
+    }
+    sections = {
+        "aspirate": {
+            "aspirate_position": position("aspirate"),
+            "flow_rate_by_volume": [(0, _number(form["aspirate_flowRate"]))],
+            "pre_wet": bool(form.get("preWetTip")),
+            **corrected,
+            "delay": flag_delay("aspirate"),
+            "mix": mix("aspirate"),
+            "submerge": submerge("aspirate"),
+            "retract": retract("aspirate"),
+        },
+        "dispense": {
+            **dispense_common,
+            "push_out_by_volume": _by_volume(form.get("pushOut_checkbox"), form.get("pushOut_volume")),
+            "mix": mix("dispense"),
+        },
+    }
+    if multi_dispense:
+        sections["multi_dispense"] = {
+            **dispense_common,
+            "conditioning_by_volume": _by_volume(form.get("conditioning_checkbox"), form.get("conditioning_volume")),
+            "disposal_by_volume": _by_volume(form.get("disposalVolume_checkbox"), form.get("disposalVolume_volume")),
+        }
+    return sections
+
+
+def _profile_step(item: Dict[str, Any]) -> Dict[str, float]:
+    seconds = int(item.get("durationMinutes") or 0) * 60 + _number(item.get("durationSeconds") or 0)
+    return {"temperature": _number(item["temperature"]), "hold_time_seconds": seconds}
+
+
+class DesignerCompiler:
+    """Lowers Protocol Designer step forms to calls, and writes those out as a protocol."""
+
+    def __init__(self, designer: Dict[str, Any]) -> None:
+        self.designer = designer
+        data = designer["designerApplication"]["data"]
+        self.data = data
+        self.forms = data["savedStepForms"]
+        setup = self.forms[INITIAL_DECK_SETUP]
+        self.locations: Dict[str, str] = {**setup["moduleLocationUpdate"], **setup["labwareLocationUpdate"]}
+        self.modules = _numbered(data["modules"], lambda module: _snake(re.sub(r"V\d+$", "", module["model"])))
+        self.labware = _numbered(data["labware"], lambda labware: _labware_kind(labware["labwareDefURI"]))
+        self.pipettes = {pipette: f"pipette_{mount}" for pipette, mount in setup["pipetteLocationUpdate"].items()}
+        self.trash = {chute: "waste_chute" for chute in setup.get("wasteChuteLocationUpdate", {})}
+        self.trash.update(_numbered(setup.get("trashBinLocationUpdate", {}), lambda _: "trash_bin"))
+        self.liquid_classes: Dict[str, LiquidClassDef] = {}
+        self.warnings: List[str] = []
+
+    # Deck
+
+    def module_of(self, labware_var: str) -> Optional[str]:
+        """The module a labware sits on, through any adapters."""
+        labware_id = next(item for item, name in self.labware.items() if name == labware_var)
+        location = self.locations.get(labware_id)
+        while location in self.labware:
+            location = self.locations.get(location)
+        return self.modules.get(location)
+
+    def _wells(self, labware_id: str, names: List[str]) -> List[Well]:
+        return [Well(self.labware[labware_id], name) for name in names]
+
+    def _trash_for(self, form: Dict[str, Any]) -> str:
+        return self.trash.get(form.get("dropTip_location"), next(iter(self.trash.values()), "None"))
+
+    def pipette_name(self, pipette_id: str) -> str:
+        return _flex_pipette(self.data["pipettes"][pipette_id]["pipetteName"])
+
+    # Lowering
+
+    def lower(self) -> List[Step]:
+        steps = []
+        for number, step_id in enumerate(self.data["orderedStepIds"], 1):
+            form = self.forms[step_id]
+            lower = getattr(self, f"_lower_{_snake(form['stepType'])}", None)
+            if lower is None:
+                raise ValueError(f"Step {number}: {form['stepType']} steps are not supported")
+            steps.append(Step([number], [form.get("stepName") or form["stepType"]], lower(form, number)))
+        return steps
+
+    def _lower_move_liquid(self, form: Dict[str, Any], number: int) -> List[Any]:
+        if form.get("nozzles") not in (None, "ALL"):
+            raise ValueError(f"Step {number}: the {form['nozzles']} nozzle layout is not supported")
+        if not form.get("liquidClass"):
+            raise ValueError(f"Step {number}: steps without a liquid class are not supported")
+        method = LIQUID_METHODS[form["path"]]
+        sources = self._wells(form["aspirate_labware"], form["aspirate_wells"])
+        dests = self._wells(form["dispense_labware"], form["dispense_wells"])
+        if method == "transfer" and len(sources) != len(dests):
+            # One source to many wells, or many sources into one, pairs up like the designer's export.
+            if len(sources) == 1:
+                sources = sources * len(dests)
+            elif len(dests) == 1:
+                dests = dests * len(sources)
+            else:
+                raise ValueError(f"Step {number}: {len(sources)} sources cannot pair with {len(dests)} destinations")
+        pipette = self.pipette_name(form["pipette"])
+        correction = BASE_CORRECTIONS.get((form["liquidClass"], pipette, form["tipRack"]))
+        if correction is None:
+            self.warnings.append(
+                f"Step {number}: no volume correction known for {form['liquidClass']} on {pipette}; "
+                "the base class's applies"
+            )
+        name = f"{method}_step_{number}"
+        self.liquid_classes[name] = LiquidClassDef(
+            form["liquidClass"], pipette, form["tipRack"], liquid_class_sections(form, correction),
+        )
+        return [LiquidStep(
+            pipette=self.pipettes[form["pipette"]],
+            method=method,
+            volume=_number(form["volume"]),
+            sources=sources,
+            dests=dests,
+            new_tip=form["changeTip"],
+            liquid_class=name,
+            trash=self._trash_for(form),
+            multichannel=not pipette.startswith("flex_1channel"),
+        )]
+
+    def _lower_mix(self, form: Dict[str, Any], number: int) -> List[Any]:
+        options = {
+            "aspirate_flow_rate": _number(form["aspirate_flowRate"]),
+            "dispense_flow_rate": _number(form["dispense_flowRate"]),
+        }
+        if form.get("aspirate_delay_checkbox"):
+            options["aspirate_delay"] = _number(form["aspirate_delay_seconds"])
+        if form.get("dispense_delay_checkbox"):
+            options["dispense_delay"] = _number(form["dispense_delay_seconds"])
+        if form.get("pushOut_checkbox"):
+            options["final_push_out"] = _number(form["pushOut_volume"])
+        return [MixStep(
+            pipette=self.pipettes[form["pipette"]],
+            wells=self._wells(form["labware"], form["wells"]),
+            repetitions=int(form["times"]),
+            volume=_number(form["volume"]),
+            reference="top" if form.get("mix_position_reference") == "well-top" else "bottom",
+            z=_number(form.get("mix_mmFromBottom") or 0),
+            options=options,
+            new_tip=form["changeTip"],
+            trash=self._trash_for(form),
+        )]
+
+    def _lower_temperature(self, form: Dict[str, Any], number: int) -> List[Any]:
+        module = self.modules[form["moduleId"]]
+        if form.get("setTemperature") == "true":
+            return [ModuleCall(module, "start_set_temperature", (_number(form["targetTemperature"]),))]
+        return [ModuleCall(module, "deactivate")]
+
+    def _thermocycler_state(
+        self, module: str, lid_open: Optional[bool], block: Optional[Any], lid: Optional[Any],
+    ) -> List[Any]:
+        ops = []
+        if lid_open is not None:
+            ops.append(ModuleCall(module, "open_lid" if lid_open else "close_lid"))
+        if block is not None:
+            ops.append(ModuleCall(module, "set_block_temperature", (_number(block),)))
+        else:
+            ops.append(ModuleCall(module, "deactivate_block"))
+        if lid is not None:
+            ops.append(ModuleCall(module, "set_lid_temperature", (_number(lid),)))
+        else:
+            ops.append(ModuleCall(module, "deactivate_lid"))
+        return ops
+
+    def _lower_thermocycler(self, form: Dict[str, Any], number: int) -> List[Any]:
+        module = self.modules[form["moduleId"]]
+        if form["thermocyclerFormType"] == "thermocyclerState":
+            return self._thermocycler_state(
+                module,
+                bool(form.get("lidOpen")),
+                form["blockTargetTemp"] if form.get("blockIsActive") else None,
+                form["lidTargetTemp"] if form.get("lidIsActive") else None,
+            )
+        # Cycles are written out in full, as the designer exports them; compress-cycles folds them back.
+        steps: List[Dict[str, float]] = []
+        for item_id in form["orderedProfileItems"]:
+            item = form["profileItemsById"][item_id]
+            if item["type"] == "profileCycle":
+                steps += [_profile_step(step) for step in item["steps"]] * int(item["repetitions"])
+            else:
+                steps.append(_profile_step(item))
+        return [
+            ModuleCall(module, "close_lid"),
+            ModuleCall(module, "set_lid_temperature", (_number(form["profileTargetLidTemp"]),)),
+            Profile(module, [(steps, 1)], _number(form["profileVolume"])),
+        ] + self._thermocycler_state(
+            module,
+            True if form.get("lidOpenHold") else None,
+            form["blockTargetTempHold"] if form.get("blockIsActiveHold") else None,
+            form["lidTargetTempHold"] if form.get("lidIsActiveHold") else None,
+        )
+
+    def _lower_pause(self, form: Dict[str, Any], number: int) -> List[Any]:
+        action = form.get("pauseAction")
+        message = json.dumps(form.get("pauseMessage") or "", ensure_ascii=False)
+        if action == "untilTime":
+            hours, minutes, seconds = (_number(part) for part in (form.get("pauseTime") or "0:0:0").split(":"))
+            return [Code(f"protocol.delay(seconds={hours * 3600 + minutes * 60 + seconds}, msg={message})")]
+        if action == "untilTemperature":
+            return [ModuleCall(self.modules[form["moduleId"]], "await_temperature", (_number(form["pauseTemperature"]),))]
+        return [Code(f"protocol.pause({message})")]
+
+    def _lower_comment(self, form: Dict[str, Any], number: int) -> List[Any]:
+        return [Code(f"protocol.comment({json.dumps(form.get('message') or '', ensure_ascii=False)})")]
+
+    def _lower_move_labware(self, form: Dict[str, Any], number: int) -> List[Any]:
+        location = form["newLocation"]
+        target = self.modules.get(location) or self.labware.get(location) or self.trash.get(location)
+        if target is None:
+            target = "protocol_api.OFF_DECK" if location == "offDeck" else json.dumps(location)
+        return [Code(
+            f"protocol.move_labware({self.labware[form['labware']]}, {target}, use_gripper={bool(form.get('useGripper'))})"
+        )]
+
+    # Liquid classes
+
+    def same_properties(self, first: str, second: str) -> bool:
+        return first == second or self.liquid_classes[first] == self.liquid_classes[second]
+
+    # Output
+
+    def _metadata(self) -> Dict[str, Any]:
+        source = self.designer.get("metadata", {})
+        metadata = {
+            "protocolName": source.get("protocolName", ""),
+            "author": source.get("author", ""),
+            "description": source.get("description", ""),
+        }
+        for key in ("created", "lastModified"):
+            if source.get(key):
+                moment = datetime.datetime.fromtimestamp(source[key] / 1000, tz=datetime.timezone.utc)
+                metadata[key] = moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+        metadata["protocolDesigner"] = self.designer["designerApplication"].get("version", "")
+        metadata["source"] = "Protocol Designer"
+        return metadata
+
+    def _load_lines(self) -> List[str]:
+        data = self.data
+        lines = ["    # Load Modules:"]
+        for module_id, name in self.modules.items():
+            slot = self.locations[module_id]
+            lines.append(f'    {name} = protocol.load_module("{data["modules"][module_id]["model"]}", "{slot}")')
+
+        parents = set(self.locations[labware_id] for labware_id in self.labware)
+        loaded: List[str] = []
+        pending = list(self.labware)
+        lines.append("")
+        lines.append("    # Load Labware:")
+        while pending:
+            # Parents before what sits on them.
+            labware_id = next(
+                item for item in pending
+                if self.locations[item] not in self.labware or self.locations[item] in loaded
+            )
+            pending.remove(labware_id)
+            loaded.append(labware_id)
+            namespace, load_name, version = data["labware"][labware_id]["labwareDefURI"].split("/")
+            location = self.locations[labware_id]
+            options = [f'namespace="{namespace}"', f"version={version}"]
+            if labware_id in parents:
+                target = self.modules.get(location) or self.labware.get(location)
+                call = f"{target}.load_adapter" if target else "protocol.load_adapter"
+                args = [json.dumps(load_name)] + ([] if target else [json.dumps(location)]) + options
+            else:
+                target = self.modules.get(location) or self.labware.get(location)
+                call = f"{target}.load_labware" if target else "protocol.load_labware"
+                label = json.dumps(data["labware"][labware_id]["displayName"], ensure_ascii=False)
+                args = [json.dumps(load_name)] + ([] if target else [json.dumps(location)])
+                args += [f"label={label}"] + options
+            lines += _call(f"{self.labware[labware_id]} = {call}", args, "    ")
+
+        lines.append("")
+        lines.append("    # Load Pipettes:")
+        assignments = data.get("pipetteTiprackAssignments", {})
+        for pipette_id, name in self.pipettes.items():
+            uris = assignments.get(pipette_id, [])
+            racks = [var for item, var in self.labware.items() if data["labware"][item]["labwareDefURI"] in uris]
+            mount = name.split("_", 1)[1]
+            lines += _call(
+                f"{name} = protocol.load_instrument",
+                [f'"{self.pipette_name(pipette_id)}"', f'"{mount}"', f"tip_racks=[{', '.join(racks)}]"],
+                "    ",
+            )
+
+        lines.append("")
+        lines.append("    # Load Trash:")
+        setup = self.forms[INITIAL_DECK_SETUP]
+        for item, name in self.trash.items():
+            if name == "waste_chute":
+                lines.append(f"    {name} = protocol.load_waste_chute()")
+            else:
+                slot = setup["trashBinLocationUpdate"][item].replace("cutout", "")
+                lines.append(f'    {name} = protocol.load_trash_bin("{slot}")')
+
+        ingredients = data.get("ingredients", {})
+        if ingredients:
+            lines.append("")
+            lines.append("    # Define Liquids:")
+            for group, liquid in ingredients.items():
+                args = [json.dumps(liquid["displayName"], ensure_ascii=False)]
+                if liquid.get("description"):
+                    args.append(f"description={json.dumps(liquid['description'], ensure_ascii=False)}")
+                args.append(f'display_color="{liquid["displayColor"]}"')
+                lines += _call(f"liquid_{group} = protocol.define_liquid", args, "    ")
+            lines.append("")
+            lines.append("    # Load Liquids:")
+            for labware_id, well_contents in data.get("ingredLocations", {}).items():
+                groups: Dict[Tuple[str, Any], List[str]] = {}
+                for well, contents in well_contents.items():
+                    for group, content in contents.items():
+                        groups.setdefault((group, _number(content["volume"])), []).append(well)
+                for (group, volume), wells in groups.items():
+                    lines += _call(
+                        f"{self.labware[labware_id]}.load_liquid",
+                        [f"wells={json.dumps(wells)}", f"liquid=liquid_{group}", f"volume={volume}"],
+                        "    ",
+                    )
+        return lines
+
+    def _liquid_class_lines(self, names: List[str]) -> List[str]:
+        if not names:
+            return []
+        lines = ["", "    # Load Liquid Classes:"]
+        bases = list(dict.fromkeys(self.liquid_classes[name].base for name in names))
+        for base in bases:
+            api_name = BASE_LIQUID_CLASSES.get(base, base)
+            lines.append(f'    {api_name}_base_class = protocol.get_liquid_class("{api_name}")')
+        for name in names:
+            base = BASE_LIQUID_CLASSES.get(self.liquid_classes[name].base, self.liquid_classes[name].base)
+            lines += _call(
+                f"{name} = protocol.define_liquid_class",
+                [f'name="{name}"', f"base_liquid_class={base}_base_class", f"properties={name.upper()}_PROPERTIES"],
+                "    ",
+            )
+        return lines
+
+    def _op_lines(self, op: Any, drop_after: bool) -> List[str]:
+        indent = "    "
+        if isinstance(op, Code):
+            return [indent + op.line]
+        if isinstance(op, ModuleCall):
+            return [f"{indent}{op.module}.{op.method}({', '.join(_py(arg) for arg in op.args)})"]
+        if isinstance(op, Profile):
+            lines = []
+            for steps, repetitions in op.stages:
+                lines.append(f"{indent}{op.module}.execute_profile(")
+                lines.append(f"{indent}    [")
+                lines += [f"{indent}        {_py(step)}," for step in steps]
+                lines.append(f"{indent}    ],")
+                lines.append(f"{indent}    {repetitions},")
+                lines.append(f"{indent}    block_max_volume={_py(op.block_max_volume)},")
+                lines.append(f"{indent})")
+            return lines
+        if isinstance(op, LiquidStep):
+            args = [
+                f"volume={_py(op.volume)}",
+                f"source={_wells_source(op.sources)}",
+                f"dest={_wells_source(op.dests)}",
+                f'new_tip="{op.new_tip}"',
+                f"trash_location={op.trash}",
+            ]
+            if op.multichannel:
+                args.append("group_wells=False")
+            args += ["keep_last_tip=True", f"liquid_class={op.liquid_class}"]
+            lines = _call(f"{op.pipette}.{op.method}_with_liquid_class", args, indent, force_split=True)
+        else:
+            pick_up = [
+                f"{op.pipette}.pick_up_tip()",
+                f"{op.pipette}.configure_for_volume({_py(op.volume)})",
+                f"{op.pipette}.prepare_to_aspirate()",
+            ]
+            args = [
+                f"repetitions={op.repetitions}",
+                f"volume={_py(op.volume)}",
+                f"location=well.{op.reference}(z={_py(op.z)})",
+            ] + [f"{key}={_py(value)}" for key, value in op.options.items()]
+            lines = [] if op.new_tip != "once" else [indent + line for line in pick_up]
+            lines.append(f"{indent}for well in {_wells_source(op.wells)}:")
+            if op.new_tip == "always":
+                lines += [indent * 2 + line for line in pick_up]
+            lines += _call(f"{op.pipette}.mix", args, indent * 2, force_split=True)
+            if op.new_tip == "always":
+                lines.append(f"{indent * 2}{op.pipette}.drop_tip({op.trash})")
+                drop_after = False
+        if drop_after:
+            lines.append(f"{indent}{op.pipette}.drop_tip({op.trash})")
+        return lines
+
+    def emit(self, steps: List[Step], source_name: str, passes: List[str]) -> str:
+        ops = [op for step in steps for op in step.ops]
+        tip_ops = [op for op in ops if isinstance(op, (LiquidStep, MixStep))]
+        # A tip stays on only when the next liquid handling step carries it on.
+        keeps_tip = {
+            id(op): following.pipette == op.pipette and following.new_tip == "never"
+            for op, following in zip(tip_ops, tip_ops[1:])
+        }
+        class_names = list(dict.fromkeys(op.liquid_class for op in ops if isinstance(op, LiquidStep)))
+
+        summary = (
+            f"Passes: {', '.join(passes) or 'none'}. Change the protocol in Protocol Designer "
+            "and compile it again instead of editing this file."
+        )
+        lines = [
+            f'"""Compiled from the Protocol Designer data of {source_name} by tools/designer_compiler.py.',
+            "",
+            *textwrap.wrap(summary, 79, break_on_hyphens=False),
+            '"""',
+            "from typing import Any, List",
+            "",
+            "from opentrons import protocol_api",
+            "",
+            f"metadata = {_py(self._metadata(), 0, split=True)}",
+            "",
+            f'requirements = {{"robotType": "Flex", "apiLevel": "{API_LEVEL}"}}',
+            "",
+            "",
+            "def wells(labware: Any, names: str) -> List[Any]:",
+            '    """The wells of `labware` named in the space-separated `names`."""',
+            "    return [labware[name] for name in names.split()]",
+            "",
+            "",
+            "def run(protocol: protocol_api.ProtocolContext) -> None:",
+        ]
+        lines += self._load_lines()
+        lines += self._liquid_class_lines(class_names)
+        lines += ["", "    # PROTOCOL STEPS"]
+        for step in steps:
+            lines += ["", f"    # {step.marker}: {' + '.join(step.names)}"]
+            for op in step.ops:
+                lines += self._op_lines(op, isinstance(op, (LiquidStep, MixStep)) and not keeps_tip.get(id(op), False))
+        for name in class_names:
+            definition = self.liquid_classes[name]
+            properties = _py(definition.sections, 0, split=True)
+            lines += ["", ""]
+            lines.append(f'{name.upper()}_PROPERTIES = {{"{definition.pipette}": {{"{definition.tip_rack}": {properties}}}}}')
+        return "\n".join(lines) + "\n"
+
+
+def _py(value: Any, indent: int = 0, split: bool = False) -> str:
+    """Python source for a literal, with dicts that hold dicts spread over lines."""
+    if isinstance(value, dict):
+        if not split and not any(isinstance(item, dict) for item in value.values()):
+            return "{" + ", ".join(f"{_py(key)}: {_py(item)}" for key, item in value.items()) + "}"
+        inner = " " * (indent + 4)
+        items = [f"{inner}{_py(key)}: {_py(item, indent + 4)}," for key, item in value.items()]
+        return "{\n" + "\n".join(items) + "\n" + " " * indent + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(_py(item) for item in value) + "]"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_py(item) for item in value) + ")"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, float):
+        return repr(_number(value))
+    return repr(value)
+
+
+def _call(prefix: str, args: List[str], indent: str, force_split: bool = False) -> List[str]:
+    line = f"{indent}{prefix}({', '.join(args)})"
+    if not force_split and len(line) <= LINE_WIDTH:
+        return [line]
+    return [f"{indent}{prefix}("] + [f"{indent}    {arg}," for arg in args] + [f"{indent})"]
+
+
+def _wells_source(wells: List[Well]) -> str:
+    """The shortest source for a well list: a repeated well, wells(plate, "A1 B1"), or a sum of those."""
+    if len(set(wells)) == 1:
+        single = f'[{wells[0].labware}["{wells[0].name}"]]'
+        return single if len(wells) == 1 else f"{single} * {len(wells)}"
+    runs: List[Tuple[str, List[str]]] = []
+    for well in wells:
+        if runs and runs[-1][0] == well.labware:
+            runs[-1][1].append(well.name)
+        else:
+            runs.append((well.labware, [well.name]))
+    return " + ".join(f'wells({labware}, "{" ".join(names)}")' for labware, names in runs)
+
+
+# Passes. Each takes the lowered steps and returns them rewritten, with a note per change.
+
+def dedup_liquid_classes(compiler: DesignerCompiler, steps: List[Step]) -> Tuple[List[Step], List[str]]:
+    """Share one liquid class between steps whose properties agree.
+
+    A transfer never reads the multi_dispense section, so a transfer and a
+    distribute that agree on aspirate and dispense share a class too.
+    """
+    used = list(dict.fromkeys(
+        op.liquid_class for step in steps for op in step.ops if isinstance(op, LiquidStep)
+    ))
+    kept: List[str] = []
+    renamed: Dict[str, str] = {}
+    for name in used:
+        candidate = compiler.liquid_classes[name]
+        for keeper in kept:
+            definition = compiler.liquid_classes[keeper]
+            if definition[:3] != candidate[:3]:
+                continue
+            if any(definition.sections[key] != candidate.sections[key] for key in ("aspirate", "dispense")):
+                continue
+            ours, theirs = definition.sections.get("multi_dispense"), candidate.sections.get("multi_dispense")
+            if ours is not None and theirs is not None and ours != theirs:
+                continue
+            if ours is None and theirs is not None:
+                compiler.liquid_classes[keeper] = definition._replace(
+                    sections={**definition.sections, "multi_dispense": theirs},
+                )
+            renamed[name] = keeper
+            break
+        else:
+            kept.append(name)
+    for name in renamed:
+        del compiler.liquid_classes[name]
+    steps = [
+        step._replace(ops=[
+            op._replace(liquid_class=renamed.get(op.liquid_class, op.liquid_class)) if isinstance(op, LiquidStep) else op
+            for op in step.ops
+        ])
+        for step in steps
+    ]
+    notes = [f"{len(used)} liquid class definitions -> {len(kept)}"]
+    return steps, notes
+
+
+def _merge_liquid_steps(compiler: DesignerCompiler, first: LiquidStep, second: LiquidStep) -> Optional[List[Any]]:
+    if first.pipette != second.pipette or first.method != second.method or first.trash != second.trash:
+        return None
+    if len(set(first.sources)) != 1 or set(first.sources) != set(second.sources):
+        return None
+    if set(second.sources) & set(first.dests):
+        return None
+    if (
+        first.volume == second.volume
+        and first.new_tip == second.new_tip
+        and compiler.same_properties(first.liquid_class, second.liquid_class)
+    ):
+        return [first._replace(sources=first.sources + second.sources, dests=first.dests + second.dests)]
+    # Different volumes or properties need their own call, but the tip that
+    # drew the source well can stay on for the second one.
+    if first.new_tip in ("once", "never") and second.new_tip == "once":
+        return [first, second._replace(new_tip="never")]
+    return None
+
+
+def merge_same_source(compiler: DesignerCompiler, steps: List[Step]) -> Tuple[List[Step], List[str]]:
+    """Fold a liquid handling step into the previous one when both draw from the same well."""
+    merged: List[Step] = []
+    notes = []
+    for step in steps:
+        previous = merged[-1] if merged else None
+        if (
+            previous is not None
+            and previous.ops
+            and isinstance(previous.ops[-1], LiquidStep)
+            and len(step.ops) == 1
+            and isinstance(step.ops[0], LiquidStep)
+        ):
+            ops = _merge_liquid_steps(compiler, previous.ops[-1], step.ops[0])
+            if ops is not None:
+                merged[-1] = Step(previous.numbers + step.numbers, previous.names + step.names, previous.ops[:-1] + ops)
+                how = "one call" if len(ops) == 1 else "one tip"
+                notes.append(f"{merged[-1].marker}: step {step.numbers[0]} shares {how} with step {previous.numbers[-1]}")
+                continue
+        merged.append(step)
+    return merged, notes
+
+
+def fold_repeats(steps: List[Dict[str, float]]) -> List[Tuple[List[Dict[str, float]], int]]:
+    """Split a flat temperature trace into (steps, repetitions) stages that issue the fewest steps."""
+    if not steps:
+        return []
+    best: Optional[Tuple[int, int, int, int]] = None
+    for start in range(len(steps)):
+        for length in range(1, (len(steps) - start) // 2 + 1):
+            block = steps[start:start + length]
+            cycles = 1
+            while steps[start + cycles * length:start + (cycles + 1) * length] == block:
+                cycles += 1
+            if cycles < 2:
+                continue
+            issued = len(steps) - (cycles - 1) * length
+            if best is None or issued < best[0]:
+                best = (issued, start, length, cycles)
+    if best is None:
+        return [(list(steps), 1)]
+    _, start, length, cycles = best
+    stages = fold_repeats(steps[:start]) + [(steps[start:start + length], cycles)]
+    stages += fold_repeats(steps[start + cycles * length:])
+    # Neighbouring single passes run as one profile.
+    joined: List[Tuple[List[Dict[str, float]], int]] = []
+    for stage_steps, repetitions in stages:
+        if joined and repetitions == 1 and joined[-1][1] == 1:
+            joined[-1] = (joined[-1][0] + stage_steps, 1)
+        else:
+            joined.append((stage_steps, repetitions))
+    return joined
+
+
+def compress_cycles(compiler: DesignerCompiler, steps: List[Step]) -> Tuple[List[Step], List[str]]:
+    """Run repeated blocks of a thermocycler profile as repetitions on the module."""
+    notes = []
+    rewritten = []
+    for step in steps:
+        ops = []
+        for op in step.ops:
+            if isinstance(op, Profile):
+                trace = [item for stage, repetitions in op.stages for item in stage * repetitions]
+                stages = fold_repeats(trace)
+                if [item for stage, repetitions in stages for item in stage * repetitions] != trace:
+                    raise ValueError(f"{step.marker}: folded profile does not reproduce the temperature trace")
+                issued = sum(len(stage) for stage, _ in stages)
+                if issued < len(trace):
+                    notes.append(f"{step.marker}: {len(trace)} profile steps -> {issued} in {len(stages)} profile(s)")
+                op = op._replace(stages=stages)
+            ops.append(op)
+        rewritten.append(step._replace(ops=ops))
+    return rewritten, notes
+
+
+# What each module command sets, and to what; deactivations set None.
+_MODULE_STATE = {
+    "start_set_temperature": "target",
+    "set_temperature": "target",
+    "deactivate": "target",
+    "open_lid": "lid",
+    "close_lid": "lid",
+    "set_block_temperature": "block",
+    "deactivate_block": "block",
+    "set_lid_temperature": "lid_temperature",
+    "deactivate_lid": "lid_temperature",
+}
+_UNKNOWN = object()
+
+
+def _touches(compiler: DesignerCompiler, op: Any, module: str) -> bool:
+    if isinstance(op, (ModuleCall, Profile)):
+        return op.module == module
+    if isinstance(op, LiquidStep):
+        return any(compiler.module_of(well.labware) == module for well in set(op.sources + op.dests))
+    if isinstance(op, MixStep):
+        return any(compiler.module_of(well.labware) == module for well in set(op.wells))
+    return True
+
+
+def hoist_temperatures(compiler: DesignerCompiler, steps: List[Step]) -> Tuple[List[Step], List[str]]:
+    """Drop module commands that repeat the module's state, and move temperature module set-points up.
+
+    A start_set_temperature does not block, so it moves back past every step
+    that leaves its module and the labware on it alone, and the module ramps
+    while those steps run.
+    """
+    notes = []
+    state: Dict[Tuple[str, str], Any] = {}
+    flat: List[Tuple[int, Any]] = []
+    for index, step in enumerate(steps):
+        for op in step.ops:
+            if isinstance(op, ModuleCall) and op.method in _MODULE_STATE:
+                key = (op.module, _MODULE_STATE[op.method])
+                value = op.method.split("_")[0] if key[1] == "lid" else (op.args[0] if op.args else None)
+                # Modules start idle; the lid position is unknown until a command sets it.
+                if state.get(key, _UNKNOWN if key[1] == "lid" else None) == value:
+                    notes.append(f"{step.marker}: dropped {op.module}.{op.method}(), already in that state")
+                    continue
+                state[key] = value
+            elif isinstance(op, Profile):
+                state[(op.module, "block")] = _UNKNOWN
+            flat.append((index, op))
+
+    position = 0
+    while position < len(flat):
+        index, op = flat[position]
+        if isinstance(op, ModuleCall) and op.method == "start_set_temperature":
+            target = position
+            while target > 0 and not _touches(compiler, flat[target - 1][1], op.module):
+                target -= 1
+            if target < position:
+                flat.pop(position)
+                flat.insert(target, (flat[target][0], op))
+                notes.append(f"{steps[index].marker}: {op.module}.start_set_temperature() moved up to {steps[flat[target][0]].marker}")
+        position += 1
+
+    rewritten = []
+    for index, step in enumerate(steps):
+        ops = [op for owner, op in flat if owner == index]
+        if ops:
+            rewritten.append(step._replace(ops=ops))
+        else:
+            notes.append(f"{step.marker}: nothing left to do, removed")
+    return rewritten, notes
+
+
+PASS_FUNCTIONS = {
+    "dedup-liquid-classes": dedup_liquid_classes,
+    "merge-same-source": merge_same_source,
+    "compress-cycles": compress_cycles,
+    "hoist-temperatures": hoist_temperatures,
+}
+
+
+def compile_designer(designer: Dict[str, Any], source_name: str, passes: List[str]) -> Tuple[str, List[str]]:
+    """The compiled protocol source, and notes on what the passes changed and any warnings."""
+    compiler = DesignerCompiler(designer)
+    steps = compiler.lower()
+    notes = []
+    for name in PASSES:
+        if name in passes:
+            steps, pass_notes = PASS_FUNCTIONS[name](compiler, steps)
+            notes += [f"{name}: {note}" for note in pass_notes]
+    source = compiler.emit(steps, source_name, [name for name in PASSES if name in passes])
+    compile(source, source_name, "exec")
+    return source, notes + [f"warning: {warning}" for warning in compiler.warnings]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("source", help="protocol exported by Protocol Designer, or its saved .json")
+    parser.add_argument("-o", "--output", help="where to write the protocol (default: SOURCE_compiled.py)")
+    parser.add_argument("--skip", action="append", default=[], choices=PASSES, help="leave out a pass; repeatable")
+    args = parser.parse_args(argv)
+
+    if args.source.endswith(".json"):
+        with open(args.source, encoding="utf-8") as handle:
+            text = handle.read()
+        designer = json.loads(text)
+        raw = text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+    else:
+        designer = read_designer_application(args.source)
+        raw = designer_source(args.source)
+    output = args.output or f"{os.path.splitext(args.source)[0]}_compiled.py"
+    passes = [name for name in PASSES if name not in args.skip]
+    source, notes = compile_designer(designer, os.path.basename(args.source), passes)
+
+    stub, packed = sidecar(raw, output)
+    with open(output, "w", encoding="utf-8") as handle:
+        handle.write(source + "\n\n" + stub)
+    with open(os.path.join(os.path.dirname(os.path.abspath(output)), sidecar_name(output)), "wb") as handle:
+        handle.write(packed)
+    for note in notes:
+        print(note)
+    print(f"Wrote {output} ({source.count(chr(10))} lines)")
+
+
+if __name__ == "__main__":
+    main()
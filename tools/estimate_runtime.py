@@ -0,0 +1,513 @@
+"""Estimate how long a protocol's run() takes on a Flex, without the robot.
+
+The protocol is recorded with protocol_recorder and every command is expanded
+into gantry moves, tip pickups and drops, flow-rate-limited aspirates and
+dispenses, delays, and module ramps and holds. Module commands that do not
+block (start_set_temperature, start_execute_profile) run on their own
+timeline, so the total is the critical path rather than a plain sum.
+
+    python tools/estimate_runtime.py "HiFi_Assembly_v10 (1).py"
+    python tools/estimate_runtime.py Q5_PCR_Tm65Tm68__DpnI.py --commands
+"""
+import argparse
+import json
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from protocol_recorder import (
+    SLOT_ORIGINS,
+    WASTE_CHUTE_XY,
+    Location,
+    RecordedCommand,
+    RecordingInstrument,
+    RecordingLabware,
+    RecordingWasteChute,
+    RecordingWell,
+    record,
+    well_xy,
+)
+
+# Cost model. These are typical Flex figures; calibrate them against run logs.
+GANTRY_SPEED_MM_S = 300.0
+MOVE_OVERHEAD_SECONDS = 1.2  # retract to travel height, accelerate, lower again
+TIP_PICKUP_SECONDS = 4.0
+TIP_DROP_SECONDS = 2.0
+BLOWOUT_SECONDS = 1.0
+WELL_DEPTH_MM = 15.0
+DEFAULT_FLOW_RATE_UL_S = 35.0
+DEFAULT_Z_SPEED_MM_S = 50.0
+LID_MOTION_SECONDS = 20.0
+GRIPPER_MOVE_SECONDS = 25.0
+LATCH_SECONDS = 2.0
+SHAKER_SPEED_CHANGE_SECONDS = 5.0
+MANUAL_MOVE_SECONDS = 60.0
+BLOCK_HEAT_RATE_C_S = 4.0
+BLOCK_COOL_RATE_C_S = 2.0
+LID_HEAT_RATE_C_S = 0.4
+LID_COOL_RATE_C_S = 0.1
+TEMPERATURE_MODULE_RATE_C_S = 0.1
+AMBIENT_C = 25.0
+
+CATEGORIES = ("travel", "tips", "liquid", "thermal", "wait")
+
+
+class EstimatedCommand(NamedTuple):
+    step: str
+    description: str
+    seconds: Dict[str, float]
+    counts: Dict[str, float]
+
+
+class Estimate(NamedTuple):
+    commands: List[EstimatedCommand]
+    robot_seconds: float
+    critical_path_seconds: float
+    counters: Dict[str, float]
+
+    def step_totals(self) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, Dict[str, float]] = {}
+        for command in self.commands:
+            step = totals.setdefault(command.step, dict.fromkeys(CATEGORIES, 0.0))
+            for category, seconds in command.seconds.items():
+                step[category] += seconds
+        return totals
+
+    def step_counters(self) -> Dict[str, Dict[str, float]]:
+        """The counters, split by the step whose commands incremented them."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for command in self.commands:
+            step = totals.setdefault(command.step, dict.fromkeys(self.counters, 0.0))
+            for name, count in command.counts.items():
+                step[name] += count
+        return totals
+
+
+def _by_volume(table: List[Tuple[float, float]], volume: float) -> float:
+    """Interpolate a liquid class *_by_volume table the way the robot does."""
+    points = sorted(table)
+    if volume <= points[0][0]:
+        return points[0][1]
+    for (low_volume, low_value), (high_volume, high_value) in zip(points, points[1:]):
+        if volume <= high_volume:
+            fraction = (volume - low_volume) / (high_volume - low_volume)
+            return low_value + fraction * (high_value - low_value)
+    return points[-1][1]
+
+
+class _ModuleState:
+    def __init__(self) -> None:
+        self.temperature = AMBIENT_C
+        self.lid_temperature = AMBIENT_C
+        self.busy_until = 0.0
+        self.lid_busy_until = 0.0
+        # (start, end) of every thermocycler program run on the block.
+        self.programs: List[Tuple[float, float]] = []
+
+
+class RuntimeEstimator:
+    """Replays recorded commands against the cost model."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.head = SLOT_ORIGINS["D2"]
+        self.commands: List[EstimatedCommand] = []
+        self.counters: Dict[str, float] = {
+            "tip_pickups": 0,
+            "tips_used": 0,
+            "waste_chute_trips": 0,
+            "aspirates": 0,
+            "dispenses": 0,
+            "gantry_mm": 0.0,
+            "thermocycler_idle_seconds": 0.0,
+        }
+        self._modules: Dict[str, _ModuleState] = {}
+        self._tasks: Dict[str, float] = {}
+        self._has_tip: Dict[str, bool] = {}
+        self._nozzles: Dict[str, int] = {}
+        self._tips_taken: Dict[str, int] = {}
+        self._cost: Dict[str, float] = {}
+
+    # Bookkeeping
+
+    def _spend(self, category: str, seconds: float) -> None:
+        self.now += seconds
+        self._cost[category] = self._cost.get(category, 0.0) + seconds
+
+    def _module(self, target: str) -> _ModuleState:
+        return self._modules.setdefault(target, _ModuleState())
+
+    def _wait_for(self, until: float) -> None:
+        if until > self.now:
+            self._spend("wait", until - self.now)
+
+    # Motion and tips
+
+    def _move_to(self, xy: Tuple[float, float]) -> None:
+        distance = math.dist(self.head, xy)
+        self.counters["gantry_mm"] += distance
+        self._spend("travel", MOVE_OVERHEAD_SECONDS + distance / GANTRY_SPEED_MM_S)
+        self.head = xy
+
+    def _move_to_location(self, location: Any) -> None:
+        if isinstance(location, Location):
+            location = location.well
+        if isinstance(location, RecordingWell):
+            self._move_to(well_xy(location))
+        elif isinstance(location, RecordingWasteChute):
+            self._move_to(WASTE_CHUTE_XY)
+
+    def _pick_up_tip(self, pipette: RecordingInstrument, location: Any = None) -> None:
+        nozzles = self._nozzles.get(repr(pipette), pipette.channels)
+        if isinstance(location, RecordingWell):
+            well = location
+        else:
+            racks = [location] if isinstance(location, RecordingLabware) else pipette.tip_racks
+            well = self._next_tip(racks, nozzles)
+        self._move_to_location(well)
+        self._spend("tips", TIP_PICKUP_SECONDS)
+        self.counters["tip_pickups"] += 1
+        self.counters["tips_used"] += nozzles
+        self._has_tip[repr(pipette)] = True
+
+    def _next_tip(self, racks: List[RecordingLabware], nozzles: int) -> RecordingWell:
+        for rack in racks:
+            taken = self._tips_taken.get(rack.name, 0)
+            if nozzles > 1 and taken % 8:
+                taken += 8 - taken % 8
+            if taken + nozzles <= 96:
+                self._tips_taken[rack.name] = taken + nozzles
+                return rack.wells()[taken]
+        raise RuntimeError("Protocol runs out of tips")
+
+    def _drop_tip(self, pipette: RecordingInstrument, location: Any) -> None:
+        if isinstance(location, RecordingLabware):
+            location = location["A1"]
+        if location is None or isinstance(location, RecordingWasteChute):
+            self._move_to(WASTE_CHUTE_XY)
+            self.counters["waste_chute_trips"] += 1
+        else:
+            self._move_to_location(location)
+        self._spend("tips", TIP_DROP_SECONDS)
+        self._has_tip[repr(pipette)] = False
+
+    # Liquid handling
+
+    def _phase(self, pipette: RecordingInstrument, liquid_class: Any, phase: str) -> Dict[str, Any]:
+        by_tip = liquid_class.properties.get(pipette.name, {})
+        tip_uri = pipette.tip_racks[0].uri if pipette.tip_racks else None
+        return by_tip.get(tip_uri, {}).get(phase, {})
+
+    def _z_seconds(self, properties: Dict[str, Any], part: str) -> float:
+        speed = properties.get(part, {}).get("speed") or DEFAULT_Z_SPEED_MM_S
+        return WELL_DEPTH_MM / speed
+
+    def _delay(self, properties: Dict[str, Any]) -> float:
+        delay = properties.get("delay", {})
+        return delay.get("duration", 0.0) if delay.get("enabled") else 0.0
+
+    def _aspirate(self, pipette: RecordingInstrument, well: RecordingWell, volume: float, properties: Dict[str, Any]) -> None:
+        self._move_to_location(well)
+        flow = _by_volume(properties.get("flow_rate_by_volume", [(0, DEFAULT_FLOW_RATE_UL_S)]), volume)
+        self._spend(
+            "liquid",
+            self._z_seconds(properties, "submerge")
+            + volume / flow
+            + self._delay(properties)
+            + self._z_seconds(properties, "retract"),
+        )
+        self.counters["aspirates"] += 1
+
+    def _dispense(self, pipette: RecordingInstrument, well: RecordingWell, volume: float, properties: Dict[str, Any]) -> None:
+        self._move_to_location(well)
+        flow = _by_volume(properties.get("flow_rate_by_volume", [(0, DEFAULT_FLOW_RATE_UL_S)]), volume)
+        self._spend(
+            "liquid",
+            self._z_seconds(properties, "submerge")
+            + volume / flow
+            + self._delay(properties)
+            + self._z_seconds(properties, "retract"),
+        )
+        mix = properties.get("mix", {})
+        if mix.get("enabled"):
+            repetitions = mix.get("repetitions", 1)
+            self._spend("liquid", repetitions * 2 * mix.get("volume", volume) / flow)
+            self.counters["aspirates"] += repetitions
+            self.counters["dispenses"] += repetitions
+        self.counters["dispenses"] += 1
+        blowout = properties.get("retract", {}).get("blowout", {})
+        if blowout.get("enabled"):
+            if blowout.get("location") == "trash":
+                self._move_to(WASTE_CHUTE_XY)
+            self._spend("liquid", BLOWOUT_SECONDS)
+
+    def _tip_capacity(self, pipette: RecordingInstrument) -> float:
+        tip_volumes = [int(part[:-2]) for rack in pipette.tip_racks for part in rack.load_name.split("_") if part.endswith("ul")]
+        return min([pipette.max_volume] + tip_volumes)
+
+    def _new_tip_before(self, pipette: RecordingInstrument, params: Dict[str, Any], index: int, source: Any, previous_source: Any) -> None:
+        new_tip = params["new_tip"].replace("_", " ")
+        needs_tip = (
+            (new_tip == "always")
+            or (new_tip == "once" and index == 0)
+            or (new_tip == "per source" and source is not previous_source)
+        )
+        if needs_tip and self._has_tip.get(repr(pipette)):
+            self._drop_tip(pipette, params["trash_location"])
+        if needs_tip or (not self._has_tip.get(repr(pipette)) and new_tip != "never"):
+            self._pick_up_tip(pipette)
+
+    def _transfer(self, pipette: RecordingInstrument, params: Dict[str, Any]) -> None:
+        sources, dests = params["source"], params["dest"]
+        if len(sources) == 1 and len(dests) > 1:
+            sources = sources * len(dests)
+        elif len(dests) == 1 and len(sources) > 1:
+            dests = dests * len(sources)
+        aspirate = self._phase(pipette, params["liquid_class"], "aspirate")
+        dispense = self._phase(pipette, params["liquid_class"], "dispense")
+        air_gap = _by_volume(aspirate.get("retract", {}).get("air_gap_by_volume", [(0, 0)]), params["volume"])
+        trips = math.ceil(params["volume"] / (self._tip_capacity(pipette) - air_gap))
+        previous = None
+        for index, (source, dest) in enumerate(zip(sources, dests)):
+            self._new_tip_before(pipette, params, index, source, previous)
+            previous = source
+            for _ in range(trips):
+                self._aspirate(pipette, source, params["volume"] / trips, aspirate)
+                self._dispense(pipette, dest, params["volume"] / trips, dispense)
+        if not params["keep_last_tip"] and self._has_tip.get(repr(pipette)):
+            self._drop_tip(pipette, params["trash_location"])
+
+    def _distribute(self, pipette: RecordingInstrument, params: Dict[str, Any]) -> None:
+        multi = self._phase(pipette, params["liquid_class"], "multi_dispense")
+        if not multi:
+            self._transfer(pipette, params)
+            return
+        aspirate = self._phase(pipette, params["liquid_class"], "aspirate")
+        volume = params["volume"]
+        source = params["source"][0]
+        disposal = _by_volume(multi.get("disposal_by_volume", [(0, 0)]), volume)
+        conditioning = _by_volume(multi.get("conditioning_by_volume", [(0, 0)]), volume)
+        per_aspiration = max(1, int((self._tip_capacity(pipette) - disposal - conditioning) // volume))
+        dests = params["dest"]
+        for index, start in enumerate(range(0, len(dests), per_aspiration)):
+            chunk = dests[start:start + per_aspiration]
+            self._new_tip_before(pipette, params, index, source, source)
+            self._aspirate(pipette, source, volume * len(chunk) + disposal + conditioning, aspirate)
+            if conditioning:
+                self._spend("liquid", conditioning / DEFAULT_FLOW_RATE_UL_S)
+                self.counters["dispenses"] += 1
+            for dest in chunk:
+                self._dispense(pipette, dest, volume, {key: value for key, value in multi.items() if key != "retract"})
+            blowout = multi.get("retract", {}).get("blowout", {})
+            if disposal and blowout.get("enabled"):
+                if blowout.get("location") == "trash":
+                    self._move_to(WASTE_CHUTE_XY)
+                self._spend("liquid", BLOWOUT_SECONDS)
+        if not params["keep_last_tip"] and self._has_tip.get(repr(pipette)):
+            self._drop_tip(pipette, params["trash_location"])
+
+    def _mix(self, pipette: RecordingInstrument, params: Dict[str, Any]) -> None:
+        self._move_to_location(params["location"])
+        volume = params["volume"] or pipette.max_volume
+        cycle = (
+            volume / (params["aspirate_flow_rate"] or DEFAULT_FLOW_RATE_UL_S)
+            + (params["aspirate_delay"] or 0)
+            + volume / (params["dispense_flow_rate"] or DEFAULT_FLOW_RATE_UL_S)
+            + (params["dispense_delay"] or 0)
+        )
+        self._spend("liquid", params["repetitions"] * cycle)
+        self.counters["aspirates"] += params["repetitions"]
+        self.counters["dispenses"] += params["repetitions"]
+
+    # Modules
+
+    def _ramp(self, state: _ModuleState, attribute: str, target: float, heat_rate: float, cool_rate: float) -> float:
+        current = getattr(state, attribute)
+        setattr(state, attribute, target)
+        return (target - current) / heat_rate if target >= current else (current - target) / cool_rate
+
+    def _profile_seconds(self, state: _ModuleState, steps: List[Dict[str, float]], repetitions: int) -> float:
+        seconds = 0.0
+        for _ in range(repetitions):
+            for step in steps:
+                seconds += self._ramp(state, "temperature", step["temperature"], BLOCK_HEAT_RATE_C_S, BLOCK_COOL_RATE_C_S)
+                seconds += step.get("hold_time_seconds", 0) + 60 * step.get("hold_time_minutes", 0)
+        return seconds
+
+    def _module_command(self, command: RecordedCommand) -> None:
+        state = self._module(command.target)
+        params = command.params
+        name = command.name
+        if name == "start_set_temperature":
+            start = max(self.now, state.busy_until)
+            rate = TEMPERATURE_MODULE_RATE_C_S
+            state.busy_until = start + self._ramp(state, "temperature", params["celsius"], rate, rate)
+            if "task" in params:
+                self._tasks[params["task"]] = state.busy_until
+            return
+        if name == "start_execute_profile":
+            start = max(self.now, state.busy_until)
+            state.busy_until = start + self._profile_seconds(state, params["steps"], params["repetitions"])
+            state.programs.append((start, state.busy_until))
+            self._tasks[params["task"]] = state.busy_until
+            return
+        if name == "start_set_block_temperature":
+            start = max(self.now, state.busy_until)
+            seconds = self._ramp(state, "temperature", params["temperature"], BLOCK_HEAT_RATE_C_S, BLOCK_COOL_RATE_C_S)
+            state.busy_until = start + seconds
+            self._tasks[params["task"]] = state.busy_until
+            return
+        if name == "start_set_lid_temperature":
+            start = max(self.now, state.lid_busy_until)
+            seconds = self._ramp(state, "lid_temperature", params["temperature"], LID_HEAT_RATE_C_S, LID_COOL_RATE_C_S)
+            state.lid_busy_until = start + seconds
+            self._tasks[params["task"]] = state.lid_busy_until
+            return
+        self._wait_for(state.lid_busy_until if name == "set_lid_temperature" else state.busy_until)
+        if name == "await_temperature":
+            return
+        if name == "set_temperature":
+            rate = TEMPERATURE_MODULE_RATE_C_S
+            self._spend("thermal", self._ramp(state, "temperature", params["celsius"], rate, rate))
+        elif name in ("open_lid", "close_lid"):
+            self._spend("thermal", LID_MOTION_SECONDS)
+        elif name == "set_block_temperature":
+            seconds = self._ramp(state, "temperature", params["temperature"], BLOCK_HEAT_RATE_C_S, BLOCK_COOL_RATE_C_S)
+            self._spend("thermal", seconds + params["hold_time_seconds"])
+        elif name == "set_lid_temperature":
+            self._spend("thermal", self._ramp(state, "lid_temperature", params["temperature"], LID_HEAT_RATE_C_S, LID_COOL_RATE_C_S))
+        elif name == "execute_profile":
+            start = self.now
+            self._spend("thermal", self._profile_seconds(state, params["steps"], params["repetitions"]))
+            state.programs.append((start, self.now))
+        elif name in ("open_labware_latch", "close_labware_latch"):
+            self._spend("thermal", LATCH_SECONDS)
+        elif name in ("set_and_wait_for_shake_speed", "deactivate_shaker"):
+            self._spend("thermal", SHAKER_SPEED_CHANGE_SECONDS)
+        elif name == "deactivate_lid":
+            state.lid_temperature = AMBIENT_C
+        state.busy_until = self.now
+
+    # Driver
+
+    def run(self, commands: List[RecordedCommand], pipettes: Dict[str, RecordingInstrument]) -> Estimate:
+        for command in commands:
+            self._cost = {}
+            before = dict(self.counters)
+            self._dispatch(command, pipettes)
+            if self._cost:
+                counts = {name: value - before[name] for name, value in self.counters.items() if value != before[name]}
+                self.commands.append(
+                    EstimatedCommand(command.step, f"{command.target}.{command.name}", self._cost, counts)
+                )
+        critical_path = max(
+            [self.now]
+            + [max(state.busy_until, state.lid_busy_until) for state in self._modules.values()]
+        )
+        # Time the thermocycler block sits between its first and last program
+        # without running one, waiting on the pipetting in between.
+        for state in self._modules.values():
+            if state.programs:
+                spans = sorted(state.programs)
+                self.counters["thermocycler_idle_seconds"] += sum(
+                    max(0.0, start - previous_end)
+                    for (_, previous_end), (start, _) in zip(spans, spans[1:])
+                )
+        return Estimate(self.commands, self.now, critical_path, dict(self.counters))
+
+    def _dispatch(self, command: RecordedCommand, pipettes: Dict[str, RecordingInstrument]) -> None:
+        params = command.params
+        pipette = pipettes.get(command.target)
+        if pipette is not None:
+            if command.name == "pick_up_tip":
+                self._pick_up_tip(pipette, params["location"])
+            elif command.name == "drop_tip":
+                self._drop_tip(pipette, params["location"])
+            elif command.name == "configure_nozzle_layout":
+                if params["style"] == "PARTIAL_COLUMN":
+                    self._nozzles[command.target] = "ABCDEFGH".index(params["start"][0]) - "ABCDEFGH".index(params["end"][0]) + 1
+                else:
+                    self._nozzles[command.target] = pipette.channels
+            elif command.name in ("transfer_with_liquid_class", "consolidate_with_liquid_class"):
+                self._transfer(pipette, params)
+            elif command.name == "distribute_with_liquid_class":
+                self._distribute(pipette, params)
+            elif command.name == "mix":
+                self._mix(pipette, params)
+        elif command.target == "protocol":
+            if command.name == "load_module":
+                self._module(repr(params["module"]))
+            elif command.name == "delay":
+                self._spend("wait", params["seconds"])
+            elif command.name == "move_labware":
+                self._spend("travel", GRIPPER_MOVE_SECONDS if params["use_gripper"] else MANUAL_MOVE_SECONDS)
+                if isinstance(params["new_location"], RecordingWasteChute):
+                    self.counters["waste_chute_trips"] += 1
+            elif command.name == "wait_for_tasks":
+                self._wait_for(max(self._tasks.get(task, 0.0) for task in params["tasks"]))
+        elif command.target in self._modules:
+            self._module_command(command)
+
+
+def estimate(protocol_path: str, non_blocking_modules: bool = False) -> Estimate:
+    """Record a protocol and estimate its run time."""
+    context = record(protocol_path, non_blocking_modules=non_blocking_modules)
+    pipettes = {
+        repr(command.params["instrument"]): command.params["instrument"]
+        for command in context.commands
+        if command.name == "load_instrument"
+    }
+    return RuntimeEstimator().run(context.commands, pipettes)
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def print_report(result: Estimate, show_commands: bool = False) -> None:
+    if show_commands:
+        for command in result.commands:
+            print(f"{command.step:<12} {sum(command.seconds.values()):9.1f} s  {command.description}")
+        print()
+    header = f"{'Step':<12} {'Total':>9} " + " ".join(f"{category:>8}" for category in CATEGORIES)
+    print(header)
+    print("-" * len(header))
+    for step, totals in result.step_totals().items():
+        row = " ".join(f"{totals[category]:8.0f}" for category in CATEGORIES)
+        print(f"{step:<12} {_format_seconds(sum(totals.values())):>9} {row}")
+    print("-" * len(header))
+    print(f"{'Robot timeline':<22} {_format_seconds(result.robot_seconds)}")
+    print(f"{'Critical path total':<22} {_format_seconds(result.critical_path_seconds)}")
+    for name, value in result.counters.items():
+        print(f"{name:<22} {value:g}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("protocol", help="path to a protocol file defining run(protocol)")
+    parser.add_argument("--commands", action="store_true", help="list the estimate for every command")
+    parser.add_argument("--json", action="store_true", help="print per-step seconds and counters as JSON")
+    parser.add_argument(
+        "--non-blocking-modules",
+        action="store_true",
+        help="record at API 2.27, with start_execute_profile/wait_for_tasks available",
+    )
+    args = parser.parse_args(argv)
+    result = estimate(args.protocol, non_blocking_modules=args.non_blocking_modules)
+    if args.json:
+        print(json.dumps(
+            {
+                "steps": result.step_totals(),
+                "robot_seconds": result.robot_seconds,
+                "critical_path_seconds": result.critical_path_seconds,
+                "counters": result.counters,
+            },
+            indent=2,
+        ))
+    else:
+        print_report(result, show_commands=args.commands)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Reorder well visits to shorten the gantry path, and report the millimetres saved.
+
+Each liquid-class call, and each run of single-pair calls issued from the same
+line of run() (a transfer loop), is an orderable block. A block is a list of
+visits: one (source, destination) pair for transfers, or one destination for
+a single-aspiration distribute. Visits are placed at real deck coordinates
+from the slot each labware is loaded in, and ordered as an open-path TSP:
+nearest neighbour from where the head is when the block starts, then 2-opt.
+
+Two visits that touch the same well keep their order when one of them reads
+the well the other writes, so every source still holds what it held when the
+protocol was written. Plain dispenses into the same well commute and may swap,
+but a dispense whose liquid class mixes goes after every other dispense into
+its well, so the mix still finishes the reaction.
+
+The tool is report-only: it prints the new order and the millimetres saved,
+and applying an order means editing the protocol by hand.
+
+    python tools/optimize_travel.py "HiFi_Assembly_v10 (1).py"
+    python tools/optimize_travel.py "HiFi_Assembly_v10 (1).py" --json
+"""
+import argparse
+import json
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from protocol_recorder import (
+    SLOT_ORIGINS,
+    WASTE_CHUTE_XY,
+    Location,
+    RecordedCommand,
+    RecordingInstrument,
+    RecordingWasteChute,
+    RecordingWell,
+    record,
+    well_xy,
+)
+
+Point = Tuple[float, float]
+
+TIP_CHANGING = ("always",)
+
+
+class Visit(NamedTuple):
+    label: str
+    points: List[Point]
+    reads: Tuple[str, ...]
+    writes: Tuple[str, ...]
+    mixes: bool
+    command: RecordedCommand
+
+
+class Block(NamedTuple):
+    step: str
+    line: int
+    pipette: str
+    start: Point
+    visits: List[Visit]
+    # Waypoints the head passes between visits when a tip is changed.
+    tip_change: List[Point]
+
+
+class Reordering(NamedTuple):
+    step: str
+    line: int
+    pipette: str
+    original: List[str]
+    optimized: List[str]
+    original_mm: float
+    optimized_mm: float
+
+
+def _xy(location: Any) -> Optional[Point]:
+    if isinstance(location, Location):
+        location = location.well
+    if isinstance(location, RecordingWell):
+        return well_xy(location)
+    if isinstance(location, RecordingWasteChute):
+        return WASTE_CHUTE_XY
+    return None
+
+
+def _transition(block: Block, previous: Optional[Visit], visit: Visit) -> float:
+    start = previous.points[-1] if previous is not None else block.start
+    path = ([start] + block.tip_change if previous is not None else [start]) + [visit.points[0]]
+    return sum(math.dist(a, b) for a, b in zip(path, path[1:]))
+
+
+def path_length(block: Block, order: Sequence[int]) -> float:
+    length = 0.0
+    previous = None
+    for index in order:
+        visit = block.visits[index]
+        length += _transition(block, previous, visit)
+        length += sum(math.dist(a, b) for a, b in zip(visit.points, visit.points[1:]))
+        previous = visit
+    return length
+
+
+def _must_precede(block: Block, i: int, j: int) -> bool:
+    """Whether visit i has to come before visit j."""
+    first, second = block.visits[i], block.visits[j]
+    if set(first.writes) & set(second.writes) and first.mixes != second.mixes:
+        return second.mixes
+    if i > j:
+        return False
+    return bool(
+        set(first.writes) & set(second.reads)
+        or set(first.reads) & set(second.writes)
+        or set(first.writes) & set(second.writes) and first.mixes
+    )
+
+
+def _respects_order(block: Block, order: Sequence[int]) -> bool:
+    position = {index: place for place, index in enumerate(order)}
+    return not any(
+        _must_precede(block, i, j) and position[i] > position[j]
+        for i in range(len(block.visits))
+        for j in range(len(block.visits))
+        if i != j
+    )
+
+
+def solve_open_path(block: Block) -> List[int]:
+    """Nearest neighbour from the block's start, improved by 2-opt, within precedence."""
+    count = len(block.visits)
+    remaining = list(range(count))
+    order: List[int] = []
+    while remaining:
+        ready = [
+            index for index in remaining
+            if not any(_must_precede(block, other, index) for other in remaining if other != index)
+        ] or remaining[:1]
+        previous = block.visits[order[-1]] if order else None
+        nearest = min(ready, key=lambda index: _transition(block, previous, block.visits[index]))
+        remaining.remove(nearest)
+        order.append(nearest)
+
+    best = path_length(block, order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(count - 1):
+            for j in range(i + 1, count):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                length = path_length(block, candidate)
+                if length < best - 1e-6 and _respects_order(block, candidate):
+                    order, best = candidate, length
+                    improved = True
+    return order
+
+
+def _pairs(params: Dict[str, Any]) -> List[Tuple[RecordingWell, RecordingWell]]:
+    sources, dests = params["source"], params["dest"]
+    if len(sources) == 1:
+        sources = sources * len(dests)
+    elif len(dests) == 1:
+        dests = dests * len(sources)
+    return list(zip(sources, dests))
+
+
+def _mixes(command: RecordedCommand, pipette: RecordingInstrument) -> bool:
+    """Whether the call's dispense phase mixes; a distribute's multi-dispense never does."""
+    if command.name == "distribute_with_liquid_class":
+        return False
+    tip_uri = pipette.tip_racks[0].uri if pipette.tip_racks else None
+    properties = command.params["liquid_class"].properties.get(pipette.name, {}).get(tip_uri, {})
+    return bool(properties.get("dispense", {}).get("mix", {}).get("enabled"))
+
+
+def _visits(command: RecordedCommand, pipette: RecordingInstrument) -> List[Visit]:
+    params = command.params
+    mixes = _mixes(command, pipette)
+    if command.name == "distribute_with_liquid_class":
+        source = params["source"][0]
+        return [
+            Visit(repr(dest), [well_xy(dest)], (repr(source),), (repr(dest),), mixes, command)
+            for dest in params["dest"]
+        ]
+    return [
+        Visit(
+            f"{source!r} -> {dest!r}", [well_xy(source), well_xy(dest)], (repr(source),), (repr(dest),), mixes, command,
+        )
+        for source, dest in _pairs(params)
+    ]
+
+
+def find_blocks(commands: List[RecordedCommand], pipettes: Dict[str, RecordingInstrument]) -> List[Block]:
+    """Group the recorded liquid-class calls into orderable blocks."""
+    blocks: List[Block] = []
+    head: Point = SLOT_ORIGINS["D2"]
+    loop: Optional[Block] = None
+    for index, command in enumerate(commands):
+        params = command.params
+        if command.name == "configure_nozzle_layout":
+            loop = None
+            continue
+        if command.name in ("drop_tip", "pick_up_tip"):
+            point = _xy(params["location"])
+            if point is not None:
+                head = point
+            continue
+        if command.name not in ("transfer_with_liquid_class", "distribute_with_liquid_class"):
+            continue
+        pipette = pipettes[command.target]
+        visits = _visits(command, pipette)
+        rack = well_xy(pipette.tip_racks[0]["A1"]) if pipette.tip_racks else head
+        drop = next(
+            (_xy(later.params["location"]) for later in commands[index + 1:] if later.name == "drop_tip"),
+            None,
+        ) or _xy(params["trash_location"]) or WASTE_CHUTE_XY
+
+        single_pair = len(visits) == 1 and params["new_tip"] != "never"
+        if (
+            single_pair
+            and loop is not None
+            and loop.line == command.line
+            and loop.pipette == command.target
+            and loop.visits[-1].command.name == command.name
+        ):
+            loop.visits.extend(visits)
+        elif single_pair:
+            loop = Block(command.step, command.line, command.target, head, list(visits), [drop, rack])
+            blocks.append(loop)
+        else:
+            loop = None
+            if command.name == "distribute_with_liquid_class":
+                start = well_xy(params["source"][0])
+                tip_change: List[Point] = []
+            else:
+                start = head
+                tip_change = [drop, rack] if params["new_tip"] in TIP_CHANGING else []
+            blocks.append(Block(command.step, command.line, command.target, start, visits, tip_change))
+        head = visits[-1].points[-1]
+    return [block for block in blocks if len(block.visits) > 1]
+
+
+def optimize(protocol_path: str) -> List[Reordering]:
+    context = record(protocol_path)
+    pipettes = {
+        repr(command.params["instrument"]): command.params["instrument"]
+        for command in context.commands
+        if command.name == "load_instrument"
+    }
+    reorderings = []
+    for block in find_blocks(context.commands, pipettes):
+        identity = list(range(len(block.visits)))
+        order = solve_open_path(block)
+        reorderings.append(Reordering(
+            block.step,
+            block.line,
+            block.pipette,
+            [block.visits[index].label for index in identity],
+            [block.visits[index].label for index in order],
+            path_length(block, identity),
+            path_length(block, order),
+        ))
+    return reorderings
+
+
+def print_report(reorderings: List[Reordering], threshold_mm: float) -> None:
+    total = 0.0
+    for item in reorderings:
+        saved = item.original_mm - item.optimized_mm
+        total += saved
+        print(f"{item.step:<12} line {item.line:<5} {item.pipette:<16} "
+              f"{item.original_mm:8.0f} mm -> {item.optimized_mm:8.0f} mm  saves {saved:6.0f} mm")
+        if saved > threshold_mm:
+            for place, label in enumerate(item.optimized, start=1):
+                print(f"{'':<14}{place:>3}. {label}")
+    print(f"\nGantry path saved: {total:.0f} mm")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("protocol", help="path to a protocol file defining run(protocol)")
+    parser.add_argument("--json", action="store_true", help="print the reordered visits and savings as JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="list the new order for blocks saving more than this many mm (default: 10)",
+    )
+    args = parser.parse_args(argv)
+    reorderings = optimize(args.protocol)
+    if args.json:
+        print(json.dumps([item._asdict() for item in reorderings], indent=2))
+    else:
+        print_report(reorderings, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,938 @@
+"""Record the commands a protocol's run() issues, without the Opentrons stack.
+
+The recording context implements the subset of the Python Protocol API that
+the protocols in this repository use. Every call made from run() is stored as
+a RecordedCommand tagged with the "# Step N:" marker it was issued under, so
+offline tools can reason about a protocol without a robot or a simulator.
+
+Run on its own it prints the command list of one protocol, optionally with
+runtime parameters overridden:
+
+    python tools/protocol_recorder.py PROTOCOL --param cycles=30 --kind liquid
+"""
+import argparse
+import importlib.util
+import re
+import sys
+import time
+import types as python_types
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+ROWS = "ABCDEFGH"
+
+STEP_MARKER = re.compile(r"^\s*# (Steps? [0-9][0-9-]*):")
+
+# Flex deck slot origins (front-left corner, mm) and 96-well SBS geometry.
+SLOT_ORIGINS = {
+    f"{row}{column}": (164.0 * (column - 1), 107.0 * (3 - "ABCD".index(row)))
+    for row in "ABCD"
+    for column in (1, 2, 3)
+}
+WASTE_CHUTE_XY = (440.0, 43.0)
+WELL_A1_OFFSET = (14.38, 74.24)
+WELL_PITCH_MM = 9.0
+
+# Stand-ins for the names protocols import from opentrons. They are only
+# installed while the protocol module is executed.
+_NOZZLE_STYLES = ("ALL", "COLUMN", "ROW", "SINGLE", "PARTIAL_COLUMN")
+
+
+# What each recorded command does, for tools that only care about one kind.
+COMMAND_KINDS = {
+    "pick_up_tip": "tip",
+    "drop_tip": "tip",
+    "return_tip": "tip",
+    "transfer_with_liquid_class": "liquid",
+    "distribute_with_liquid_class": "liquid",
+    "consolidate_with_liquid_class": "liquid",
+    "mix": "liquid",
+    "load_liquid": "liquid",
+    "move_labware": "move",
+    "start_set_temperature": "temperature",
+    "set_temperature": "temperature",
+    "await_temperature": "temperature",
+    "set_block_temperature": "temperature",
+    "start_set_block_temperature": "temperature",
+    "set_lid_temperature": "temperature",
+    "start_set_lid_temperature": "temperature",
+    "execute_profile": "temperature",
+    "start_execute_profile": "temperature",
+    "set_target_temperature": "temperature",
+    "wait_for_temperature": "temperature",
+    "deactivate": "temperature",
+    "deactivate_lid": "temperature",
+    "deactivate_block": "temperature",
+    "deactivate_heater": "temperature",
+    "delay": "wait",
+    "wait_for_tasks": "wait",
+    "comment": "comment",
+}
+
+
+class APIVersion(NamedTuple):
+    major: int
+    minor: int
+
+    @classmethod
+    def from_string(cls, text: str) -> "APIVersion":
+        major, minor = text.split(".")
+        return cls(int(major), int(minor))
+
+    def __str__(self) -> str:
+        return f"{self.major}.{self.minor}"
+
+
+# API level that added start_execute_profile, the other start_* module
+# methods and wait_for_tasks. Protocols pinned at this level or above get them;
+# recording with non_blocking_modules raises a lower level to this one.
+NON_BLOCKING_API_VERSION = APIVersion(2, 27)
+
+
+class RecordedCommand(NamedTuple):
+    step: str
+    target: str
+    name: str
+    params: Dict[str, Any]
+    line: int = 0
+
+    @property
+    def kind(self) -> str:
+        """tip, liquid, move, temperature, wait, comment or setup."""
+        return COMMAND_KINDS.get(self.name, "setup")
+
+
+class Point(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class Location(NamedTuple):
+    well: "RecordingWell"
+    reference: str
+    z: float
+
+    @property
+    def point(self) -> Point:
+        x, y = well_xy(self.well)
+        return Point(x, y, self.z)
+
+
+class RecordingWell:
+    def __init__(self, labware: "RecordingLabware", well_name: str) -> None:
+        self.parent = labware
+        self.well_name = well_name
+        # Tip racks load full; pipettes clear the wells they take tips from.
+        self.has_tip = labware.is_tiprack
+
+    def __repr__(self) -> str:
+        return f"{self.parent.name}[{self.well_name}]"
+
+    @property
+    def grid_position(self) -> Tuple[int, int]:
+        return ROWS.index(self.well_name[0]), int(self.well_name[1:]) - 1
+
+    def top(self, z: float = 0) -> Location:
+        return Location(self, "top", z)
+
+    def bottom(self, z: float = 0) -> Location:
+        return Location(self, "bottom", z)
+
+
+class RecordingLabware:
+    def __init__(
+        self,
+        context: "RecordingProtocol",
+        load_name: str,
+        parent: Any,
+        label: Optional[str] = None,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+        is_adapter: bool = False,
+    ) -> None:
+        self._context = context
+        self.load_name = load_name
+        self.is_adapter = is_adapter
+        self.parent = parent
+        # Where the labware was loaded; parent follows it through move_labware.
+        self.origin = parent
+        self.label = label
+        self.uri = f"{namespace or 'opentrons'}/{load_name}/{version or 1}"
+        self.name = f"{load_name}@{self.slot}"
+        self._wells = {
+            f"{row}{column}": RecordingWell(self, f"{row}{column}")
+            for column in range(1, 13)
+            for row in ROWS
+        }
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __getitem__(self, well_name: str) -> RecordingWell:
+        return self._wells[well_name]
+
+    @property
+    def slot(self) -> str:
+        parent = self.parent
+        while not isinstance(parent, str):
+            parent = parent.parent
+        return parent
+
+    @property
+    def is_tiprack(self) -> bool:
+        return "tiprack" in self.load_name
+
+    def wells(self) -> List[RecordingWell]:
+        return list(self._wells.values())
+
+    def columns(self) -> List[List[RecordingWell]]:
+        wells = self.wells()
+        return [wells[index:index + 8] for index in range(0, 96, 8)]
+
+    def rows(self) -> List[List[RecordingWell]]:
+        return [[self._wells[f"{row}{column}"] for column in range(1, 13)] for row in ROWS]
+
+    def load_labware(
+        self,
+        load_name: str,
+        label: Optional[str] = None,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> "RecordingLabware":
+        return RecordingLabware(self._context, load_name, self, label, namespace, version)
+
+    def load_liquid(self, wells: List[str], liquid: "RecordingLiquid", volume: float) -> None:
+        self._context.record(self, "load_liquid", wells=list(wells), liquid=liquid, volume=volume, labware=self)
+
+
+class RecordingLiquid(NamedTuple):
+    name: str
+    description: Optional[str]
+    display_color: Optional[str]
+
+
+class RecordingLiquidClass(NamedTuple):
+    name: str
+    properties: Dict[str, Any]
+
+
+class RecordingWasteChute:
+    name = "waste_chute"
+    slot = "D3"
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class RecordingModule:
+    def __init__(self, context: "RecordingProtocol", model: str, location: str) -> None:
+        self._context = context
+        self.model = model
+        self.parent = location
+        self.name = f"{model}@{location}"
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def load_adapter(
+        self,
+        load_name: str,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> RecordingLabware:
+        adapter = RecordingLabware(self._context, load_name, self, None, namespace, version, is_adapter=True)
+        self._record("load_adapter", load_name=load_name, adapter=adapter)
+        return adapter
+
+    def load_labware(
+        self,
+        load_name: str,
+        label: Optional[str] = None,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> RecordingLabware:
+        return RecordingLabware(self._context, load_name, self, label, namespace, version)
+
+    def _record(self, command: str, /, **params: Any) -> None:
+        self._context.record(self, command, **params)
+
+
+class RecordingTemperatureModule(RecordingModule):
+    def start_set_temperature(self, celsius: float) -> Optional[str]:
+        # From API 2.27 on the call returns a task for wait_for_tasks().
+        if self._context.api_version < NON_BLOCKING_API_VERSION:
+            self._record("start_set_temperature", celsius=celsius)
+            return None
+        task = f"{self.name}.task{len(self._context.commands)}"
+        self._record("start_set_temperature", celsius=celsius, task=task)
+        return task
+
+    def set_temperature(self, celsius: float) -> None:
+        self._record("set_temperature", celsius=celsius)
+
+    def await_temperature(self, celsius: float) -> None:
+        self._record("await_temperature", celsius=celsius)
+
+    def deactivate(self) -> None:
+        self._record("deactivate")
+
+
+class RecordingThermocycler(RecordingModule):
+    def open_lid(self) -> None:
+        self._record("open_lid")
+
+    def close_lid(self) -> None:
+        self._record("close_lid")
+
+    def set_block_temperature(
+        self,
+        temperature: float,
+        hold_time_seconds: Optional[float] = None,
+        hold_time_minutes: Optional[float] = None,
+        ramp_rate: Optional[float] = None,
+        block_max_volume: Optional[float] = None,
+    ) -> None:
+        hold = (hold_time_seconds or 0) + 60 * (hold_time_minutes or 0)
+        self._record("set_block_temperature", temperature=temperature, hold_time_seconds=hold)
+
+    def set_lid_temperature(self, temperature: float) -> None:
+        self._record("set_lid_temperature", temperature=temperature)
+
+    def execute_profile(
+        self,
+        steps: List[Dict[str, float]],
+        repetitions: int,
+        block_max_volume: Optional[float] = None,
+    ) -> None:
+        self._record("execute_profile", steps=list(steps), repetitions=repetitions)
+
+    def deactivate_lid(self) -> None:
+        self._record("deactivate_lid")
+
+    def deactivate_block(self) -> None:
+        self._record("deactivate_block")
+
+    def deactivate(self) -> None:
+        self._record("deactivate")
+
+
+class NonBlockingThermocycler(RecordingThermocycler):
+    """Thermocycler exposing the non-blocking calls of API 2.27."""
+
+    def start_execute_profile(
+        self,
+        steps: List[Dict[str, float]],
+        repetitions: int,
+        block_max_volume: Optional[float] = None,
+    ) -> str:
+        task = f"{self.name}.task{len(self._context.commands)}"
+        self._record("start_execute_profile", steps=list(steps), repetitions=repetitions, task=task)
+        return task
+
+    def start_set_block_temperature(
+        self,
+        temperature: float,
+        ramp_rate: Optional[float] = None,
+        block_max_volume: Optional[float] = None,
+    ) -> str:
+        task = f"{self.name}.task{len(self._context.commands)}"
+        self._record("start_set_block_temperature", temperature=temperature, task=task)
+        return task
+
+    def start_set_lid_temperature(self, temperature: float) -> str:
+        task = f"{self.name}.task{len(self._context.commands)}"
+        self._record("start_set_lid_temperature", temperature=temperature, task=task)
+        return task
+
+
+class RecordingHeaterShaker(RecordingModule):
+    def open_labware_latch(self) -> None:
+        self._record("open_labware_latch")
+
+    def close_labware_latch(self) -> None:
+        self._record("close_labware_latch")
+
+    def set_and_wait_for_shake_speed(self, rpm: int) -> None:
+        self._record("set_and_wait_for_shake_speed", rpm=rpm)
+
+    def deactivate_shaker(self) -> None:
+        self._record("deactivate_shaker")
+
+    def set_target_temperature(self, celsius: float) -> None:
+        self._record("set_target_temperature", celsius=celsius)
+
+    def wait_for_temperature(self) -> None:
+        self._record("wait_for_temperature")
+
+    def deactivate_heater(self) -> None:
+        self._record("deactivate_heater")
+
+
+class RecordingInstrument:
+    def __init__(
+        self,
+        context: "RecordingProtocol",
+        instrument_name: str,
+        mount: str,
+        tip_racks: List[RecordingLabware],
+    ) -> None:
+        self._context = context
+        self.name = instrument_name
+        self.mount = mount
+        self.tip_racks = list(tip_racks)
+        self.channels = 8 if "8channel" in instrument_name else 1
+        self.active_channels = self.channels
+        self.max_volume = int(re.search(r"_(\d+)$", instrument_name).group(1))
+        self.has_tip = False
+        self._tip_wells: List[RecordingWell] = []
+
+    def __repr__(self) -> str:
+        return f"pipette_{self.mount}"
+
+    def _record(self, command: str, /, **params: Any) -> None:
+        self._context.record(self, command, **params)
+
+    def _next_tips(self, racks: List[RecordingLabware]) -> List[RecordingWell]:
+        """The tips a pickup from `racks` takes: the next full well, or column for a multi-channel."""
+        for rack in racks:
+            for column in rack.columns():
+                full = [well for well in column if well.has_tip]
+                if len(full) >= self.active_channels:
+                    return full[:1] if self.active_channels == 1 else full[-self.active_channels:]
+        return []
+
+    def _take_tips(self, location: Any = None) -> None:
+        if isinstance(location, Location):
+            location = location.well
+        if isinstance(location, RecordingWell):
+            row, column = location.grid_position
+            last = min(row + self.active_channels, len(ROWS))
+            wells = [location.parent[f"{ROWS[index]}{column + 1}"] for index in range(row, last)]
+        else:
+            wells = self._next_tips([location] if isinstance(location, RecordingLabware) else self.tip_racks)
+        for well in wells:
+            well.has_tip = False
+        self._tip_wells = wells
+        self.has_tip = True
+
+    def _release_tips(self, returned: bool = False) -> None:
+        if returned:
+            for well in self._tip_wells:
+                well.has_tip = True
+        self._tip_wells = []
+        self.has_tip = False
+
+    def _tip_capacity(self) -> float:
+        tip_volumes = [
+            int(part[:-2]) for rack in self.tip_racks for part in rack.load_name.split("_") if part.endswith("ul")
+        ]
+        return min([self.max_volume] + tip_volumes)
+
+    def _tips_needed(self, name: str, params: Dict[str, Any]) -> int:
+        """Tips a liquid-class call picks up, counted as the runtime estimator counts them."""
+        new_tip = params["new_tip"].replace("_", " ")
+        sources, dests = params["source"], params["dest"]
+        if new_tip == "never":
+            return 0
+        if new_tip == "once":
+            return 1
+        if len(sources) == 1:
+            sources = sources * len(dests)
+        if new_tip == "per source":
+            return sum(1 for index, source in enumerate(sources) if not index or source is not sources[index - 1])
+        tip_uri = self.tip_racks[0].uri if self.tip_racks else None
+        multi = params["liquid_class"].properties.get(self.name, {}).get(tip_uri, {}).get("multi_dispense", {})
+        if name != "distribute_with_liquid_class" or not multi:
+            return max(len(sources), len(dests))
+        reserve = sum(
+            max((value for _, value in multi.get(curve, [])), default=0)
+            for curve in ("disposal_by_volume", "conditioning_by_volume")
+        )
+        per_aspiration = max(1, int((self._tip_capacity() - reserve) // params["volume"]))
+        return -(-len(dests) // per_aspiration)
+
+    def pick_up_tip(self, location: Any = None) -> None:
+        self._record("pick_up_tip", location=location)
+        self._take_tips(location)
+
+    def drop_tip(self, location: Any = None) -> None:
+        self._record("drop_tip", location=location)
+        self._release_tips()
+
+    def return_tip(self) -> None:
+        self._record("return_tip")
+        self._release_tips(returned=True)
+
+    def configure_for_volume(self, volume: float) -> None:
+        self._record("configure_for_volume", volume=volume)
+
+    def prepare_to_aspirate(self) -> None:
+        self._record("prepare_to_aspirate")
+
+    def configure_nozzle_layout(
+        self,
+        style: Any,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        tip_racks: Optional[List[RecordingLabware]] = None,
+    ) -> None:
+        if style == "PARTIAL_COLUMN":
+            self.active_channels = ROWS.index(start[0]) - ROWS.index(end[0]) + 1
+        else:
+            self.active_channels = self.channels
+        self._record("configure_nozzle_layout", style=style, start=start, end=end)
+
+    def mix(
+        self,
+        repetitions: int = 1,
+        volume: Optional[float] = None,
+        location: Any = None,
+        rate: float = 1.0,
+        aspirate_flow_rate: Optional[float] = None,
+        dispense_flow_rate: Optional[float] = None,
+        aspirate_delay: Optional[float] = None,
+        dispense_delay: Optional[float] = None,
+        final_push_out: Optional[float] = None,
+    ) -> None:
+        self._record(
+            "mix",
+            repetitions=repetitions,
+            volume=volume,
+            location=location,
+            aspirate_flow_rate=aspirate_flow_rate,
+            dispense_flow_rate=dispense_flow_rate,
+            aspirate_delay=aspirate_delay,
+            dispense_delay=dispense_delay,
+            final_push_out=final_push_out,
+        )
+
+    def _record_liquid_class_call(
+        self,
+        name: str,
+        volume: float,
+        source: Any,
+        dest: Any,
+        new_tip: str,
+        trash_location: Any,
+        keep_last_tip: bool,
+        liquid_class: RecordingLiquidClass,
+        group_wells: bool,
+    ) -> None:
+        params = dict(
+            volume=volume,
+            source=list(source) if isinstance(source, (list, tuple)) else [source],
+            dest=list(dest) if isinstance(dest, (list, tuple)) else [dest],
+            new_tip=new_tip,
+            trash_location=trash_location,
+            keep_last_tip=keep_last_tip,
+            liquid_class=liquid_class,
+            group_wells=group_wells,
+        )
+        self._record(name, **params)
+        for _ in range(self._tips_needed(name, params)):
+            self._take_tips()
+        if not keep_last_tip:
+            self._release_tips()
+
+    def transfer_with_liquid_class(
+        self,
+        liquid_class: RecordingLiquidClass,
+        volume: float,
+        source: Any,
+        dest: Any,
+        new_tip: str = "once",
+        trash_location: Any = None,
+        return_tip: bool = False,
+        group_wells: bool = True,
+        keep_last_tip: bool = False,
+        **_: Any,
+    ) -> None:
+        self._record_liquid_class_call(
+            "transfer_with_liquid_class", volume, source, dest, new_tip,
+            trash_location, keep_last_tip, liquid_class, group_wells,
+        )
+
+    def distribute_with_liquid_class(
+        self,
+        liquid_class: RecordingLiquidClass,
+        volume: float,
+        source: Any,
+        dest: Any,
+        new_tip: str = "once",
+        trash_location: Any = None,
+        return_tip: bool = False,
+        group_wells: bool = True,
+        keep_last_tip: bool = False,
+        **_: Any,
+    ) -> None:
+        self._record_liquid_class_call(
+            "distribute_with_liquid_class", volume, source, dest, new_tip,
+            trash_location, keep_last_tip, liquid_class, group_wells,
+        )
+
+    def consolidate_with_liquid_class(
+        self,
+        liquid_class: RecordingLiquidClass,
+        volume: float,
+        source: Any,
+        dest: Any,
+        new_tip: str = "once",
+        trash_location: Any = None,
+        return_tip: bool = False,
+        group_wells: bool = True,
+        keep_last_tip: bool = False,
+        **_: Any,
+    ) -> None:
+        self._record_liquid_class_call(
+            "consolidate_with_liquid_class", volume, source, dest, new_tip,
+            trash_location, keep_last_tip, liquid_class, group_wells,
+        )
+
+
+class RuntimeParameterRequiredError(Exception):
+    """Stand-in for protocol_api.RuntimeParameterRequiredError."""
+
+
+class RecordingCsvFile:
+    """A CSV runtime parameter with no file attached, as during analysis."""
+
+    def parse_as_csv(self, **_: Any) -> List[List[str]]:
+        raise RuntimeParameterRequiredError("CSV parameter needs to be set to a file for full analysis or run.")
+
+
+class RecordingParameters:
+    """ParameterContext stand-in that sets every parameter to its default or override."""
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None) -> None:
+        self.values = python_types.SimpleNamespace()
+        self._overrides = dict(overrides or {})
+
+    def _add(self, variable_name: str, default: Any = None, **_: Any) -> None:
+        setattr(self.values, variable_name, self._overrides.pop(variable_name, default))
+
+    add_int = add_float = add_bool = add_str = _add
+
+    def add_csv_file(self, variable_name: str, **_: Any) -> None:
+        setattr(self.values, variable_name, RecordingCsvFile())
+
+
+class RecordingProtocol:
+    """Recording stand-in for ProtocolContext."""
+
+    def __init__(
+        self,
+        step_lines: Dict[int, str],
+        protocol_path: str,
+        non_blocking_modules: bool = False,
+        api_version: APIVersion = APIVersion(2, 24),
+    ) -> None:
+        self.commands: List[RecordedCommand] = []
+        self.params = python_types.SimpleNamespace()
+        self._step_lines = step_lines
+        self._protocol_path = protocol_path
+        self.api_version = max(api_version, NON_BLOCKING_API_VERSION) if non_blocking_modules else api_version
+        self._non_blocking_modules = self.api_version >= NON_BLOCKING_API_VERSION
+        if self._non_blocking_modules:
+            self.wait_for_tasks = self._wait_for_tasks
+
+    def __repr__(self) -> str:
+        return "protocol"
+
+    def is_simulating(self) -> bool:
+        return True
+
+    def current_line(self) -> int:
+        """Line of run() the current call was made from, or 0 outside run()."""
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == "run" and code.co_filename == self._protocol_path:
+                return frame.f_lineno
+            frame = frame.f_back
+        return 0
+
+    def current_step(self) -> str:
+        return self._step_lines.get(self.current_line(), "Setup")
+
+    def record(self, target: Any, command: str, /, **params: Any) -> None:
+        line = self.current_line()
+        step = self._step_lines.get(line, "Setup")
+        self.commands.append(RecordedCommand(step, repr(target), command, params, line))
+
+    def load_module(self, model: str, location: str) -> RecordingModule:
+        if model.startswith("thermocycler"):
+            cls = NonBlockingThermocycler if self._non_blocking_modules else RecordingThermocycler
+        elif model.startswith("temperature"):
+            cls = RecordingTemperatureModule
+        elif model.startswith("heaterShaker"):
+            cls = RecordingHeaterShaker
+        else:
+            cls = RecordingModule
+        module = cls(self, model, location)
+        self.record(self, "load_module", model=model, location=location, module=module)
+        return module
+
+    def load_labware(
+        self,
+        load_name: str,
+        location: str,
+        label: Optional[str] = None,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> RecordingLabware:
+        labware = RecordingLabware(self, load_name, location, label, namespace, version)
+        self.record(self, "load_labware", load_name=load_name, location=location, labware=labware)
+        return labware
+
+    def load_adapter(
+        self,
+        load_name: str,
+        location: str,
+        namespace: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> RecordingLabware:
+        adapter = RecordingLabware(self, load_name, location, None, namespace, version, is_adapter=True)
+        self.record(self, "load_adapter", load_name=load_name, location=location, adapter=adapter)
+        return adapter
+
+    def load_instrument(
+        self,
+        instrument_name: str,
+        mount: str,
+        tip_racks: Optional[List[RecordingLabware]] = None,
+    ) -> RecordingInstrument:
+        instrument = RecordingInstrument(self, instrument_name, mount, tip_racks or [])
+        self.record(self, "load_instrument", instrument_name=instrument_name, mount=mount, instrument=instrument)
+        return instrument
+
+    def load_waste_chute(self) -> RecordingWasteChute:
+        return RecordingWasteChute()
+
+    def define_liquid(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        display_color: Optional[str] = None,
+    ) -> RecordingLiquid:
+        return RecordingLiquid(name, description, display_color)
+
+    def get_liquid_class(self, name: str) -> RecordingLiquidClass:
+        return RecordingLiquidClass(name, {})
+
+    def define_liquid_class(
+        self,
+        name: str,
+        base_liquid_class: RecordingLiquidClass,
+        properties: Dict[str, Any],
+    ) -> RecordingLiquidClass:
+        self.record(
+            self, "define_liquid_class", name=name, base_liquid_class=base_liquid_class.name, properties=properties,
+        )
+        return RecordingLiquidClass(name, properties)
+
+    def move_labware(self, labware: RecordingLabware, new_location: Any, use_gripper: bool = False, **_: Any) -> None:
+        self.record(self, "move_labware", labware=labware, new_location=new_location, use_gripper=use_gripper)
+        if not isinstance(new_location, RecordingWasteChute):
+            labware.parent = new_location
+
+    def comment(self, msg: str) -> None:
+        self.record(self, "comment", msg=msg)
+
+    def delay(self, seconds: float = 0, minutes: float = 0, msg: Optional[str] = None) -> None:
+        self.record(self, "delay", seconds=seconds + 60 * minutes, msg=msg)
+
+    def _wait_for_tasks(self, tasks: List[Any]) -> None:
+        self.record(self, "wait_for_tasks", tasks=list(tasks))
+
+
+def well_xy(well: RecordingWell) -> Tuple[float, float]:
+    """Deck x/y of a well's centre, from the slot its labware is loaded in."""
+    slot_x, slot_y = SLOT_ORIGINS[well.parent.slot]
+    row, column = well.grid_position
+    return (
+        slot_x + WELL_A1_OFFSET[0] + column * WELL_PITCH_MM,
+        slot_y + WELL_A1_OFFSET[1] - row * WELL_PITCH_MM,
+    )
+
+
+def step_markers(protocol_path: str) -> Dict[int, str]:
+    """Map every line of run() to the "# Step N:" marker it falls under."""
+    with open(protocol_path, encoding="utf-8") as handle:
+        lines = handle.read().split("\n")
+    markers = {}
+    current = "Setup"
+    for number, line in enumerate(lines, start=1):
+        match = STEP_MARKER.match(line)
+        if match:
+            current = match.group(1)
+        elif line and not line[0].isspace():
+            current = "Setup"
+        markers[number] = current
+    return markers
+
+
+def _opentrons_shims() -> Dict[str, python_types.ModuleType]:
+    opentrons = python_types.ModuleType("opentrons")
+    protocol_api = python_types.ModuleType("opentrons.protocol_api")
+    for style in _NOZZLE_STYLES:
+        setattr(protocol_api, style, style)
+    for name in ("ProtocolContext", "ParameterContext", "InstrumentContext", "Labware", "Well"):
+        setattr(protocol_api, name, Any)
+    protocol_api.RuntimeParameterRequiredError = RuntimeParameterRequiredError
+    opentrons_types = python_types.ModuleType("opentrons.types")
+    opentrons_types.Point = Point
+    protocols = python_types.ModuleType("opentrons.protocols")
+    api_support = python_types.ModuleType("opentrons.protocols.api_support")
+    api_support_types = python_types.ModuleType("opentrons.protocols.api_support.types")
+    api_support_types.APIVersion = APIVersion
+    opentrons.protocol_api = protocol_api
+    opentrons.types = opentrons_types
+    opentrons.protocols = protocols
+    protocols.api_support = api_support
+    api_support.types = api_support_types
+    return {
+        "opentrons": opentrons,
+        "opentrons.protocol_api": protocol_api,
+        "opentrons.types": opentrons_types,
+        "opentrons.protocols": protocols,
+        "opentrons.protocols.api_support": api_support,
+        "opentrons.protocols.api_support.types": api_support_types,
+    }
+
+
+def load_protocol(protocol_path: str) -> python_types.ModuleType:
+    """Import a protocol file against the stand-in opentrons modules."""
+    shims = _opentrons_shims()
+    saved = {name: sys.modules.get(name) for name in shims}
+    sys.modules.update(shims)
+    try:
+        spec = importlib.util.spec_from_file_location("recorded_protocol", protocol_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        for name, previous in saved.items():
+            if previous is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = previous
+    return module
+
+
+def _record_module(
+    module: python_types.ModuleType,
+    step_lines: Dict[int, str],
+    non_blocking_modules: bool,
+    parameters: Optional[Dict[str, Any]],
+) -> RecordingProtocol:
+    api_level = getattr(module, "requirements", {}).get("apiLevel", "2.24")
+    context = RecordingProtocol(
+        step_lines, module.__file__, non_blocking_modules, APIVersion.from_string(api_level),
+    )
+    if hasattr(module, "add_parameters"):
+        recording_parameters = RecordingParameters(parameters)
+        module.add_parameters(recording_parameters)
+        if recording_parameters._overrides:
+            raise ValueError(f"Unknown runtime parameters: {', '.join(sorted(recording_parameters._overrides))}")
+        context.params = recording_parameters.values
+    elif parameters:
+        raise ValueError("Protocol defines no runtime parameters")
+    module.run(context)
+    return context
+
+
+def apply_settings(module: python_types.ModuleType, settings: Dict[str, Any]) -> None:
+    """Override module-level settings of a loaded protocol, such as PIPELINE_PCR."""
+    for name, value in settings.items():
+        if not hasattr(module, name):
+            raise ValueError(f"Protocol has no setting {name}")
+        setattr(module, name, value)
+
+
+def record(
+    protocol_path: str,
+    non_blocking_modules: bool = False,
+    parameters: Optional[Dict[str, Any]] = None,
+    settings: Optional[Dict[str, Any]] = None,
+) -> RecordingProtocol:
+    """Run a protocol file's run() against a RecordingProtocol and return it.
+
+    `parameters` overrides the defaults set in the protocol's add_parameters(),
+    `settings` the module-level constants the protocol reads in run().
+    """
+    module = load_protocol(protocol_path)
+    apply_settings(module, settings or {})
+    return _record_module(module, step_markers(protocol_path), non_blocking_modules, parameters)
+
+
+def sweep(
+    protocol_path: str,
+    variants: Iterable[Dict[str, Any]],
+    non_blocking_modules: bool = False,
+) -> Iterator[Tuple[Dict[str, Any], RecordingProtocol]]:
+    """Record one run per set of runtime parameters, importing the protocol once."""
+    module = load_protocol(protocol_path)
+    step_lines = step_markers(protocol_path)
+    for variant in variants:
+        yield variant, _record_module(module, step_lines, non_blocking_modules, variant)
+
+
+def parse_parameter(text: str) -> Tuple[str, Any]:
+    """Split a NAME=VALUE option, reading the value as a number or boolean where it is one."""
+    name, separator, value = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    if value.lower() in ("true", "false"):
+        return name, value.lower() == "true"
+    for convert in (int, float):
+        try:
+            return name, convert(value)
+        except ValueError:
+            pass
+    return name, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("protocol", help="path to the protocol .py file")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        type=parse_parameter,
+        metavar="NAME=VALUE",
+        help="override a runtime parameter; repeatable",
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        type=parse_parameter,
+        metavar="NAME=VALUE",
+        help="override a module-level setting such as PIPELINE_PCR; repeatable",
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=sorted(set(COMMAND_KINDS.values()) | {"setup"}),
+        help="only print commands of this kind; repeatable",
+    )
+    parser.add_argument(
+        "--non-blocking-modules",
+        action="store_true",
+        help="record at API 2.27 at least, with the non-blocking module calls",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    context = record(args.protocol, args.non_blocking_modules, dict(args.param), dict(args.set))
+    elapsed = time.perf_counter() - started
+    for command in context.commands:
+        if args.kind and command.kind not in args.kind:
+            continue
+        params = ", ".join(f"{name}={value!r}" for name, value in command.params.items())
+        print(f"{command.step:<12} {command.kind:<12} {command.target}.{command.name}({params})")
+    print(f"\n{len(context.commands)} commands recorded in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Replay a recorded protocol run against the Opentrons simulator.
+
+The recording stand-in accepts anything the protocols ask of it; the real
+Protocol API checks labware, volumes and tip state. Replaying the recorded
+command list through `opentrons.simulate` cross-checks the two: a command the
+real API rejects is reported with the step and run() line it came from.
+
+Needs the `opentrons` package. Usage:
+
+    python tools/replay_simulator.py PROTOCOL [--param NAME=VALUE ...]
+"""
+import argparse
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from protocol_recorder import (
+    Location,
+    RecordedCommand,
+    RecordingLabware,
+    RecordingLiquid,
+    RecordingLiquidClass,
+    RecordingModule,
+    RecordingWasteChute,
+    RecordingWell,
+    parse_parameter,
+    record,
+)
+
+API_LEVEL = "2.24"
+
+# Recorded commands that only create objects; the replay builds those on
+# first use instead.
+_LOAD_COMMANDS = ("load_labware", "load_adapter", "load_module", "load_instrument", "define_liquid_class")
+
+
+class ReplayFailed(Exception):
+    def __init__(self, command: RecordedCommand, error: Exception) -> None:
+        super().__init__(f"{command.step} (line {command.line}): {command.target}.{command.name}: {error}")
+        self.command = command
+
+
+class Replay:
+    """Issue recorded commands on a real ProtocolContext, mapping each recorded object to its real twin."""
+
+    def __init__(self, protocol: Any) -> None:
+        from opentrons import protocol_api
+
+        self._protocol = protocol
+        self._protocol_api = protocol_api
+        self._targets: Dict[str, Any] = {"protocol": protocol}
+        self._labware: Dict[int, Any] = {}
+        self._liquids: Dict[str, Any] = {}
+        self._liquid_classes: Dict[str, Any] = {}
+        self._tasks: Dict[str, Any] = {}
+        self._waste_chute: Optional[Any] = None
+
+    def _module(self, module: RecordingModule) -> Any:
+        if module.name not in self._targets:
+            self._targets[module.name] = self._protocol.load_module(module.model, module.parent)
+        return self._targets[module.name]
+
+    def _load_labware(self, labware: RecordingLabware) -> Any:
+        if id(labware) in self._labware:
+            return self._labware[id(labware)]
+        origin = labware.origin
+        options = {"namespace": labware.uri.split("/")[0], "version": int(labware.uri.split("/")[-1])}
+        if isinstance(origin, str):
+            parent, location = self._protocol, (origin,)
+        else:
+            parent = self._module(origin) if isinstance(origin, RecordingModule) else self._load_labware(origin)
+            location = ()
+        if labware.is_adapter:
+            real = parent.load_adapter(labware.load_name, *location, **options)
+        else:
+            real = parent.load_labware(labware.load_name, *location, label=labware.label, **options)
+        self._labware[id(labware)] = real
+        self._targets[labware.name] = real
+        return real
+
+    def _liquid_class(self, liquid_class: RecordingLiquidClass) -> Any:
+        if liquid_class.name not in self._liquid_classes:
+            self._liquid_classes[liquid_class.name] = self._protocol.get_liquid_class(liquid_class.name)
+        return self._liquid_classes[liquid_class.name]
+
+    def real(self, value: Any) -> Any:
+        """The real counterpart of a recorded argument."""
+        if isinstance(value, list):
+            return [self.real(item) for item in value]
+        if isinstance(value, RecordingWell):
+            return self._load_labware(value.parent)[value.well_name]
+        if isinstance(value, Location):
+            well = self.real(value.well)
+            return well.top(value.z) if value.reference == "top" else well.bottom(value.z)
+        if isinstance(value, RecordingLabware):
+            return self._load_labware(value)
+        if isinstance(value, RecordingModule):
+            return self._module(value)
+        if isinstance(value, RecordingLiquidClass):
+            return self._liquid_class(value)
+        if isinstance(value, RecordingLiquid):
+            if value.name not in self._liquids:
+                self._liquids[value.name] = self._protocol.define_liquid(
+                    value.name, description=value.description, display_color=value.display_color,
+                )
+            return self._liquids[value.name]
+        if isinstance(value, RecordingWasteChute):
+            if self._waste_chute is None:
+                self._waste_chute = self._protocol.load_waste_chute()
+            return self._waste_chute
+        if isinstance(value, str) and value in self._tasks:
+            return self._tasks[value]
+        return value
+
+    def _load(self, command: RecordedCommand) -> None:
+        params = command.params
+        if command.name == "load_labware":
+            self._load_labware(params["labware"])
+        elif command.name == "load_adapter":
+            self._load_labware(params["adapter"])
+        elif command.name == "load_module":
+            self._module(params["module"])
+        elif command.name == "load_instrument":
+            instrument = params["instrument"]
+            self._targets[repr(instrument)] = self._protocol.load_instrument(
+                instrument.name,
+                instrument.mount,
+                tip_racks=[self._load_labware(rack) for rack in instrument.tip_racks],
+            )
+        else:
+            self._liquid_classes[params["name"]] = self._protocol.define_liquid_class(
+                name=params["name"],
+                properties=params["properties"],
+                base_liquid_class=self._liquid_class(RecordingLiquidClass(params["base_liquid_class"], {})),
+            )
+
+    def apply(self, command: RecordedCommand) -> None:
+        """Issue one recorded command; raises ReplayFailed if the real API rejects it."""
+        try:
+            if command.name in _LOAD_COMMANDS:
+                self._load(command)
+                return
+            params = {name: self.real(value) for name, value in command.params.items() if value is not None}
+            task = params.pop("task", None)
+            if command.name == "load_liquid":
+                params.pop("labware")
+            elif command.name == "configure_nozzle_layout":
+                params["style"] = getattr(self._protocol_api, params["style"])
+            result = getattr(self._targets[command.target], command.name)(**params)
+            if task is not None:
+                self._tasks[task] = result
+        except Exception as error:
+            raise ReplayFailed(command, error) from error
+
+
+def replay(commands: List[RecordedCommand], protocol: Optional[Any] = None, api_level: str = API_LEVEL) -> Any:
+    """Replay `commands` on `protocol`, a fresh Flex simulation context at `api_level` by default, and return it."""
+    if protocol is None:
+        from opentrons import simulate
+
+        protocol = simulate.get_protocol_api(api_level, robot_type="Flex")
+    replaying = Replay(protocol)
+    for command in commands:
+        replaying.apply(command)
+    return protocol
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("protocol", help="path to the protocol .py file")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        type=parse_parameter,
+        metavar="NAME=VALUE",
+        help="override a runtime parameter; repeatable",
+    )
+    parser.add_argument(
+        "--non-blocking-modules",
+        action="store_true",
+        help="record at API 2.27 at least, with the non-blocking module calls",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    context = record(args.protocol, args.non_blocking_modules, dict(args.param))
+    recorded = time.perf_counter() - started
+    try:
+        replay(context.commands, api_level=str(context.api_version))
+    except ReplayFailed as error:
+        print(f"Replay failed at {error}", file=sys.stderr)
+        sys.exit(1)
+    replayed = time.perf_counter() - started - recorded
+    print(f"{len(context.commands)} commands recorded in {recorded:.2f} s and replayed in {replayed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
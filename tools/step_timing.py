@@ -0,0 +1,251 @@
+"""Time the steps of a real run from its exported Flex run log.
+
+The "# Step N:" markers are source comments and never reach the robot, so the
+run log has nothing to split on. `instrument` writes a copy of a protocol whose
+run() announces every step with a protocol.comment() carrying a running
+counter and the step name; upload that copy for the run to be profiled:
+
+    python tools/step_timing.py instrument Q5_PCR_Tm65Tm68__DpnI.py
+
+`report` reads the run log downloaded from the Flex app (the JSON with a
+"commands" list) and prints how long each step took, broken down by command
+type. `--folded` also writes the breakdown as folded stacks for flamegraph.pl
+or speedscope.
+
+    python tools/step_timing.py report run_log.json --folded steps.folded
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from protocol_recorder import STEP_MARKER
+
+MARKER_PREFIX = "STEP-MARKER"
+MARKER = re.compile(rf"^{MARKER_PREFIX} (\d+) (begin|end) (.+)$")
+BAR_WIDTH = 40
+
+# Appended to the instrumented copy. The protocol's own run() is renamed to
+# _uninstrumented_run() and wrapped, so the copy still defines a single run(),
+# as the Protocol API requires, and the last step is closed even when the
+# protocol raises or returns early.
+_STEP_LOG_SOURCE = '''
+
+# Step markers added by tools/step_timing.py.
+class _StepLog:
+    def __init__(self) -> None:
+        self.protocol = None
+        self.counter = 0
+        self.open_step = None
+
+    def _mark(self, event: str, step: str) -> None:
+        self.counter += 1
+        self.protocol.comment(f"{prefix} {{self.counter}} {{event}} {{step}}")
+
+    def begin(self, step: str) -> None:
+        self.end()
+        self.open_step = step
+        self._mark("begin", step)
+
+    def end(self) -> None:
+        if self.open_step is not None:
+            self._mark("end", self.open_step)
+            self.open_step = None
+
+
+_STEP_LOG = _StepLog()
+
+
+def run(protocol):
+    _STEP_LOG.protocol = protocol
+    _STEP_LOG.begin("Setup")
+    try:
+        _uninstrumented_run(protocol)
+    finally:
+        _STEP_LOG.end()
+'''
+
+# Lines that continue a compound statement; a marker call cannot go before them.
+_CONTINUATIONS = ("else", "elif", "except", "finally")
+
+
+def instrument(source: str) -> str:
+    """Return `source` with a step marker call after every "# Step N:" comment of run()."""
+    lines = source.split("\n")
+    run_start = next(
+        (number for number, line in enumerate(lines) if line.startswith("def run(")),
+        None,
+    )
+    if run_start is None:
+        raise ValueError("no top-level run() to instrument")
+    inserts: List[Tuple[int, str]] = []
+    for number in range(run_start + 1, len(lines)):
+        line = lines[number]
+        if line and not line[0].isspace():
+            break
+        match = STEP_MARKER.match(line)
+        if not match:
+            continue
+        # Place the call right before the first statement under the marker,
+        # at that statement's indentation.
+        target = number + 1
+        while target < len(lines) and (not lines[target].strip() or lines[target].lstrip().startswith("#")):
+            target += 1
+        statement = lines[target] if target < len(lines) else ""
+        if not statement[:1].isspace() or statement.lstrip().split(":")[0].split()[0] in _CONTINUATIONS:
+            raise ValueError(f"line {number + 1}: {match.group(1)} marker is not followed by a statement")
+        indent = statement[:len(statement) - len(statement.lstrip())]
+        inserts.append((target, f"{indent}_STEP_LOG.begin({match.group(1)!r})"))
+    if not inserts:
+        raise ValueError("run() has no step markers")
+    for target, call in reversed(inserts):
+        lines.insert(target, call)
+    lines[run_start] = lines[run_start].replace("def run(", "def _uninstrumented_run(", 1)
+    instrumented = "\n".join(lines).rstrip("\n") + _STEP_LOG_SOURCE.format(prefix=MARKER_PREFIX)
+    compile(instrumented, "<instrumented>", "exec")
+    return instrumented
+
+
+class CommandTiming(NamedTuple):
+    command_type: str
+    started: datetime.datetime
+    completed: datetime.datetime
+
+
+class StepTiming(NamedTuple):
+    step: str
+    started: datetime.datetime
+    completed: datetime.datetime
+    commands: List[CommandTiming]
+
+    @property
+    def seconds(self) -> float:
+        return (self.completed - self.started).total_seconds()
+
+    def by_command_type(self) -> Dict[str, float]:
+        """Seconds per command type, plus what no command accounts for (pauses, planning)."""
+        totals: Dict[str, float] = {}
+        for command in self.commands:
+            seconds = (command.completed - command.started).total_seconds()
+            totals[command.command_type] = totals.get(command.command_type, 0.0) + seconds
+        totals["(between commands)"] = max(0.0, self.seconds - sum(totals.values()))
+        return totals
+
+
+def _timestamp(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_run_log(run_log: Any) -> List[StepTiming]:
+    """Split a run log's commands into the steps announced by the marker comments."""
+    commands = run_log["commands"] if isinstance(run_log, dict) else run_log
+    steps: List[StepTiming] = []
+    current: Optional[StepTiming] = None
+    expected = 1
+    for command in commands:
+        if not command.get("startedAt") or not command.get("completedAt"):
+            continue
+        started, completed = _timestamp(command["startedAt"]), _timestamp(command["completedAt"])
+        match = None
+        if command["commandType"] == "comment":
+            match = MARKER.match(command.get("params", {}).get("message", ""))
+        if match is None:
+            if current is not None:
+                current.commands.append(CommandTiming(command["commandType"], started, completed))
+            continue
+        counter, event, step = int(match.group(1)), match.group(2), match.group(3)
+        if counter != expected:
+            print(f"warning: marker {counter} follows {expected - 1}; markers are missing from the log", file=sys.stderr)
+        expected = counter + 1
+        if event == "begin":
+            current = StepTiming(step, completed, completed, [])
+        elif current is not None and current.step == step:
+            steps.append(current._replace(completed=started))
+            current = None
+    if current is not None:
+        # The run stopped inside a step; time it up to its last command.
+        last = current.commands[-1].completed if current.commands else current.started
+        steps.append(current._replace(completed=last))
+    return steps
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def merge_steps(steps: List[StepTiming]) -> Dict[str, List[StepTiming]]:
+    """Group repeated entries of a step, in order of first appearance."""
+    merged: Dict[str, List[StepTiming]] = {}
+    for step in steps:
+        merged.setdefault(step.step, []).append(step)
+    return merged
+
+
+def print_report(steps: List[StepTiming]) -> None:
+    total = sum(step.seconds for step in steps) or 1.0
+    print(f"{'Step':<14} {'Time':>9} {'Share':>6}")
+    print("-" * (31 + BAR_WIDTH))
+    for name, entries in merge_steps(steps).items():
+        seconds = sum(entry.seconds for entry in entries)
+        bar = "#" * round(BAR_WIDTH * seconds / total)
+        print(f"{name:<14} {_format_seconds(seconds):>9} {seconds / total:6.1%} {bar}")
+        breakdown: Dict[str, float] = {}
+        for entry in entries:
+            for command_type, command_seconds in entry.by_command_type().items():
+                breakdown[command_type] = breakdown.get(command_type, 0.0) + command_seconds
+        for command_type, command_seconds in sorted(breakdown.items(), key=lambda item: -item[1]):
+            if command_seconds < 0.5:
+                continue
+            bar = "-" * round(BAR_WIDTH * command_seconds / total)
+            print(f"  {command_type:<28} {_format_seconds(command_seconds):>9} {bar}")
+    print("-" * (31 + BAR_WIDTH))
+    print(f"{'Total':<14} {_format_seconds(total):>9}")
+
+
+def folded_stacks(steps: List[StepTiming], run_name: str = "run") -> List[str]:
+    """One "run;step;command type milliseconds" line per stack, for flame graph tools."""
+    totals: Dict[str, float] = {}
+    for step in steps:
+        for command_type, seconds in step.by_command_type().items():
+            stack = f"{run_name};{step.step};{command_type}"
+            totals[stack] = totals.get(stack, 0.0) + seconds
+    return [f"{stack} {round(seconds * 1000)}" for stack, seconds in totals.items() if seconds > 0]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    instrument_parser = commands.add_parser("instrument", help="write a protocol copy that logs its steps")
+    instrument_parser.add_argument("protocol", help="path to the protocol .py file")
+    instrument_parser.add_argument("-o", "--output", help="where to write the copy (default: PROTOCOL_steps.py)")
+    report_parser = commands.add_parser("report", help="time the steps of an exported run log")
+    report_parser.add_argument("run_log", help="run log JSON downloaded from the Flex app")
+    report_parser.add_argument("--folded", metavar="OUT", help="also write folded stacks for a flame graph")
+    args = parser.parse_args(argv)
+
+    if args.command == "instrument":
+        with open(args.protocol, encoding="utf-8") as handle:
+            instrumented = instrument(handle.read())
+        output = args.output or f"{os.path.splitext(args.protocol)[0]}_steps.py"
+        with open(output, "w", encoding="utf-8") as handle:
+            handle.write(instrumented)
+        print(f"Wrote {output}")
+        return
+
+    with open(args.run_log, encoding="utf-8") as handle:
+        steps = parse_run_log(json.load(handle))
+    if not steps:
+        sys.exit(f"{args.run_log} has no {MARKER_PREFIX} comments; was the protocol instrumented?")
+    print_report(steps)
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(folded_stacks(steps)) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""Find new_tip="always" steps that could safely reuse a tip, and rewrite them.
+
+Well contents are tracked as the set of liquids each well holds, starting from
+the protocol's load_liquid calls. Adding liquid to a well that already holds
+something makes that well a reaction of its own, recorded as a token naming
+the well: replicate wells built from the same reagents are still different
+reactions. A tip is modelled as carrying everything it has touched: the source
+it aspirated from and, unless the liquid class dispenses from the well top,
+the destination it dispensed into. Reusing a tip is proven safe only if every
+well it enters already holds, or is about to receive, everything the tip
+carries. Fresh wells filled from one source qualify; a tip that has been in
+one replicate reaction may not enter the next, and a source revisited after
+the tip has been in a reaction well does not qualify either.
+
+Three rewrites are tried for each step, in order:
+
+* once: the whole step shares one tip.
+* once per group: the wells are split into groups with identical contents,
+  and each group shares one tip.
+* distribute per group: each group gets a single-aspiration distribute, so
+  the tip never goes back to the source.
+
+    python tools/tip_reuse.py Q5_PCR_Tm65Tm68__DpnI.py
+    python tools/tip_reuse.py Q5_PCR_Tm65Tm68__DpnI.py --rewrite rewritten.py
+"""
+import argparse
+import ast
+import math
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from estimate_runtime import GANTRY_SPEED_MM_S, MOVE_OVERHEAD_SECONDS, TIP_DROP_SECONDS, TIP_PICKUP_SECONDS
+from protocol_recorder import (
+    ROWS,
+    SLOT_ORIGINS,
+    WASTE_CHUTE_XY,
+    RecordedCommand,
+    RecordingInstrument,
+    RecordingWell,
+    record,
+)
+
+Contents = FrozenSet[str]
+
+LIQUID_CLASS_CALLS = (
+    "transfer_with_liquid_class",
+    "distribute_with_liquid_class",
+    "consolidate_with_liquid_class",
+)
+
+
+class TipReuse(NamedTuple):
+    step: str
+    line: int
+    pipette: str
+    rewrite: str
+    groups: List[List[Tuple[str, str]]]
+    tips_before: int
+    tips_after: int
+    seconds_saved: float
+    note: str
+
+
+def tip_cycle_seconds(pipette: RecordingInstrument) -> float:
+    """Time one pickup and chute drop costs, as estimate_runtime models it."""
+    rack_xy = SLOT_ORIGINS[pipette.tip_racks[0].slot] if pipette.tip_racks else SLOT_ORIGINS["A2"]
+    detour = 2 * ((rack_xy[0] - WASTE_CHUTE_XY[0]) ** 2 + (rack_xy[1] - WASTE_CHUTE_XY[1]) ** 2) ** 0.5
+    return TIP_PICKUP_SECONDS + TIP_DROP_SECONDS + 2 * MOVE_OVERHEAD_SECONDS + detour / GANTRY_SPEED_MM_S
+
+
+def _label(well: RecordingWell) -> str:
+    return f"{well.parent.slot}:{well.well_name}"
+
+
+def _phase(pipette: RecordingInstrument, liquid_class: Any, phase: str) -> Dict[str, Any]:
+    tip_uri = pipette.tip_racks[0].uri if pipette.tip_racks else None
+    return liquid_class.properties.get(pipette.name, {}).get(tip_uri, {}).get(phase, {})
+
+
+def _dispenses_into_liquid(phase: Dict[str, Any]) -> bool:
+    """Whether a dispense phase releases below the well top, where the tip meets what the well holds."""
+    return phase.get("dispense_position", {}).get("position_reference") != "well-top"
+
+
+def _added(well: RecordingWell, held: Contents, delivered: Contents) -> Contents:
+    """What `well` holds once `delivered` is added to what it `held`."""
+    if held and not delivered <= held:
+        return held | delivered | {f"reaction in {_label(well)}"}
+    return held | delivered
+
+
+class _Tracker:
+    """Well contents as the protocol runs, with fresh tips as written."""
+
+    def __init__(self) -> None:
+        self.contents: Dict[str, Contents] = {}
+        self.nozzles: Dict[str, int] = {}
+
+    def of(self, well: RecordingWell) -> Contents:
+        return self.contents.get(repr(well), frozenset())
+
+    def covered(self, pipette: str, well: RecordingWell) -> List[RecordingWell]:
+        """Wells a pipette enters when its primary nozzle goes to `well`."""
+        nozzles = self.nozzles.get(pipette, 1)
+        if nozzles == 1:
+            return [well]
+        row, column = well.grid_position
+        first = row if nozzles == 8 else row - nozzles + 1
+        return [well.parent[f"{ROWS[index]}{column + 1}"] for index in range(first, first + nozzles)]
+
+    def pairs(self, params: Dict[str, Any]) -> List[Tuple[RecordingWell, RecordingWell]]:
+        sources, dests = params["source"], params["dest"]
+        if len(sources) == 1:
+            sources = sources * len(dests)
+        elif len(dests) == 1:
+            dests = dests * len(sources)
+        return list(zip(sources, dests))
+
+    def apply(self, command: RecordedCommand, pipettes: Dict[str, RecordingInstrument]) -> None:
+        params = command.params
+        if command.name == "load_liquid":
+            for well_name in params["wells"]:
+                key = f"{command.target}[{well_name}]"
+                self.contents[key] = self.contents.get(key, frozenset()) | {params["liquid"].name}
+        elif command.name == "configure_nozzle_layout":
+            pipette = pipettes[command.target]
+            if params["style"] == "PARTIAL_COLUMN":
+                self.nozzles[command.target] = ROWS.index(params["start"][0]) - ROWS.index(params["end"][0]) + 1
+            else:
+                self.nozzles[command.target] = pipette.channels
+        elif command.name in LIQUID_CLASS_CALLS:
+            for source, dest in self.pairs(params):
+                for source_well, dest_well in zip(self.covered(command.target, source), self.covered(command.target, dest)):
+                    self.contents[repr(dest_well)] = _added(dest_well, self.of(dest_well), self.of(source_well))
+
+
+class _Proof:
+    """Follows one reused tip through a sequence of well entries."""
+
+    def __init__(self, contents: Dict[str, Contents]) -> None:
+        self.contents = dict(contents)
+        self.tip: Contents = frozenset()
+        self.failure = ""
+
+    def enter_source(self, well: RecordingWell) -> bool:
+        held = self.contents.get(repr(well), frozenset())
+        if not self.tip <= held:
+            self.failure = f"tip carries {sorted(self.tip - held)} back into {_label(well)}"
+            return False
+        self.tip |= held
+        return True
+
+    def enter_dest(self, well: RecordingWell, delivered: Contents, contact: bool = True) -> bool:
+        """Dispense into `well`; without contact the tip stays clear of what it holds."""
+        after = _added(well, self.contents.get(repr(well), frozenset()), delivered)
+        if contact:
+            if not self.tip <= after:
+                self.failure = f"tip carries {sorted(self.tip - after)} into {_label(well)}"
+                return False
+            self.tip |= after
+        self.contents[repr(well)] = after
+        return True
+
+
+class TipReuseAnalyzer:
+    def __init__(self, pipettes: Dict[str, RecordingInstrument]) -> None:
+        self.pipettes = pipettes
+        self.tracker = _Tracker()
+
+    def run(self, commands: List[RecordedCommand]) -> List[TipReuse]:
+        findings = []
+        for command in commands:
+            if command.name in LIQUID_CLASS_CALLS and command.params["new_tip"] == "always":
+                finding = self.analyze(command)
+                if finding is not None:
+                    findings.append(finding)
+            self.tracker.apply(command, self.pipettes)
+        return findings
+
+    def _groups(self, pairs: List[Tuple[RecordingWell, RecordingWell]]) -> List[List[Tuple[RecordingWell, RecordingWell]]]:
+        """Split pairs into replicates: same source contents into the same destination contents."""
+        groups: Dict[Tuple[Contents, Contents], List[Tuple[RecordingWell, RecordingWell]]] = {}
+        for source, dest in pairs:
+            groups.setdefault((self.tracker.of(source), self.tracker.of(dest)), []).append((source, dest))
+        return list(groups.values())
+
+    def _trips(self, pipette: RecordingInstrument, volume: float) -> int:
+        return math.ceil(volume / pipette.max_volume)
+
+    def _once_is_safe(
+        self,
+        pipette: RecordingInstrument,
+        group: List[Tuple[RecordingWell, RecordingWell]],
+        volume: float,
+        contact: bool,
+    ) -> Tuple[bool, str]:
+        proof = _Proof(self.tracker.contents)
+        for source, dest in group:
+            for _ in range(self._trips(pipette, volume)):
+                if not proof.enter_source(source):
+                    return False, proof.failure
+                if not proof.enter_dest(dest, proof.contents.get(repr(source), frozenset()), contact):
+                    return False, proof.failure
+        return True, ""
+
+    def _distribute_is_safe(
+        self,
+        pipette: RecordingInstrument,
+        group: List[Tuple[RecordingWell, RecordingWell]],
+        volume: float,
+        contact: bool,
+    ) -> Tuple[bool, str]:
+        sources = {repr(source) for source, _ in group}
+        if len(sources) > 1:
+            return False, "group has more than one source"
+        if volume * len(group) > pipette.max_volume:
+            return False, "group does not fit one aspiration"
+        proof = _Proof(self.tracker.contents)
+        source = group[0][0]
+        proof.enter_source(source)
+        for _, dest in group:
+            if not proof.enter_dest(dest, self.tracker.of(source), contact):
+                return False, proof.failure
+        return True, ""
+
+    def analyze(self, command: RecordedCommand) -> Optional[TipReuse]:
+        pipette = self.pipettes[command.target]
+        params = command.params
+        pairs = self.tracker.pairs(params)
+        nozzles = self.tracker.nozzles.get(command.target, 1)
+        if len(pairs) < 2 or nozzles > 1:
+            return None
+        volume = params["volume"]
+        dispense = _phase(pipette, params["liquid_class"], "dispense")
+        multi_dispense = _phase(pipette, params["liquid_class"], "multi_dispense")
+        contact = _dispenses_into_liquid(dispense)
+
+        rewrite, note, groups = "", "", [pairs]
+        safe, failure = self._once_is_safe(pipette, pairs, volume, contact)
+        if safe:
+            rewrite = "once"
+        else:
+            note = failure
+            groups = self._groups(pairs)
+            checks = [self._once_is_safe(pipette, group, volume, contact) for group in groups]
+            if len(groups) < len(pairs) and all(safe for safe, _ in checks):
+                rewrite, note = "once per group", ""
+            elif dispense.get("mix", {}).get("enabled"):
+                note += "; the dispense mix rules out a distribute"
+            else:
+                multi_contact = _dispenses_into_liquid(multi_dispense)
+                checks = [self._distribute_is_safe(pipette, group, volume, multi_contact) for group in groups]
+                if len(groups) < len(pairs) and all(safe for safe, _ in checks):
+                    rewrite = "distribute per group"
+                    note = "" if multi_dispense else "needs a liquid class with multi_dispense properties"
+                elif len(groups) < len(pairs):
+                    note += "; " + next(failure for safe, failure in checks if not safe)
+
+        tips_before = len(pairs)
+        tips_after = len(groups) if rewrite else tips_before
+        return TipReuse(
+            command.step,
+            command.line,
+            command.target,
+            rewrite,
+            [[(_label(source), _label(dest)) for source, dest in group] for group in groups],
+            tips_before,
+            tips_after,
+            (tips_before - tips_after) * tip_cycle_seconds(pipette),
+            note,
+        )
+
+
+def analyze(protocol_path: str, non_blocking_modules: bool = False) -> List[TipReuse]:
+    context = record(protocol_path, non_blocking_modules=non_blocking_modules)
+    pipettes = {
+        repr(command.params["instrument"]): command.params["instrument"]
+        for command in context.commands
+        if command.name == "load_instrument"
+    }
+    return TipReuseAnalyzer(pipettes).run(context.commands)
+
+
+def rewrite_once(source_text: str, lines: List[int]) -> Tuple[str, List[int]]:
+    """Switch new_tip="always" to "once" in the calls made from `lines`.
+
+    Only literal keyword arguments are rewritten; lines whose call builds
+    new_tip some other way are returned so they can be edited by hand.
+    """
+    text_lines = source_text.split("\n")
+    skipped = []
+    calls = [node for node in ast.walk(ast.parse(source_text)) if isinstance(node, ast.Call)]
+    for line in lines:
+        enclosing = [call for call in calls if call.lineno <= line <= call.end_lineno]
+        keyword = None
+        for call in sorted(enclosing, key=lambda call: call.end_lineno - call.lineno):
+            keyword = next((kw for kw in call.keywords if kw.arg == "new_tip"), None)
+            if keyword is not None:
+                break
+        if keyword is None or not (isinstance(keyword.value, ast.Constant) and keyword.value.value == "always"):
+            skipped.append(line)
+            continue
+        value = keyword.value
+        row = text_lines[value.lineno - 1]
+        text_lines[value.lineno - 1] = row[:value.col_offset] + '"once"' + row[value.end_col_offset:]
+    return "\n".join(text_lines), skipped
+
+
+def print_report(findings: List[TipReuse]) -> None:
+    for finding in findings:
+        verdict = finding.rewrite or "keep always"
+        print(f"{finding.step:<12} line {finding.line:<5} {finding.pipette:<16} {verdict}")
+        if finding.rewrite and len(finding.groups) > 1:
+            for group in finding.groups:
+                print(f"{'':<14}tip: " + ", ".join(f"{source} -> {dest}" for source, dest in group))
+        if finding.note:
+            print(f"{'':<14}{finding.note}")
+    saved = sum(finding.tips_before - finding.tips_after for finding in findings)
+    seconds = sum(finding.seconds_saved for finding in findings)
+    print(f"\nTips saved: {saved}, about {seconds:.0f} s of pickups and chute trips")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("protocol", help="path to a protocol file defining run(protocol)")
+    parser.add_argument("--rewrite", metavar="OUT", help="write a copy with the whole-step \"once\" rewrites applied")
+    parser.add_argument(
+        "--non-blocking-modules",
+        action="store_true",
+        help="record at API 2.27, with start_execute_profile/wait_for_tasks available",
+    )
+    args = parser.parse_args(argv)
+    findings = analyze(args.protocol, non_blocking_modules=args.non_blocking_modules)
+    print_report(findings)
+    if args.rewrite:
+        with open(args.protocol, encoding="utf-8") as handle:
+            source_text = handle.read()
+        rewritten, skipped = rewrite_once(source_text, [f.line for f in findings if f.rewrite == "once"])
+        with open(args.rewrite, "w", encoding="utf-8") as handle:
+            handle.write(rewritten)
+        for line in skipped:
+            print(f"line {line}: new_tip is not a literal \"always\", edit by hand")
+
+
+if __name__ == "__main__":
+    main()
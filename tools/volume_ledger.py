@@ -0,0 +1,420 @@
+"""Track the volume of every well through a protocol and check it before a run.
+
+Each labware gets a rows x columns float32 volume matrix, and one component
+matrix per liquid, seeded from the protocol's load_liquid calls. Every
+liquid-class call is expanded into arrays of aspirates and dispenses and
+applied to those matrices in one vectorized update, so plates of 384 wells
+and runs of thousands of operations stay fast. A dispensed volume carries
+the liquid fractions of its source. The ledger reports:
+
+* overdraws: wells asked for more than they hold, which fails the check
+  with exit status 1 before the robot moves. The draw is cut to what the
+  well holds, so later wells are not credited liquid that never existed;
+* load volumes: the least each loaded well needs, plus a dead volume;
+* shallow aspiration: the liquid height at every aspirate, and the
+  submerge and retract travel saved by aspirating just under the surface
+  instead of at the liquid class's fixed height above the well bottom.
+
+Heights use a cone-frustum approximation of each well (WELL_SHAPES);
+labware without an entry is tracked by volume only. Needs NumPy.
+
+    python tools/volume_ledger.py Q5_PCR_Tm65Tm68__DpnI.py
+    python tools/volume_ledger.py Q5_PCR_Tm65Tm68__DpnI.py --dead-volume 5 --json
+"""
+import argparse
+import json
+import math
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from protocol_recorder import ROWS, RecordedCommand, RecordingInstrument, RecordingLabware, RecordingWell, record
+
+LIQUID_CLASS_CALLS = (
+    "transfer_with_liquid_class",
+    "distribute_with_liquid_class",
+    "consolidate_with_liquid_class",
+)
+
+# Keep the tip this far under the surface at the end of an aspirate.
+SUBMERGE_DEPTH_MM = 1.0
+
+
+class WellShape(NamedTuple):
+    depth: float
+    top_diameter: float
+    bottom_diameter: float
+
+
+# Depth and top diameter from the labware definitions; the conical bottom of
+# a PCR well is approximated by a narrower flat bottom.
+WELL_SHAPES = {
+    "opentrons_96_wellplate_200ul_pcr_full_skirt": WellShape(14.95, 5.5, 2.0),
+    "armadillo_96_wellplate_200ul_pcr_full_skirt": WellShape(14.95, 5.5, 2.0),
+}
+
+
+class Overdraw(NamedTuple):
+    step: str
+    line: int
+    labware: str
+    well: str
+    deficit: float
+
+
+class LoadVolume(NamedTuple):
+    labware: str
+    well: str
+    liquid: str
+    loaded: float
+    needed: float
+
+
+class ShallowAspiration(NamedTuple):
+    step: str
+    aspirates: int
+    mean_height_mm: float
+    travel_saved_mm: float
+    seconds_saved: float
+
+
+def labware_shape(labware: RecordingLabware) -> Tuple[int, int]:
+    return (16, 24) if "384" in labware.load_name else (len(ROWS), 12)
+
+
+def _height_table(shape: WellShape, points: int = 256) -> Tuple[np.ndarray, np.ndarray]:
+    """Volume (uL) against liquid height (mm) for a cone-frustum well."""
+    heights = np.linspace(0, shape.depth, points, dtype=np.float32)
+    bottom = shape.bottom_diameter / 2
+    radii = bottom + (shape.top_diameter / 2 - bottom) * heights / shape.depth
+    volumes = math.pi * heights / 3 * (bottom ** 2 + bottom * radii + radii ** 2)
+    return volumes.astype(np.float32), heights
+
+
+def _drawn_before(index: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    """For each draw, what earlier draws in the same batch took from its well."""
+    order = np.argsort(index, kind="stable")
+    running = np.cumsum(volumes[order])
+    starts = np.searchsorted(index[order], index[order])
+    before = np.empty_like(running)
+    before[order] = running - volumes[order] - np.concatenate(([0], running))[starts]
+    return before
+
+
+def _by_volume(points: List[Tuple[float, float]], volume: float) -> float:
+    xs, ys = zip(*sorted(points))
+    return float(np.interp(volume, xs, ys))
+
+
+class LabwareLedger:
+    """Volumes and per-liquid components of one labware, as flat float32 arrays."""
+
+    def __init__(self, labware: RecordingLabware, liquids: int) -> None:
+        self.name = labware.name
+        self.rows, self.columns = labware_shape(labware)
+        size = self.rows * self.columns
+        self.volume = np.zeros(size, dtype=np.float32)
+        self.components = np.zeros((liquids, size), dtype=np.float32)
+        self.loaded = np.zeros(size, dtype=np.float32)
+        self.low = np.zeros(size, dtype=np.float32)
+        self.shortfall = np.zeros(size, dtype=np.float32)
+        shape = WELL_SHAPES.get(labware.load_name)
+        self.heights = _height_table(shape) if shape is not None else None
+
+    def index(self, well_name: str) -> int:
+        return (ord(well_name[0]) - ord("A")) * self.columns + int(well_name[1:]) - 1
+
+    def well_name(self, index: int) -> str:
+        row, column = divmod(int(index), self.columns)
+        return f"{chr(ord('A') + row)}{column + 1}"
+
+    def height(self, volumes: np.ndarray) -> Optional[np.ndarray]:
+        if self.heights is None:
+            return None
+        return np.interp(volumes, *self.heights).astype(np.float32)
+
+    def fractions(self, index: np.ndarray) -> np.ndarray:
+        """Liquid fractions of the given wells, one column per well."""
+        volume = self.volume[index]
+        safe = np.where(volume > 0, volume, 1).astype(np.float32)
+        return np.where(volume > 0, self.components[:, index] / safe, 0).astype(np.float32)
+
+    def draw(self, index: np.ndarray, volumes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Remove volumes from wells in order, never below empty.
+
+        Returns the liquid fractions and the volumes actually taken; what a
+        well could not supply is added to its shortfall.
+        """
+        fractions = self.fractions(index)
+        available = np.maximum(self.volume[index] - _drawn_before(index, volumes), 0)
+        taken = np.minimum(volumes, available)
+        np.add.at(self.volume, index, -taken)
+        np.add.at(self.components, (slice(None), index), -fractions * taken)
+        np.add.at(self.shortfall, index, volumes - taken)
+        np.minimum(self.low, self.volume, out=self.low)
+        return fractions, taken
+
+    def add(self, index: np.ndarray, volumes: np.ndarray, fractions: np.ndarray) -> None:
+        np.add.at(self.volume, index, volumes)
+        np.add.at(self.components, (slice(None), index), fractions * volumes)
+
+
+class _Moves(NamedTuple):
+    """One liquid-class call as parallel arrays of per-well moves."""
+
+    sources: List[RecordingWell]
+    dests: List[Optional[RecordingWell]]
+    volumes: List[float]
+
+
+class VolumeLedger:
+    def __init__(
+        self,
+        commands: List[RecordedCommand],
+        pipettes: Dict[str, RecordingInstrument],
+        tolerance: float = 0.0,
+    ) -> None:
+        self.pipettes = pipettes
+        self.tolerance = tolerance
+        self.liquids: List[str] = []
+        for command in commands:
+            if command.name == "load_liquid" and command.params["liquid"].name not in self.liquids:
+                self.liquids.append(command.params["liquid"].name)
+        self.labware: Dict[int, LabwareLedger] = {}
+        self.nozzles: Dict[str, Tuple[int, bool]] = {}
+        self.loads: Dict[Tuple[int, int], str] = {}
+        self.overdraws: List[Overdraw] = []
+        self.shallow: Dict[str, List[float]] = {}
+
+    def ledger(self, labware: RecordingLabware) -> LabwareLedger:
+        key = id(labware)
+        if key not in self.labware:
+            self.labware[key] = LabwareLedger(labware, len(self.liquids))
+        return self.labware[key]
+
+    def covered(self, pipette: str, well: RecordingWell) -> List[RecordingWell]:
+        """Wells a pipette enters when its primary nozzle goes to `well`.
+
+        A pipette with no configure_nozzle_layout yet uses all its nozzles.
+        """
+        nozzles, from_bottom = self.nozzles.get(pipette, (self.pipettes[pipette].channels, False))
+        if nozzles == 1:
+            return [well]
+        row, column = well.grid_position
+        first = row - nozzles + 1 if from_bottom else row
+        return [well.parent[f"{ROWS[index]}{column + 1}"] for index in range(first, first + nozzles)]
+
+    def _phase(self, pipette: RecordingInstrument, liquid_class: Any, phase: str) -> Dict[str, Any]:
+        tip_uri = pipette.tip_racks[0].uri if pipette.tip_racks else None
+        return liquid_class.properties.get(pipette.name, {}).get(tip_uri, {}).get(phase, {})
+
+    def _moves(self, command: RecordedCommand) -> _Moves:
+        params = command.params
+        sources, dests, volume = params["source"], params["dest"], params["volume"]
+        if command.name == "distribute_with_liquid_class":
+            pipette = self.pipettes[command.target]
+            multi = self._phase(pipette, params["liquid_class"], "multi_dispense")
+            disposal = _by_volume(multi.get("disposal_by_volume", [(0, 0)]), volume)
+            aspirations = math.ceil(volume * len(dests) / max(pipette.max_volume - disposal, volume))
+            moves = _Moves(sources * len(dests), list(dests), [volume] * len(dests))
+            if disposal:
+                moves.sources.append(sources[0])
+                moves.dests.append(None)
+                moves.volumes.append(disposal * aspirations)
+            return moves
+        if len(sources) == 1:
+            sources = sources * len(dests)
+        elif len(dests) == 1:
+            dests = dests * len(sources)
+        return _Moves(list(sources), list(dests), [volume] * len(sources))
+
+    def _expand(self, pipette: str, moves: _Moves) -> _Moves:
+        expanded = _Moves([], [], [])
+        for source, dest, volume in zip(*moves):
+            source_wells = self.covered(pipette, source)
+            dest_wells = self.covered(pipette, dest) if dest is not None else [None] * len(source_wells)
+            expanded.sources.extend(source_wells)
+            expanded.dests.extend(dest_wells)
+            expanded.volumes.extend([volume] * len(source_wells))
+        return expanded
+
+    def _batches(self, moves: _Moves) -> List[_Moves]:
+        """Split moves wherever a well is read after being written in the same call."""
+        batches = [_Moves([], [], [])]
+        written = set()
+        for source, dest, volume in zip(*moves):
+            if repr(source) in written:
+                batches.append(_Moves([], [], []))
+                written = set()
+            batches[-1].sources.append(source)
+            batches[-1].dests.append(dest)
+            batches[-1].volumes.append(volume)
+            if dest is not None:
+                written.add(repr(dest))
+        return batches
+
+    def _by_labware(self, wells: List[Optional[RecordingWell]]) -> Dict[int, Tuple[LabwareLedger, np.ndarray, np.ndarray]]:
+        """Group well positions by labware: (ledger, position in batch, well index)."""
+        groups: Dict[int, Tuple[LabwareLedger, List[int], List[int]]] = {}
+        for position, well in enumerate(wells):
+            if well is None:
+                continue
+            ledger = self.ledger(well.parent)
+            groups.setdefault(id(ledger), (ledger, [], []))
+            groups[id(ledger)][1].append(position)
+            groups[id(ledger)][2].append(ledger.index(well.well_name))
+        return {
+            key: (ledger, np.array(positions), np.array(indices))
+            for key, (ledger, positions, indices) in groups.items()
+        }
+
+    def _record_shallow(self, command: RecordedCommand, ledger: LabwareLedger, index: np.ndarray, volumes: np.ndarray) -> None:
+        pipette = self.pipettes[command.target]
+        aspirate = self._phase(pipette, command.params["liquid_class"], "aspirate")
+        position = aspirate.get("aspirate_position", {})
+        if position.get("position_reference") != "well-bottom":
+            return
+        # Height left in each well once its own aspirate in this batch is done.
+        after = ledger.volume[index] - _drawn_before(index, volumes) - volumes
+        heights = ledger.height(np.maximum(after, 0))
+        if heights is None:
+            return
+        fixed = position.get("offset", {}).get("z", 0)
+        saved = np.maximum(heights - SUBMERGE_DEPTH_MM - fixed, 0)
+        submerge_speed = aspirate.get("submerge", {}).get("speed", 100)
+        retract_speed = aspirate.get("retract", {}).get("speed", 100)
+        entries = self.shallow.setdefault(command.step, [0, 0.0, 0.0, 0.0])
+        entries[0] += len(heights)
+        entries[1] += float(heights.sum())
+        entries[2] += float(saved.sum())
+        entries[3] += float((saved / submerge_speed + saved / retract_speed).sum())
+
+    def apply(self, command: RecordedCommand) -> None:
+        params = command.params
+        if command.name == "load_liquid":
+            ledger = self.ledger(params["labware"])
+            index = np.array([ledger.index(well) for well in params["wells"]])
+            liquid = self.liquids.index(params["liquid"].name)
+            ledger.volume[index] += params["volume"]
+            ledger.components[liquid, index] += params["volume"]
+            ledger.loaded[index] += params["volume"]
+            ledger.low[index] = ledger.volume[index]
+            for well in index:
+                self.loads[(id(params["labware"]), int(well))] = params["liquid"].name
+        elif command.name == "configure_nozzle_layout":
+            pipette = self.pipettes[command.target]
+            if params["style"] == "PARTIAL_COLUMN":
+                count = ROWS.index(params["start"][0]) - ROWS.index(params["end"][0]) + 1
+                self.nozzles[command.target] = (count, True)
+            else:
+                self.nozzles[command.target] = (pipette.channels, False)
+        elif command.name in LIQUID_CLASS_CALLS:
+            moves = self._expand(command.target, self._moves(command))
+            for batch in self._batches(moves):
+                self._apply_batch(command, batch)
+
+    def _apply_batch(self, command: RecordedCommand, batch: _Moves) -> None:
+        volumes = np.array(batch.volumes, dtype=np.float32)
+        fractions = np.zeros((len(self.liquids), len(volumes)), dtype=np.float32)
+        taken = volumes.copy()
+        for ledger, positions, index in self._by_labware(batch.sources).values():
+            self._record_shallow(command, ledger, index, volumes[positions])
+            fractions[:, positions], taken[positions] = ledger.draw(index, volumes[positions])
+            deficits = np.zeros(ledger.volume.size, dtype=np.float32)
+            np.add.at(deficits, index, volumes[positions] - taken[positions])
+            for well in np.flatnonzero(deficits > self.tolerance):
+                self.overdraws.append(Overdraw(
+                    command.step, command.line, ledger.name, ledger.well_name(well), round(float(deficits[well]), 2),
+                ))
+        for ledger, positions, index in self._by_labware(batch.dests).values():
+            ledger.add(index, taken[positions], fractions[:, positions])
+
+    def load_volumes(self, dead_volume: float) -> List[LoadVolume]:
+        results = []
+        for (key, index), liquid in self.loads.items():
+            ledger = self.labware[key]
+            results.append(LoadVolume(
+                ledger.name,
+                ledger.well_name(index),
+                liquid,
+                float(ledger.loaded[index]),
+                round(float(ledger.loaded[index] - ledger.low[index] + ledger.shortfall[index]) + dead_volume, 2),
+            ))
+        return results
+
+    def shallow_aspiration(self) -> List[ShallowAspiration]:
+        return [
+            ShallowAspiration(step, count, round(total / count, 2), round(saved, 1), round(seconds, 1))
+            for step, (count, total, saved, seconds) in self.shallow.items()
+        ]
+
+
+def check(protocol_path: str, tolerance: float = 0.0) -> VolumeLedger:
+    context = record(protocol_path)
+    pipettes = {
+        repr(command.params["instrument"]): command.params["instrument"]
+        for command in context.commands
+        if command.name == "load_instrument"
+    }
+    ledger = VolumeLedger(context.commands, pipettes, tolerance)
+    for command in context.commands:
+        ledger.apply(command)
+    return ledger
+
+
+def print_report(ledger: VolumeLedger, dead_volume: float) -> None:
+    if ledger.overdraws:
+        print("Overdrawn wells:")
+        for item in ledger.overdraws:
+            print(f"  {item.step:<12} line {item.line:<5} {item.labware}[{item.well}] short by {item.deficit:g} uL")
+    else:
+        print("No well is overdrawn.")
+
+    print(f"\nLoad volumes (with {dead_volume:g} uL dead volume):")
+    for item in ledger.load_volumes(dead_volume):
+        spare = item.loaded - item.needed
+        print(f"  {item.labware}[{item.well}]  {item.liquid:<28} loaded {item.loaded:6.1f}  "
+              f"needs {item.needed:6.1f}  spare {spare:6.1f} uL")
+
+    print(f"\nShallow aspiration ({SUBMERGE_DEPTH_MM:g} mm under the surface):")
+    total = 0.0
+    for item in ledger.shallow_aspiration():
+        total += item.seconds_saved
+        print(f"  {item.step:<12} {item.aspirates:4d} aspirates  mean height {item.mean_height_mm:5.2f} mm  "
+              f"saves {item.travel_saved_mm:6.1f} mm / {item.seconds_saved:5.1f} s")
+    print(f"  Submerge and retract time saved: {total:.0f} s")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("protocol", help="path to a protocol file defining run(protocol)")
+    parser.add_argument("--json", action="store_true", help="print overdraws, load volumes and heights as JSON")
+    parser.add_argument(
+        "--dead-volume",
+        type=float,
+        default=0.0,
+        help="uL each loaded well must keep beyond what the run draws (default: 0)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="accept draws this many uL beyond a well's contents, e.g. deliberate sweeps (default: 0)",
+    )
+    args = parser.parse_args(argv)
+    ledger = check(args.protocol, args.tolerance)
+    if args.json:
+        print(json.dumps({
+            "overdraws": [item._asdict() for item in ledger.overdraws],
+            "load_volumes": [item._asdict() for item in ledger.load_volumes(args.dead_volume)],
+            "shallow_aspiration": [item._asdict() for item in ledger.shallow_aspiration()],
+        }, indent=2))
+    else:
+        print_report(ledger, args.dead_volume)
+    if ledger.overdraws:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()